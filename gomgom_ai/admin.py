@@ -1,8 +1,15 @@
 from django.contrib import admin
-from .models import Recommendation
+from .models import Recommendation, RestaurantSnapshot
 
 @admin.register(Recommendation)
 class RecommendationAdmin(admin.ModelAdmin):
     list_display = ('id', 'input_text', 'recommended_store', 'created_at')
     search_fields = ('input_text', 'recommended_store')
     list_filter = ('created_at',)
+
+
+@admin.register(RestaurantSnapshot)
+class RestaurantSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('tile', 'restaurant_count', 'fetched_at')
+    search_fields = ('tile',)
+    list_filter = ('fetched_at',)
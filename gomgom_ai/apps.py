@@ -1,6 +1,16 @@
+import os
+
 from django.apps import AppConfig
 
 
 class TasteConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'gomgom_ai'
+
+    def ready(self):
+        # 웹 워커(asgi.py / wsgi.py)에서만 형태소 분석기를 미리 데움
+        # manage.py 명령(migrate, shell 등)에서는 JVM을 띄우지 않음
+        if os.environ.get("TOKENIZER_WARM_UP") == "1":
+            from .tokenizer import start_warm_up
+
+            start_warm_up()
@@ -13,5 +13,6 @@ from django.core.asgi import get_asgi_application
 
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'gomgom_ai.settings')
+os.environ.setdefault('TOKENIZER_WARM_UP', '1')  # 웹 워커는 시작하면서 형태소 분석기를 데움 (apps.TasteConfig.ready)
 django.setup()
 application = get_asgi_application()
\ No newline at end of file
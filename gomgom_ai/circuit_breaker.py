@@ -0,0 +1,97 @@
+# circuit_breaker.py
+# 외부 API가 연속으로 실패하면 한동안(open) 호출 자체를 막아서
+# 느린 업스트림이 워커 스레드를 붙잡지 않도록 하는 서킷 브레이커.
+# closed → (연속 실패 FAILURE_THRESHOLD번) → open → (RECOVERY_TIMEOUT 후) half_open → 시험 호출 성공 시 closed
+import threading
+import time
+
+from django.conf import settings
+
+DEFAULT_CIRCUIT_BREAKER_SETTINGS = {
+    "FAILURE_THRESHOLD": 5,    # 연속 실패 몇 번이면 open
+    "RECOVERY_TIMEOUT": 30.0,  # open 후 몇 초 뒤에 시험 호출을 허용할지
+}
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold, recovery_timeout):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._total_failures = 0
+        self._total_rejected = 0
+
+    def allow_request(self):
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self._state = HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True  # half_open에서는 시험 호출 하나만 보냄
+                return True
+            self._total_rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._total_failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._state == OPEN and time.monotonic() - self._opened_at < self.recovery_timeout
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "total_failures": self._total_failures,
+                "total_rejected": self._total_rejected,
+                "open_for": round(time.monotonic() - self._opened_at, 1) if self._opened_at else None,
+            }
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name):
+    """이름별로 프로세스에 하나씩 있는 브레이커 (설정은 CIRCUIT_BREAKERS[name]으로 덮어씀)"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            conf = {**DEFAULT_CIRCUIT_BREAKER_SETTINGS, **getattr(settings, "CIRCUIT_BREAKERS", {}).get(name, {})}
+            breaker = _breakers[name] = CircuitBreaker(name, conf["FAILURE_THRESHOLD"], conf["RECOVERY_TIMEOUT"])
+        return breaker
+
+
+def breaker_states():
+    """모니터링용: 이 프로세스의 모든 브레이커 상태"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.snapshot() for b in breakers}
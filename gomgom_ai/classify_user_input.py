@@ -1,13 +1,37 @@
 
 # classify_user_input.py
-from openai import OpenAI
 import json
-import os
-from django.conf import settings  # 환경 변수 가져오기
+from .http_client import get_openai_client
+from .intent_classifier import (
+    SOURCE_GPT,
+    SOURCE_LOCAL,
+    confidence_threshold,
+    get_intent_classifier_settings,
+    get_model,
+    predict,
+)
+
+
+def classify_locally(user_text):
+    """로컬 분류기(규칙 + 나이브 베이즈) 결과 (유형, GPT에 물어봐야 하는지). 몇십 µs라 요청 스레드에서 바로 불러도 됨"""
+    model = get_model()
+    label, confidence = predict(user_text, model=model or False)
+    return label, confidence < confidence_threshold(model) and get_intent_classifier_settings()["GPT_FALLBACK"]
+
+
+def classify_user_input_with_source(user_text):
+    """(유형, 출처 "local" / "gpt"). 로컬 분류기가 확실하면 바로, 애매할 때만 GPT한테 물어보기"""
+    label, needs_gpt = classify_locally(user_text)
+    if not needs_gpt:
+        return label, SOURCE_LOCAL
+    return classify_user_input_with_gpt(user_text), SOURCE_GPT
 
-client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY") or settings.OPENAI_API_KEY)
 
 def classify_user_input(user_text):
+    return classify_user_input_with_source(user_text)[0]
+
+
+def classify_user_input_with_gpt(user_text):
     # GPT한테 물어보기
     classification_prompt = f"""
     사용자가 "{user_text}"라고 입력했어요. 이건 어떤 종류에 해당하나요?
@@ -21,7 +45,7 @@ def classify_user_input(user_text):
     딱 하나의 분류만 고르고 결과는 JSON으로 주세요:
     {{ "category": "기분" }}
     """
-    response = client.chat.completions.create(
+    response = get_openai_client().chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[{"role": "user", "content": classification_prompt}]
     )
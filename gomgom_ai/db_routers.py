@@ -0,0 +1,23 @@
+# db_routers.py
+# RestaurantSnapshot만 RESTAURANT_SNAPSHOT["DATABASE"]로 보내는 라우터 (기본값은 default)
+from django.conf import settings
+
+
+def _snapshot_db():
+    return getattr(settings, "RESTAURANT_SNAPSHOT", {}).get("DATABASE", "default")
+
+
+class SnapshotRouter:
+    def _is_snapshot(self, model):
+        return model._meta.app_label == "gomgom_ai" and model._meta.model_name == "restaurantsnapshot"
+
+    def db_for_read(self, model, **hints):
+        return _snapshot_db() if self._is_snapshot(model) else None
+
+    def db_for_write(self, model, **hints):
+        return _snapshot_db() if self._is_snapshot(model) else None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if app_label == "gomgom_ai" and model_name == "restaurantsnapshot":
+            return db == _snapshot_db()
+        return None
@@ -0,0 +1,66 @@
+# deadline.py
+# 요청마다 남은 시간 예산(deadline)을 contextvar로 들고 다니면서
+# 외부 호출 타임아웃을 "설정값"과 "요청의 남은 시간" 중 작은 값으로 맞춘다.
+# ThreadPoolExecutor로 넘길 때는 contextvars.copy_context().run 으로 감싸야 전달됨.
+import contextvars
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+DEFAULT_REQUEST_DEADLINE = 10.0  # 초
+
+_deadline = contextvars.ContextVar("request_deadline", default=None)
+
+
+def start(budget=None):
+    """지금부터 budget초 뒤를 현재 컨텍스트의 deadline으로 설정. reset용 토큰 반환"""
+    if budget is None:
+        budget = getattr(settings, "REQUEST_DEADLINE", DEFAULT_REQUEST_DEADLINE)
+    return _deadline.set(time.monotonic() + budget)
+
+
+def reset(token):
+    _deadline.reset(token)
+
+
+def remaining():
+    """남은 시간(초). deadline이 없으면(백그라운드 작업 등) None"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def timeout_for(default):
+    """외부 호출에 쓸 타임아웃: 기본값과 남은 시간 중 작은 값"""
+    left = remaining()
+    return default if left is None else min(default, left)
+
+
+class DeadlineMiddleware:
+    """요청이 들어올 때 REQUEST_DEADLINE 만큼의 deadline을 건다 (sync / async 뷰 모두)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = start()
+        try:
+            return self.get_response(request)
+        finally:
+            reset(token)
+
+    async def __acall__(self, request):
+        token = start()
+        try:
+            return await self.get_response(request)
+        finally:
+            reset(token)
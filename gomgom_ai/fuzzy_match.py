@@ -0,0 +1,85 @@
+# fuzzy_match.py
+# 가게 이름 퍼지 매칭: 후보 전체를 글자 n-gram 개수 벡터의 코사인 유사도로 한 번에(NumPy) 점수 매기고,
+# 상위 몇 개만 한글 자모 단위 편집 거리로 다시 비교한다.
+# "엽기떡볶이" ↔ "엽기 떡볶이 (봉천점)"처럼 포함 관계가 깨지는 표기 차이, "떡복이" 같은 오타도 잡기 위함.
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+NGRAM_SIZES = (1, 2, 3)
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+
+def ngram_counts(text):
+    return Counter(text[i:i + n] for n in NGRAM_SIZES for i in range(len(text) - n + 1))
+
+
+@lru_cache(maxsize=20000)
+def to_jamo(text):
+    """한글 음절을 초성/중성/종성으로 풀어쓴 문자열 ('떡' → 'ㄸㅓㄱ' 에 해당하는 조합용 자모)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            code -= _HANGUL_BASE
+            out.append(chr(0x1100 + code // 588))
+            out.append(chr(0x1161 + code % 588 // 28))
+            if code % 28:
+                out.append(chr(0x11A7 + code % 28))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def edit_distance(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def jamo_similarity(a, b):
+    """0~1, 자모 단위 편집 거리 기반 ('떡복이' ↔ '떡볶이'는 자모 하나 차이)"""
+    ja, jb = to_jamo(a), to_jamo(b)
+    if not ja and not jb:
+        return 1.0
+    return 1 - edit_distance(ja, jb) / max(len(ja), len(jb))
+
+
+class NgramMatrix:
+    """이름 리스트의 n-gram 개수 벡터를 희소 형태(행 번호 / n-gram 번호 / 개수 배열)로 들고 코사인 유사도를 한 번에 계산"""
+
+    def __init__(self, names):
+        self.size = len(names)
+        self.vocab = {}
+        rows, cols, counts = [], [], []
+        for row, name in enumerate(names):
+            for gram, count in ngram_counts(name).items():
+                rows.append(row)
+                cols.append(self.vocab.setdefault(gram, len(self.vocab)))
+                counts.append(count)
+        self.rows = np.asarray(rows, dtype=np.int32)
+        self.cols = np.asarray(cols, dtype=np.int32)
+        self.counts = np.asarray(counts, dtype=np.float32)
+        norms = np.sqrt(np.bincount(self.rows, weights=self.counts ** 2, minlength=self.size))
+        self.norms = np.where(norms > 0, norms, 1.0)
+
+    def cosine(self, text):
+        """names 전체에 대한 코사인 유사도 배열"""
+        query = np.zeros(len(self.vocab) + 1, dtype=np.float32)  # 마지막 칸: vocab에 없는 n-gram
+        query_norm = 0.0
+        for gram, count in ngram_counts(text).items():
+            query[self.vocab.get(gram, -1)] += count
+            query_norm += count * count
+        if not query_norm or not self.size:
+            return np.zeros(self.size, dtype=np.float32)
+        dots = np.bincount(self.rows, weights=self.counts * query[self.cols], minlength=self.size)
+        return dots / (self.norms * np.sqrt(query_norm))
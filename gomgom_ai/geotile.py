@@ -0,0 +1,61 @@
+# geotile.py
+# 위경도를 geohash 타일로 양자화한다.
+# 같은 배달 구역(타일)에 있는 사용자들이 캐시 항목 하나를 함께 쓰도록 하기 위함.
+# 캐시 키를 만드는 용도일 뿐 공간 인덱스는 아니다: 타일 경계 양쪽의 가까운 두 점도 접두어가 완전히 다를 수 있다.
+# 주변 타일이 필요하면 bounds()로 위경도 범위를 잡아서 찾는다 (snapshot_store.find_snapshot).
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {c: i for i, c in enumerate(_BASE32)}
+
+
+def encode(lat, lng, precision=6):
+    """위경도 → geohash 문자열 (precision 6 ≈ 1.2km x 0.6km)"""
+    lat, lng = float(lat), float(lng)
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0):
+        raise ValueError(f"잘못된 좌표: {lat}, {lng}")
+
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # geohash는 경도 비트부터 번갈아 쌓는다
+    while len(chars) < precision:
+        rng, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def bounds(tile):
+    """geohash → (min_lat, min_lng, max_lat, max_lng)"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+    for c in tile:
+        value = _DECODE[c]
+        for shift in range(4, -1, -1):
+            rng = lng_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if (value >> shift) & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return lat_range[0], lng_range[0], lat_range[1], lng_range[1]
+
+
+def center(tile):
+    """타일 중심 좌표 (lat, lng) - 타일 단위 요기요 요청에 쓰는 대표 좌표"""
+    min_lat, min_lng, max_lat, max_lng = bounds(tile)
+    return round((min_lat + max_lat) / 2, 6), round((min_lng + max_lng) / 2, 6)
@@ -0,0 +1,87 @@
+# gpt_cache.py
+# 추천 GPT 호출(test_result_view / recommend_result) 응답 캐시.
+# 예전에는 후보 가게 10개를 random.shuffle로 골라서 프롬프트가 매번 달라 캐시가 불가능했다.
+# 이제 후보는 (정규화한 입력, 점수, 입력 유형, 타일, 가게 리스트 버전)으로 시드를 잡아 결정적으로 고르고
+# 이름순으로 정렬해서 같은 상황이면 항상 같은 프롬프트(canonical prompt)가 나온다.
+# 응답은 그 프롬프트의 해시로 Redis에 저장하고, 가게 리스트가 캐시에서 사라질 때(HARD_TIMEOUT) 같이 만료된다.
+import hashlib
+import json
+import random
+import time
+import unicodedata
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .restaurant_cache import get_restaurant_cache_settings
+
+DEFAULT_GPT_CACHE_SETTINGS = {
+    "ENABLED": True,
+    "CANDIDATES": 10,     # 프롬프트에 넣을 후보 가게 수
+    "MIN_TTL": 60,        # 리스트가 곧 만료돼도 최소 이만큼은 캐시
+    "KEY_PREFIX": "gpt:v1",
+}
+
+
+def get_gpt_cache_settings():
+    return {**DEFAULT_GPT_CACHE_SETTINGS, **getattr(settings, "GPT_CACHE", {})}
+
+
+def normalize_user_text(text):
+    # "매운  음식 " / "매운 음식"이 같은 프롬프트가 되도록
+    return " ".join(unicodedata.normalize("NFC", text or "").split()).lower()
+
+
+def _digest(value):
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+
+def listing_version(listing):
+    # 같은 타일이라도 가게 리스트를 새로 가져오면 버전이 바뀜
+    return f"{listing.tile}:{int(listing.fetched_at or 0)}"
+
+
+def select_candidates(listing, text, score=None, input_type=None):
+    """프롬프트에 넣을 후보 가게들. 같은 입력 + 같은 리스트 버전이면 항상 같은 후보 (이름순)"""
+    restaurants = listing.restaurants
+    count = get_gpt_cache_settings()["CANDIDATES"]
+    if len(restaurants) > count:
+        seed = json.dumps(
+            [normalize_user_text(text), sorted((score or {}).items()), input_type, listing_version(listing)],
+            ensure_ascii=False,
+        )
+        restaurants = random.Random(_digest(seed)).sample(restaurants, count)
+    return sorted(restaurants, key=lambda r: (r.clean_name or r.name, r.id or 0))
+
+
+def _ttl(listing):
+    conf = get_gpt_cache_settings()
+    if not listing.fetched_at:
+        return conf["MIN_TTL"]
+    expires_at = listing.fetched_at + get_restaurant_cache_settings()["HARD_TIMEOUT"]
+    return max(conf["MIN_TTL"], int(expires_at - time.time()))
+
+
+def cached_completion(prompt, listing, call):
+    """prompt에 대한 GPT 응답 본문(JSON 문자열). 캐시에 없으면 call()로 받아서 JSON일 때만 저장한다."""
+    conf = get_gpt_cache_settings()
+    if not conf["ENABLED"]:
+        return call()
+    key = f"{conf['KEY_PREFIX']}:{listing_version(listing)}:{_digest(prompt)}"
+    try:
+        content = cache.get(key)
+    except Exception:
+        content = None  # Redis 장애여도 GPT 호출은 계속
+    if content is not None:
+        return content
+
+    content = call()
+    try:
+        json.loads(content)
+    except (TypeError, ValueError):
+        return content  # 형식이 깨진 응답은 캐시하지 않음 (다음 요청은 다시 호출)
+    try:
+        cache.set(key, content, timeout=_ttl(listing))
+    except Exception:
+        pass
+    return content
@@ -0,0 +1,160 @@
+# http_client.py
+# 요기요 / 카카오 / ipinfo / OpenAI 등 외부 호출에 쓰는 프로세스 공용 HTTP 클라이언트
+# 매 요청마다 DNS + TCP + TLS 연결을 새로 맺지 않도록 keep-alive 커넥션 풀을 재사용한다.
+import asyncio
+import importlib.util
+import os
+import threading
+import weakref
+
+import httpx
+from django.conf import settings
+from openai import OpenAI
+
+from .replay_transport import wrap_transport
+
+DEFAULT_HTTP_CLIENT_SETTINGS = {
+    "CONNECT_TIMEOUT": 3.0,
+    "READ_TIMEOUT": 5.0,
+    "WRITE_TIMEOUT": 5.0,
+    "POOL_TIMEOUT": 2.0,
+    "MAX_CONNECTIONS_PER_HOST": 20,    # 호스트(요기요, 카카오 ...)별 커넥션 상한
+    "MAX_KEEPALIVE_CONNECTIONS": 20,
+    "KEEPALIVE_EXPIRY": 30.0,
+    "HTTP2": True,                     # h2 패키지가 설치돼 있을 때만 실제로 켜짐
+}
+
+_sync_client = None
+_sync_lock = threading.Lock()
+_openai_client = None
+# 비동기 클라이언트는 이벤트 루프에 묶이므로 루프마다 하나씩 둔다
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_http_client_settings():
+    return {**DEFAULT_HTTP_CLIENT_SETTINGS, **getattr(settings, "HTTP_CLIENT", {})}
+
+
+def _http2_enabled(conf):
+    # httpx는 h2가 없으면 http2=True에서 ImportError를 내므로 미리 확인
+    return conf["HTTP2"] and importlib.util.find_spec("h2") is not None
+
+
+def _timeout(conf):
+    return httpx.Timeout(
+        connect=conf["CONNECT_TIMEOUT"],
+        read=conf["READ_TIMEOUT"],
+        write=conf["WRITE_TIMEOUT"],
+        pool=conf["POOL_TIMEOUT"],
+    )
+
+
+def _transport_kwargs(conf):
+    # 호스트별 상한은 트랜스포트의 커넥션 풀에서 걸어준다
+    return {
+        "http2": _http2_enabled(conf),
+        "limits": httpx.Limits(
+            max_connections=conf["MAX_CONNECTIONS_PER_HOST"],
+            max_keepalive_connections=conf["MAX_KEEPALIVE_CONNECTIONS"],
+            keepalive_expiry=conf["KEEPALIVE_EXPIRY"],
+        ),
+    }
+
+
+class _PerHostTransport(httpx.BaseTransport):
+    """호스트마다 별도 커넥션 풀을 두고, 풀 하나의 크기로 호스트별 커넥션 수를 제한한다."""
+
+    def __init__(self, conf):
+        self._conf = conf
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def _pool_for(self, request):
+        key = (request.url.scheme, request.url.host, request.url.port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = httpx.HTTPTransport(**_transport_kwargs(self._conf))
+                self._pools[key] = pool
+            return pool
+
+    def handle_request(self, request):
+        return self._pool_for(request).handle_request(request)
+
+    def close(self):
+        with self._lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+
+
+class _AsyncPerHostTransport(httpx.AsyncBaseTransport):
+    def __init__(self, conf):
+        self._conf = conf
+        self._pools = {}
+
+    def _pool_for(self, request):
+        key = (request.url.scheme, request.url.host, request.url.port)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = httpx.AsyncHTTPTransport(**_transport_kwargs(self._conf))
+            self._pools[key] = pool
+        return pool
+
+    async def handle_async_request(self, request):
+        return await self._pool_for(request).handle_async_request(request)
+
+    async def aclose(self):
+        for pool in self._pools.values():
+            await pool.aclose()
+        self._pools.clear()
+
+
+def get_sync_client():
+    """동기 뷰/스레드에서 쓰는 공용 httpx.Client (스레드 안전)"""
+    global _sync_client
+    if _sync_client is None:
+        with _sync_lock:
+            if _sync_client is None:
+                conf = get_http_client_settings()
+                _sync_client = httpx.Client(
+                    transport=wrap_transport(_PerHostTransport(conf)),
+                    timeout=_timeout(conf),
+                    follow_redirects=True,
+                )
+    return _sync_client
+
+
+def get_openai_client():
+    """공용 httpx.Client를 쓰는 OpenAI 클라이언트. 처음 부를 때 만들어서 import 시점에는 OPENAI_API_KEY가 없어도 됨"""
+    global _openai_client
+    if _openai_client is None:
+        http_client = get_sync_client()
+        with _sync_lock:
+            if _openai_client is None:
+                _openai_client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"), http_client=http_client)
+    return _openai_client
+
+
+def get_async_client():
+    """현재 이벤트 루프 전용 공용 httpx.AsyncClient"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        conf = get_http_client_settings()
+        client = httpx.AsyncClient(
+            transport=wrap_transport(_AsyncPerHostTransport(conf)),
+            timeout=_timeout(conf),
+            follow_redirects=True,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+def close_clients():
+    global _sync_client, _openai_client
+    with _sync_lock:
+        _openai_client = None
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
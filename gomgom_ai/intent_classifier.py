@@ -0,0 +1,266 @@
+# intent_classifier.py
+# 사용자 입력 유형(기분 / 상황 / 기능 / 음식)을 GPT 없이 로컬에서 분류.
+# - 키워드 규칙: 유형별 단서 단어(Aho–Corasick으로 한 번에 찾음)
+# - 나이브 베이즈: 지난 Recommendation 기록(input_text → selected_types["input_category"])의
+#   글자 1~3-gram으로 학습. input_category_source가 "gpt"인 기록만 씀 (로컬 / 재사용 라벨로 학습하면 자기 예측을 외움)
+#   source가 생기기 전 기록은 전부 GPT가 분류한 것이라 같이 씀
+#   (manage.py train_intent_classifier → INTENT_CLASSIFIER["MODEL_FILE"])
+# 두 점수를 합친 확률이 문턱값보다 낮을 때만 classify_user_input이 GPT에 물어본다.
+# 나이브 베이즈 확률은 실제보다 과하게 확신하는 편이라, 문턱값은 학습 때 떼어둔 기록으로
+# TARGET_PRECISION을 맞추도록 정해 모델 파일에 같이 저장한다 (calibrate_threshold). 없으면 THRESHOLD.
+# 평가는 manage.py evaluate_intent_classifier.
+import json
+import math
+import random
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import Q
+
+from .data import all_dishes
+from .keyword_matcher import compile_matcher
+from .noun_trie import BASE_NOUNS, YOGIYO_CATEGORIES
+
+LABELS = ("기분", "상황", "기능", "음식")
+DEFAULT_LABEL = "음식"
+
+# Recommendation.selected_types["input_category_source"]: 유형을 누가 정했는지
+SOURCE_LOCAL = "local"
+SOURCE_GPT = "gpt"
+SOURCE_REUSED = "reused"  # semantic_cache에서 재사용
+
+MIN_CUE_LENGTH = 2       # 한 글자 단서("면", "밥")는 다른 단어 안에서도 걸려서 안 씀
+RULE_ONLY_MIN_CUES = 2   # 모델이 없을 때 확신하려면 같은 유형 단서가 이만큼 + 다른 유형 단서는 없어야 함
+RULE_ONLY_UNSURE = 0.5   # 그렇지 않으면 확신도에 곱하는 값 (THRESHOLD 아래로 → GPT에 물어봄)
+
+DEFAULT_INTENT_CLASSIFIER_SETTINGS = {
+    "MODEL_FILE": None,   # 나이브 베이즈 모델(JSON). 없으면 규칙만 씀
+    "THRESHOLD": 0.7,     # 이 확신도 미만이면 GPT로 분류 (모델 파일에 보정된 문턱값이 없을 때)
+    "TARGET_PRECISION": 0.9,  # train_intent_classifier가 문턱값을 정할 때 로컬 확정분이 맞춰야 할 정확도
+    "RULE_WEIGHT": 2.0,   # 규칙 단서 하나당 더하는 로그 점수
+    "GPT_FALLBACK": True,
+}
+
+CUE_WORDS = {
+    "기분": (
+        "기분", "우울", "슬퍼", "슬프", "행복", "신나", "짜증", "화나", "스트레스", "졸려", "졸리", "피곤", "심심",
+        "외로", "설레", "불안", "힘들", "지쳐", "멘붕", "꿀꿀", "울적", "귀찮",
+    ),
+    "상황": (
+        "친구", "혼자", "혼밥", "데이트", "가족", "회식", "모임", "파티", "야식", "시험", "비오", "비 오",
+        "추운 날", "더운 날", "날씨", "주말", "점심", "저녁", "아침", "새벽", "손님", "생일", "같이", "여럿",
+    ),
+    "기능": (
+        "비타민", "피로", "회복", "다이어트", "해장", "건강", "단백질", "감기", "소화", "속 편", "속편", "든든",
+        "저칼로리", "칼로리", "영양", "보양", "면역", "숙취", "에너지", "몸보신", "가벼운",
+    ),
+    "음식": (
+        "매운", "달달", "달콤", "짭짤", "고기", "국물", "튀김", "분식", "양식", "중식", "한식", "일식",
+        *(dish["name"] for dish in all_dishes), *YOGIYO_CATEGORIES, *BASE_NOUNS,
+    ),
+}
+
+
+def get_intent_classifier_settings():
+    return {**DEFAULT_INTENT_CLASSIFIER_SETTINGS, **getattr(settings, "INTENT_CLASSIFIER", {})}
+
+
+def normalize_text(text):
+    return unicodedata.normalize("NFC", text or "").lower().strip()
+
+
+def features(text):
+    text = "".join(normalize_text(text).split())
+    return [text[i:i + n] for n in (1, 2, 3) for i in range(len(text) - n + 1)]
+
+
+@lru_cache(maxsize=1)
+def _cue_matchers():
+    return {
+        label: compile_matcher(w for w in words if len(w) >= MIN_CUE_LENGTH) for label, words in CUE_WORDS.items()
+    }
+
+
+def rule_hits(text):
+    """{유형: 단서 단어 수}"""
+    text = normalize_text(text)
+    return {label: len(matcher.find(text)) for label, matcher in _cue_matchers().items()}
+
+
+class NaiveBayesModel:
+    """글자 n-gram 다항 나이브 베이즈 (라플라스 스무딩)"""
+
+    def __init__(self, counts, totals, docs, alpha=1.0, threshold=None):
+        self.counts = counts    # 유형 → {n-gram: 개수}
+        self.totals = totals    # 유형 → n-gram 총 개수
+        self.docs = docs        # 유형 → 학습 문장 수
+        self.alpha = alpha
+        self.threshold = threshold  # 떼어둔 기록으로 보정한 문턱값 (None이면 설정의 THRESHOLD)
+        self.vocab_size = len({gram for grams in counts.values() for gram in grams}) or 1
+        n_docs = sum(docs.values())
+        self.log_priors = {
+            label: math.log((docs.get(label, 0) + alpha) / (n_docs + alpha * len(LABELS))) for label in LABELS
+        }
+
+    @classmethod
+    def train(cls, examples, alpha=1.0):
+        counts = {label: Counter() for label in LABELS}
+        docs = Counter()
+        for text, label in examples:
+            if label not in counts:
+                continue
+            counts[label].update(features(text))
+            docs[label] += 1
+        return cls(
+            {label: dict(c) for label, c in counts.items()},
+            {label: sum(c.values()) for label, c in counts.items()},
+            dict(docs),
+            alpha,
+        )
+
+    def log_scores(self, text):
+        grams = features(text)
+        scores = {}
+        for label in LABELS:
+            counts = self.counts.get(label, {})
+            denominator = math.log(self.totals.get(label, 0) + self.alpha * self.vocab_size)
+            scores[label] = self.log_priors[label] + sum(
+                math.log(counts.get(gram, 0) + self.alpha) - denominator for gram in grams
+            )
+        return scores
+
+    def to_json(self):
+        return {
+            "alpha": self.alpha,
+            "threshold": self.threshold,
+            "counts": self.counts,
+            "totals": self.totals,
+            "docs": self.docs,
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data["counts"], data["totals"], data["docs"], data.get("alpha", 1.0), data.get("threshold"))
+
+    def save(self, path):
+        Path(path).write_text(json.dumps(self.to_json(), ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_json(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+_model = None
+_model_loaded = False
+_model_lock = threading.Lock()
+
+
+def get_model():
+    """MODEL_FILE의 모델 (없거나 못 읽으면 None → 규칙만 사용)"""
+    global _model, _model_loaded
+    if not _model_loaded:
+        with _model_lock:
+            if not _model_loaded:
+                path = get_intent_classifier_settings()["MODEL_FILE"]
+                if path and Path(path).exists():
+                    try:
+                        _model = NaiveBayesModel.load(path)
+                    except (OSError, ValueError, KeyError):
+                        _model = None
+                _model_loaded = True
+    return _model
+
+
+def predict(text, model=None, rule_weight=None):
+    """(유형, 확신도 0~1). 단서도 모델도 없으면 (DEFAULT_LABEL, 0.0). model=False면 규칙만 사용
+
+    규칙만 쓸 때는 같은 유형 단서가 RULE_ONLY_MIN_CUES개 이상이고 다른 유형 단서가 없을 때만 확신한다.
+    """
+    if rule_weight is None:
+        rule_weight = get_intent_classifier_settings()["RULE_WEIGHT"]
+    if model is None:
+        model = get_model()
+    hits = rule_hits(text)
+    if not model:
+        total = sum(hits.values())
+        if not total:
+            return DEFAULT_LABEL, 0.0
+        label = max(LABELS, key=lambda l: (hits[l], l == DEFAULT_LABEL))
+        confidence = hits[label] / total
+        if hits[label] < RULE_ONLY_MIN_CUES or hits[label] < total:
+            confidence *= RULE_ONLY_UNSURE
+        return label, confidence
+
+    scores = model.log_scores(text)
+    for label in LABELS:
+        scores[label] += rule_weight * hits[label]
+    best = max(scores.values())
+    weights = {label: math.exp(score - best) for label, score in scores.items()}
+    label = max(LABELS, key=weights.get)
+    return label, weights[label] / sum(weights.values())
+
+
+def confidence_threshold(model=None):
+    """classify_locally가 쓰는 문턱값 - 모델에 보정된 값이 있으면 그것, 아니면 설정의 THRESHOLD"""
+    if model and model.threshold is not None:
+        return model.threshold
+    return get_intent_classifier_settings()["THRESHOLD"]
+
+
+def calibrate_threshold(model, examples, target_precision, rule_weight=None, min_support=20):
+    """떼어둔 (문장, 유형)에서 확신도 ≥ t인 예측의 정확도가 target_precision 이상이 되는 가장 낮은 t
+
+    로컬로 확정되는 문장이 min_support개보다 적으면 믿을 수 없어서 고르지 않음. 맞는 t가 없으면 None.
+    """
+    predictions = sorted(
+        ((predict(text, model=model, rule_weight=rule_weight), expected) for text, expected in examples),
+        key=lambda item: -item[0][1],
+    )
+    threshold = None
+    covered = correct = 0
+    for i, ((label, confidence), expected) in enumerate(predictions):
+        covered += 1
+        correct += label == expected
+        # 확신도가 같은 문장은 한꺼번에 넘거나 못 넘으니 묶음 끝에서만 판단
+        if i + 1 < len(predictions) and predictions[i + 1][0][1] == confidence:
+            continue
+        if covered >= min_support and correct / covered >= target_precision:
+            threshold = confidence
+    return threshold
+
+
+# input_category_source가 생기기 전 기록(키 자체가 없음)은 모두 GPT가 분류한 것
+GPT_LABELLED = Q(selected_types__input_category_source=SOURCE_GPT) | (
+    Q(selected_types__has_key="input_category") & ~Q(selected_types__has_key="input_category_source")
+)
+
+
+def labelled_examples():
+    """학습 / 평가용 (input_text, GPT가 붙인 유형) - recommend_result가 남긴 기록 중 GPT가 분류한 것만"""
+    from .models import Recommendation
+
+    rows = Recommendation.objects.filter(GPT_LABELLED).values_list("input_text", "selected_types")
+    return [
+        (text, types["input_category"])
+        for text, types in rows.iterator()
+        if text and types.get("input_category") in LABELS
+    ]
+
+
+def split_examples(examples, test_ratio, seed=0):
+    # 유형별 비율을 유지해서 나눔
+    by_label = defaultdict(list)
+    for example in examples:
+        by_label[example[1]].append(example)
+    rng = random.Random(seed)
+    train, test = [], []
+    for items in by_label.values():
+        rng.shuffle(items)
+        cut = int(round(len(items) * test_ratio))
+        test.extend(items[:cut])
+        train.extend(items[cut:])
+    return train, test
@@ -0,0 +1,190 @@
+# keyword_cache.py
+# 가게 이름 → 명사 키워드 결과를 기억해두는 캐시.
+# 가게 이름은 거의 안 바뀌는데 매 요청마다 Okt(JVM 호출)로 다시 분석하고 있어서
+# 프로세스 안 LRU → Redis 해시(전체 워커 공유) → 형태소 분석 순서로 찾는다.
+# 분석 백엔드(okt / trie)마다 결과가 다르므로 namespace(백엔드 이름)별로 따로 저장한다.
+# 키워드가 없는 결과는 저장하지 않는다. 명사가 없는 이름은 다시 분석해도 싸고,
+# 분석이 잠깐 잘못돼서 빈 결과가 나온 경우 그게 Redis에 영구히 남으면 안 되므로.
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .tokenizer import TokenizerUnavailable, get_tokenizer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEYWORD_CACHE_SETTINGS = {
+    "LOCAL_MAXSIZE": 5000,               # 프로세스 안 LRU 크기
+    "REDIS_HASH": "store_keywords:v1",   # 전체 워커가 공유하는 Redis 해시 이름
+}
+
+
+def get_keyword_cache_settings():
+    return {**DEFAULT_KEYWORD_CACHE_SETTINGS, **getattr(settings, "KEYWORD_CACHE", {})}
+
+
+def normalize_name(name):
+    # 같은 가게 이름이 유니코드 조합 / 공백 차이로 따로 저장되지 않도록
+    return " ".join(unicodedata.normalize("NFC", name or "").split())
+
+
+class _LRU:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+_local = _LRU(get_keyword_cache_settings()["LOCAL_MAXSIZE"])
+
+
+def _redis():
+    # django-redis가 아니면(로컬 개발용 locmem 등) None → 일반 캐시 키로 대신 저장
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection("default")
+    except Exception:
+        return None
+
+
+def _hash_name(namespace):
+    base = get_keyword_cache_settings()["REDIS_HASH"]
+    return f"{base}:{namespace}" if namespace else base
+
+
+def _fallback_key(hash_name, name):
+    return f"{hash_name}:{hashlib.md5(name.encode('utf-8')).hexdigest()}"
+
+
+def _shared_get_many(names, namespace):
+    hash_name = _hash_name(namespace)
+    conn = _redis()
+    if conn is not None:
+        values = conn.hmget(hash_name, names)
+        return {name: json.loads(v) for name, v in zip(names, values) if v is not None}
+    keys = {_fallback_key(hash_name, name): name for name in names}
+    return {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+
+
+def _shared_set_many(mapping, namespace):
+    hash_name = _hash_name(namespace)
+    conn = _redis()
+    if conn is not None:
+        conn.hset(hash_name, mapping={name: json.dumps(kws, ensure_ascii=False) for name, kws in mapping.items()})
+        return
+    cache.set_many({_fallback_key(hash_name, name): kws for name, kws in mapping.items()}, timeout=None)
+
+
+def _lookup(names, namespace):
+    """캐시(LRU → Redis)에서 찾은 {정규화 이름: 키워드}와 분석해야 할 정규화 이름 리스트"""
+    result = {}
+    missing = []
+    for name in dict.fromkeys(normalize_name(n) for n in names):
+        keywords = _local.get((namespace, name))
+        if keywords is None:
+            missing.append(name)
+        else:
+            result[name] = keywords
+
+    if missing:
+        try:
+            shared = _shared_get_many(missing, namespace)
+        except Exception:
+            shared = {}  # Redis 장애여도 분석은 계속
+        for name, keywords in shared.items():
+            _local.set((namespace, name), keywords)
+            result[name] = keywords
+        missing = [name for name in missing if name not in shared]
+    return result, missing
+
+
+def _remember(analysed, namespace):
+    analysed = {name: keywords for name, keywords in analysed.items() if keywords}
+    if not analysed:
+        return
+    try:
+        _shared_set_many(analysed, namespace)
+    except Exception:
+        pass
+    for name, keywords in analysed.items():
+        _local.set((namespace, name), keywords)
+
+
+def get_many_store_keywords(names, extract_many, namespace=""):
+    """{가게 이름: 키워드 리스트}. 캐시에 없는 이름만 모아서 extract_many(이름 리스트)로 한 번에 분석한다."""
+    result, to_analyse = _lookup(names, namespace)
+    if to_analyse:
+        analysed = dict(zip(to_analyse, extract_many(to_analyse)))
+        _remember(analysed, namespace)
+        result.update(analysed)
+    return {n: result[normalize_name(n)] for n in names}
+
+
+async def aget_many_store_keywords(names, aextract_many, namespace=""):
+    """get_many_store_keywords의 비동기 버전: 분석은 await aextract_many(이름 리스트), 캐시 I/O는 스레드에서"""
+    result, to_analyse = await asyncio.to_thread(_lookup, names, namespace)
+    if to_analyse:
+        analysed = dict(zip(to_analyse, await aextract_many(to_analyse)))
+        await asyncio.to_thread(_remember, analysed, namespace)
+        result.update(analysed)
+    return {n: result[normalize_name(n)] for n in names}
+
+
+def get_store_keywords(name, extract, namespace=""):
+    return get_many_store_keywords([name], lambda names: [extract(n) for n in names], namespace)[name]
+
+
+def _apply_keywords(restaurants, keywords_by_name):
+    return [r._replace(keywords=tuple(keywords_by_name[r.name])) for r in restaurants]
+
+
+def enrich_store_keywords(restaurants):
+    """(이름 키워드를 채운 가게 레코드 리스트, 다 채웠는지). 리스트가 캐시 / 스냅샷에 들어가기 전에 한 번만 부른다.
+    분석 워커 풀이 응답하지 못하면 키워드 없이 그대로 + False (가게 리스트 자체는 살리고, 호출한 쪽이 짧게만 캐싱)."""
+    if not restaurants:
+        return restaurants, True
+    tokenizer = get_tokenizer()
+    try:
+        keywords_by_name = get_many_store_keywords(
+            [r.name for r in restaurants], tokenizer.store_keywords_batch, tokenizer.name
+        )
+    except TokenizerUnavailable:
+        logger.warning("가게 이름 키워드를 채우지 못함 (tokenizer pool)", exc_info=True)
+        return restaurants, False
+    return _apply_keywords(restaurants, keywords_by_name), True
+
+
+async def aenrich_store_keywords(restaurants):
+    """enrich_store_keywords의 비동기 버전 (이벤트 루프 / sync 스레드를 막지 않음)"""
+    if not restaurants:
+        return restaurants, True
+    tokenizer = get_tokenizer()
+    try:
+        keywords_by_name = await aget_many_store_keywords(
+            [r.name for r in restaurants], tokenizer.astore_keywords_batch, tokenizer.name
+        )
+    except TokenizerUnavailable:
+        logger.warning("가게 이름 키워드를 채우지 못함 (tokenizer pool)", exc_info=True)
+        return restaurants, False
+    return _apply_keywords(restaurants, keywords_by_name), True
@@ -0,0 +1,91 @@
+# keyword_matcher.py
+# 여러 키워드를 한 번에 찾는 Aho–Corasick 매처 (순수 파이썬).
+# is_related / 키워드 겹침 검사가 키워드마다 `in`으로 문자열 / 리스트를 다시 훑던 것을
+# 키워드 묶음을 한 번 컴파일해두고 입력 문자열을 한 번만 지나가면서 전부 찾도록 바꿈.
+# 가게 리스트 전체도 가게마다 한 번씩만 훑으면 되므로 (키워드 수와 무관하게) 전체 글자 수에 비례한다.
+from collections import deque
+from functools import lru_cache
+
+# 여러 문자열을 이어 붙여 한 번에 훑을 때 쓰는 구분자 (키워드 / 가게 이름에 나오지 않는 문자)
+SEP = "\x1f"
+
+
+class KeywordMatcher:
+    def __init__(self, patterns):
+        self.patterns = tuple(dict.fromkeys(p.lower() for p in patterns if p))
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]  # 상태 → 이 상태에서 끝나는 패턴 번호들
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (index,)
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    def _scan(self, text, whole_words):
+        # (끝 위치, 패턴 번호)를 차례로 돌려줌. whole_words면 SEP로 나뉜 토큰 전체와 같은 것만
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for end, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                if whole_words:
+                    start = end - len(self.patterns[index]) + 1
+                    if (start and text[start - 1] != SEP) or (end + 1 < len(text) and text[end + 1] != SEP):
+                        continue
+                yield end, index
+
+    def matches(self, text, whole_words=False):
+        """text(소문자)에 패턴이 하나라도 있으면 True (찾는 즉시 멈춤)"""
+        return any(True for _ in self._scan(text, whole_words))
+
+    def find(self, text, whole_words=False):
+        """text(소문자)에 나온 패턴들의 집합"""
+        return {self.patterns[index] for _, index in self._scan(text, whole_words)}
+
+
+@lru_cache(maxsize=1024)
+def _compiled(patterns):
+    return KeywordMatcher(patterns)
+
+
+def compile_matcher(patterns):
+    """같은 키워드 묶음은 한 번만 컴파일"""
+    return _compiled(tuple(patterns))
+
+
+def restaurant_text(restaurant):
+    # 가게 하나를 한 번에 훑기 위한 문자열: 정리된 이름 + 이름 키워드 + 카테고리
+    return SEP.join((restaurant.clean_name, *restaurant.keywords, *restaurant.categories)).lower()
+
+
+def related_restaurants(matcher, restaurants):
+    """matcher의 키워드가 이름 / 키워드 / 카테고리에 하나라도 들어 있는 가게들"""
+    if not matcher:
+        return []
+    return [r for r in restaurants if matcher.matches(restaurant_text(r))]
@@ -0,0 +1,78 @@
+import os
+import statistics
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from gomgom_ai.replay_transport import get_outbound_http_settings
+
+SAMPLE_TEXTS = ["매운 음식", "피곤해", "친구랑 먹을 거", "속 편한 음식", "우울해", "떡볶이"]
+SAMPLE_TYPES = ["spicy", "mild", "korean", "safe", "adventurous", "chinese"]
+
+
+class Command(BaseCommand):
+    help = "녹화된 외부 응답(replay)으로 test_result_view / recommend_result 지연 시간을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--view", choices=["test_result", "recommend_result", "both"], default="both")
+        parser.add_argument("--cold", action="store_true", help="매 요청 전에 캐시를 비움 (타일 캐시 미스 측정)")
+        parser.add_argument("--allow-live", action="store_true", help="replay가 아니어도 실행 (실제 API 호출!)")
+
+    def handle(self, *args, **options):
+        if get_outbound_http_settings()["MODE"] != "replay" and not options["allow_live"]:
+            raise CommandError("OUTBOUND_HTTP_MODE=replay 로 실행하세요 (실제 API를 부르려면 --allow-live)")
+        # OpenAI 클라이언트는 처음 GPT를 부를 때 키를 읽음. replay에서는 키를 쓰지 않지만 없으면 클라이언트가 안 만들어짐
+        os.environ.setdefault("OPENAI_API_KEY", "sk-replay")
+
+        from gomgom_ai import views
+
+        targets = {
+            "test_result": (views.test_result_view, "/test_result/", self._test_result_params),
+            "recommend_result": (views.recommend_result, "/recommend_result/", self._recommend_params),
+        }
+        names = list(targets) if options["view"] == "both" else [options["view"]]
+        # 기본 호스트(testserver)는 ALLOWED_HOSTS에 없어서 cache_page의 build_absolute_uri가 DisallowedHost를 냄
+        factory = RequestFactory(HTTP_HOST=self._allowed_host())
+
+        for name in names:
+            view, path, make_params = targets[name]
+            timings = []
+            for i in range(options["iterations"]):
+                if options["cold"]:
+                    cache.clear()
+                # _bench 파라미터로 cache_page 응답 캐시를 피함
+                request = factory.get(path, {**make_params(i), "_bench": i})
+                started = time.perf_counter()
+                response = view(request)
+                timings.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    self.stderr.write(f"{name} #{i}: status {response.status_code}")
+            self._report(name, timings)
+
+    def _allowed_host(self):
+        # "*" / ".example.com" 같은 패턴이 아닌 첫 호스트 (DEBUG에서 ALLOWED_HOSTS가 비어 있으면 localhost 허용)
+        for host in settings.ALLOWED_HOSTS:
+            if host != "*" and not host.startswith("."):
+                return host
+        return "localhost"
+
+    def _test_result_params(self, i):
+        params = {"text": SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)], "lat": "37.484934", "lng": "126.981321"}
+        for n in range(6):
+            params[f"type{n + 1}"] = SAMPLE_TYPES[(i + n) % len(SAMPLE_TYPES)]
+        return params
+
+    def _recommend_params(self, i):
+        return {"text": SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)], "lat": "37.484934", "lng": "126.981321"}
+
+    def _report(self, name, timings):
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f"{name}: n={len(timings)} p50={statistics.median(timings):.1f}ms "
+            f"p95={p95:.1f}ms max={timings[-1]:.1f}ms (DEBUG={settings.DEBUG})"
+        )
@@ -0,0 +1,67 @@
+import resource
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from gomgom_ai.noun_trie import HangulTrieTokenizer, store_name_samples
+from gomgom_ai.tokenizer import DEFAULT_TOKENIZER_SETTINGS, TokenizerService
+
+
+def _max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB
+
+
+class Command(BaseCommand):
+    help = "가게 이름 키워드 추출: trie(JVM 없음)와 Okt의 준비 시간 / 처리 속도 / 메모리 / 결과 일치율을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", choices=["snapshots", "cassette"], default="snapshots")
+        parser.add_argument("--limit", type=int, default=2000)
+        parser.add_argument("--repeat", type=int, default=5, help="속도 측정 반복 횟수")
+        parser.add_argument("--show-diff", type=int, default=10, help="결과가 다른 이름을 몇 개 보여줄지")
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+
+        conf = {**DEFAULT_TOKENIZER_SETTINGS, **getattr(settings, "TOKENIZER", {})}
+        names = store_name_samples(options["source"], options["limit"])
+        if not names:
+            raise CommandError("비교할 가게 이름이 없습니다 (--source cassette 로 replay 카세트를 쓸 수 있음)")
+
+        # JVM이 먼저 뜨면 메모리 비교가 안 되므로 trie를 먼저 측정
+        results = {}
+        for label, build in (
+            ("trie", lambda: HangulTrieTokenizer(nouns_file=conf["NOUNS_FILE"])),
+            ("okt", TokenizerService),
+        ):
+            rss_before = _max_rss_mb()
+            started = time.perf_counter()
+            backend = build()
+            backend.store_keywords(names[0])  # okt는 여기서 JVM 부팅
+            init_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            for _ in range(options["repeat"]):
+                keywords = backend.store_keywords_batch(names)
+            per_name_us = (time.perf_counter() - started) / options["repeat"] / len(names) * 1_000_000
+            results[label] = keywords
+            self.stdout.write(
+                f"{label}: 준비 {init_ms:.0f}ms, 이름당 {per_name_us:.1f}µs, "
+                f"최대 RSS +{_max_rss_mb() - rss_before:.1f}MB"
+            )
+
+        exact = 0
+        jaccard = 0.0
+        diffs = []
+        for name, trie_kws, okt_kws in zip(names, results["trie"], results["okt"]):
+            a, b = set(trie_kws), set(okt_kws)
+            if a == b:
+                exact += 1
+            else:
+                diffs.append((name, trie_kws, okt_kws))
+            jaccard += len(a & b) / len(a | b) if a | b else 1.0
+        self.stdout.write(
+            f"이름 {len(names)}개: 완전 일치 {exact / len(names):.1%}, 평균 Jaccard {jaccard / len(names):.3f}"
+        )
+        for name, trie_kws, okt_kws in diffs[:options["show_diff"]]:
+            self.stdout.write(f"  {name}: trie={trie_kws} okt={okt_kws}")
@@ -0,0 +1,66 @@
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from gomgom_ai.intent_classifier import (
+    LABELS,
+    NaiveBayesModel,
+    get_intent_classifier_settings,
+    labelled_examples,
+    predict,
+    split_examples,
+)
+
+THRESHOLD_TABLE = (0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99)
+
+
+class Command(BaseCommand):
+    help = "로컬 입력 유형 분류기를 GPT 라벨(추천 기록)과 비교해 정확도 / GPT 호출 비율을 보고합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--test-ratio", type=float, default=0.2, help="평가용으로 떼어둘 비율 (나머지로 학습)")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--threshold", type=float, default=None, help="기본: INTENT_CLASSIFIER['THRESHOLD']")
+        parser.add_argument("--rules-only", action="store_true", help="나이브 베이즈 없이 규칙만 평가")
+
+    def handle(self, *args, **options):
+        conf = get_intent_classifier_settings()
+        threshold = conf["THRESHOLD"] if options["threshold"] is None else options["threshold"]
+        examples = labelled_examples()
+        if not examples:
+            raise CommandError("평가할 기록이 없습니다")
+
+        train, test = split_examples(examples, options["test_ratio"], options["seed"])
+        if not test:
+            raise CommandError("평가 데이터가 비었습니다 (--test-ratio를 늘리세요)")
+        model = None if options["rules_only"] else NaiveBayesModel.train(train)
+
+        correct = confident = confident_correct = 0
+        confusion = Counter()
+        predictions = []
+        started = time.perf_counter()
+        for text, expected in test:
+            label, confidence = predict(text, model=model or False, rule_weight=conf["RULE_WEIGHT"])
+            predictions.append((label, confidence, expected))
+            confusion[(expected, label)] += 1
+            correct += label == expected
+            if confidence >= threshold:
+                confident += 1
+                confident_correct += label == expected
+        per_text_us = (time.perf_counter() - started) / len(test) * 1_000_000
+
+        self.stdout.write(f"학습 {len(train)} / 평가 {len(test)} (threshold {threshold}, 문장당 {per_text_us:.0f}µs)")
+        self.stdout.write(f"전체 정확도: {correct / len(test):.1%}")
+        self.stdout.write(
+            f"로컬 확정 비율(GPT 생략): {confident / len(test):.1%}, "
+            f"그중 정확도: {confident_correct / confident:.1%}" if confident else "로컬 확정 비율: 0%"
+        )
+        self.stdout.write("문턱값별 로컬 확정 비율 / 그중 정확도:")
+        for t in THRESHOLD_TABLE:
+            covered = [label == expected for label, confidence, expected in predictions if confidence >= t]
+            precision = f"{sum(covered) / len(covered):.1%}" if covered else "-"
+            self.stdout.write(f"  {t:.2f}: {len(covered) / len(test):>6.1%} / {precision}")
+        self.stdout.write("GPT 라벨 \\ 예측: " + " ".join(f"{l:>4}" for l in LABELS))
+        for expected in LABELS:
+            self.stdout.write(f"{expected:>12}: " + " ".join(f"{confusion[(expected, l)]:>4}" for l in LABELS))
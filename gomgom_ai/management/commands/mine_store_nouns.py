@@ -0,0 +1,39 @@
+import json
+from collections import Counter
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from gomgom_ai.noun_trie import store_name_samples
+from gomgom_ai.tokenizer import DEFAULT_TOKENIZER_SETTINGS, TokenizerService
+
+
+class Command(BaseCommand):
+    help = "가게 이름을 Okt로 분석해서 자주 나오는 명사를 trie 분석기 사전 파일(TOKENIZER['NOUNS_FILE'])로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", choices=["snapshots", "cassette"], default="snapshots")
+        parser.add_argument("--min-count", type=int, default=3, help="이 횟수 이상 나온 명사만 저장")
+        parser.add_argument("--limit", type=int, default=None, help="분석할 가게 이름 수 상한")
+        parser.add_argument("--output", default=None, help="저장 경로 (기본: TOKENIZER['NOUNS_FILE'])")
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+
+        conf = {**DEFAULT_TOKENIZER_SETTINGS, **getattr(settings, "TOKENIZER", {})}
+        output = options["output"] or conf["NOUNS_FILE"]
+        if not output:
+            raise CommandError("--output 또는 TOKENIZER['NOUNS_FILE']을 지정하세요")
+
+        names = store_name_samples(options["source"], options["limit"])
+        if not names:
+            raise CommandError("분석할 가게 이름이 없습니다")
+
+        counts = Counter(
+            noun
+            for keywords in TokenizerService().store_keywords_batch(names)
+            for noun in set(keywords)
+        )
+        nouns = sorted(noun for noun, count in counts.items() if count >= options["min_count"])
+        Path(output).write_text(json.dumps(nouns, ensure_ascii=False, indent=0), encoding="utf-8")
+        self.stdout.write(f"가게 이름 {len(names)}개 → 명사 {len(nouns)}개 저장: {output}")
@@ -0,0 +1,26 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from gomgom_ai.prefetch import prefetch_loop, run_prefetch
+
+
+class Command(BaseCommand):
+    help = "추천 기록 기준 다음 피크 시간대의 인기 타일 가게 리스트를 미리 캐싱합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--budget", type=int, default=None, help="요기요 요청(페이지) 예산")
+        parser.add_argument("--lead-minutes", type=int, default=None, help="몇 분 뒤 시간대를 채울지")
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 INTERVAL마다 반복")
+        parser.add_argument("--interval", type=int, default=None, help="--loop 반복 주기(초)")
+
+    def handle(self, *args, **options):
+        if options["loop"]:
+            asyncio.run(prefetch_loop(options["budget"], options["lead_minutes"], options["interval"]))
+            return
+
+        summary = run_prefetch(options["budget"], options["lead_minutes"])
+        self.stdout.write(
+            f"{summary['hour']}시 인기 타일 {summary['hot_tiles']}개 중 {len(summary['refreshed'])}개 갱신 "
+            f"(요청 {summary['requests_used']}/{summary['budget']})"
+        )
@@ -0,0 +1,58 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from gomgom_ai.intent_classifier import (
+    NaiveBayesModel,
+    calibrate_threshold,
+    get_intent_classifier_settings,
+    labelled_examples,
+    split_examples,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "추천 기록(GPT가 분류한 input_category)으로 입력 유형 나이브 베이즈 모델을 학습하고, "
+        "떼어둔 기록으로 GPT를 건너뛸 문턱값을 보정해 MODEL_FILE에 저장합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=None, help="저장 경로 (기본: INTENT_CLASSIFIER['MODEL_FILE'])")
+        parser.add_argument("--alpha", type=float, default=1.0, help="라플라스 스무딩 값")
+        parser.add_argument("--holdout", type=float, default=0.2, help="문턱값 보정용으로 떼어둘 비율")
+        parser.add_argument(
+            "--target-precision", type=float, default=None, help="기본: INTENT_CLASSIFIER['TARGET_PRECISION']"
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        conf = get_intent_classifier_settings()
+        output = options["output"] or conf["MODEL_FILE"]
+        target = options["target_precision"] or conf["TARGET_PRECISION"]
+        if not output:
+            raise CommandError("--output 또는 INTENT_CLASSIFIER['MODEL_FILE']을 지정하세요")
+
+        examples = labelled_examples()
+        if not examples:
+            raise CommandError("학습할 기록이 없습니다 (recommend_result 기록 중 GPT가 input_category를 붙인 것)")
+
+        # 문턱값은 학습에 안 쓴 기록으로 정하고, 저장하는 모델은 전부로 다시 학습
+        train, heldout = split_examples(examples, options["holdout"], options["seed"])
+        threshold = calibrate_threshold(
+            NaiveBayesModel.train(train, alpha=options["alpha"]), heldout, target, rule_weight=conf["RULE_WEIGHT"]
+        )
+        model = NaiveBayesModel.train(examples, alpha=options["alpha"])
+        model.threshold = threshold
+        model.save(output)
+
+        per_label = Counter(label for _, label in examples)
+        self.stdout.write(
+            f"{len(examples)}개 문장으로 학습 ({', '.join(f'{l} {n}' for l, n in per_label.most_common())}) → {output}"
+        )
+        if threshold is None:
+            self.stdout.write(self.style.WARNING(
+                f"떼어둔 {len(heldout)}개로는 정확도 {target:.0%}를 맞추는 문턱값이 없어 THRESHOLD({conf['THRESHOLD']})를 씁니다"
+            ))
+        else:
+            self.stdout.write(f"문턱값 {threshold:.3f} (떼어둔 {len(heldout)}개 기준 정확도 {target:.0%} 이상)")
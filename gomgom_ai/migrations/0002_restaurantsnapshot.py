@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gomgom_ai', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RestaurantSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tile', models.CharField(max_length=12, unique=True)),
+                ('latitude', models.FloatField()),
+                ('longitude', models.FloatField()),
+                ('restaurants', models.JSONField()),
+                ('restaurant_count', models.IntegerField(default=0)),
+                ('fetched_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['latitude', 'longitude'], name='snapshot_lat_lng_idx'), models.Index(fields=['fetched_at'], name='snapshot_fetched_at_idx')],
+            },
+        ),
+    ]
@@ -17,3 +17,24 @@ class Recommendation(models.Model):
 
     def __str__(self):
         return f"{self.input_text} → {self.recommended_store}"
+
+
+class RestaurantSnapshot(models.Model):
+    # 타일별 마지막 요기요 가게 리스트 (Redis 캐시가 비었거나 요기요 장애 때 대신 사용)
+    # geohash 타일 = 캐시 키. 이름이 비슷해도 가깝다는 보장은 없어서(경계 너머 옆 타일은 접두어가 다름)
+    # 주변 타일 검색은 아래 중심 좌표의 위경도 범위로 함 (snapshot_store.find_snapshot)
+    tile = models.CharField(max_length=12, unique=True)
+    latitude = models.FloatField()   # 타일 중심 좌표
+    longitude = models.FloatField()
+    restaurants = models.JSONField()  # Restaurant 레코드 리스트
+    restaurant_count = models.IntegerField(default=0)
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["latitude", "longitude"], name="snapshot_lat_lng_idx"),
+            models.Index(fields=["fetched_at"], name="snapshot_fetched_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.tile} ({self.restaurant_count}곳, {self.fetched_at})"
@@ -0,0 +1,37 @@
+# name_normalizer.py
+# 가게 이름 비교용 정규화 (매칭 / 유사 이름 판단이 모두 이것만 씀).
+# "엽기 떡볶이 (봉천점)", "엽기떡볶이-봉천점", "엽기떡볶이"가 같은 값이 되도록
+# NFC 정규화 → 지점 표시 제거 → 특수문자 / 공백 제거 → 소문자.
+# 같은 가게 이름이 요청마다 반복되므로 결과를 이름별로 기억하고, 가게 레코드에는 clean_name으로 미리 넣어둔다.
+import re
+import unicodedata
+from functools import lru_cache
+
+# 이름 끝의 지점 표시: 구분자(공백, -, _, /, 괄호) 뒤의 "<지명>점" (봉천점, 서울대입구역점, 본점)
+_BRANCH_SUFFIX = re.compile(r"[\s\-_/(\[]+([가-힣A-Za-z0-9]+점)\s*[)\]]?\s*$")
+# "...점"이어도 지점이 아니라 가게 이름의 일부인 말. 토큰 전체가 같을 때만 지점 표시가 아님
+# ("홍콩 반점", "행복 분식점"은 남기고 "교촌치킨 전주점", "제주점", "광주점"은 지점이라 뺌)
+NOT_BRANCH_WORDS = frozenset((
+    "반점", "분식점", "전문점", "음식점", "주점", "상점", "제과점", "정육점", "편의점", "백화점", "할인점", "만점",
+))
+# 이걸로 끝나는 토큰은 지명 + 점이 될 수 없어서 통째로 이름으로 봄 ("대박반점", "떡볶이전문점")
+NOT_BRANCH_ENDINGS = ("반점", "분식점", "전문점", "음식점")
+_NOT_NAME_CHAR = re.compile(r"[^가-힣a-zA-Z0-9]")
+
+
+def _strip_branch(name):
+    match = _BRANCH_SUFFIX.search(name)
+    if not match:
+        return name
+    token = match.group(1)
+    if token in NOT_BRANCH_WORDS or token.endswith(NOT_BRANCH_ENDINGS):
+        return name
+    return name[:match.start()]
+
+
+@lru_cache(maxsize=20000)
+def normalize_store_name(name):
+    name = unicodedata.normalize("NFC", name or "")
+    without_branch = _strip_branch(name)
+    cleaned = _NOT_NAME_CHAR.sub("", without_branch).lower()
+    return cleaned or _NOT_NAME_CHAR.sub("", name).lower()
@@ -0,0 +1,183 @@
+# noun_trie.py
+# JVM 없이 가게 이름에서 음식 명사를 뽑는 순수 파이썬 추출기 (TOKENIZER["BACKEND"] = "trie").
+# 가게 이름은 "짬뽕지존-봉천점"처럼 명사 몇 개 + 지점명이 대부분이라 Okt 전체 분석까지는 필요 없고,
+# 음식 / 가게 이름 사전으로 만든 한글 트라이에서 가장 긴 단어를 찾는 것만으로 거의 같은 결과가 나온다.
+#
+# 사전 출처
+# - food_list.json, data.all_dishes 의 음식 이름
+# - 요기요 카테고리 이름 (YOGIYO_CATEGORIES)
+# - mine_store_nouns 명령으로 가게 이름에서 Okt로 뽑아둔 자주 나오는 명사 (TOKENIZER["NOUNS_FILE"])
+# - 아래 BASE_NOUNS (배달 가게 이름에 자주 나오는 음식 / 가게 단어)
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+_APP_DIR = Path(__file__).resolve().parent
+
+YOGIYO_CATEGORIES = (
+    "치킨", "피자양식", "피자", "양식", "중국집", "중식", "한식", "분식", "카페디저트", "카페", "디저트",
+    "족발보쌈", "족발", "보쌈", "야식", "찜탕", "일식돈까스", "일식", "돈까스", "도시락", "패스트푸드",
+    "아시안", "고기구이", "샐러드", "멕시칸", "프랜차이즈", "편의점", "죽",
+)
+
+BASE_NOUNS = (
+    "짬뽕", "짜장", "짜장면", "탕수육", "마라탕", "마라", "떡볶이", "김밥", "순대", "튀김", "라면", "국수",
+    "쌀국수", "냉면", "칼국수", "우동", "비빔밥", "국밥", "찌개", "김치찌개", "부대찌개", "감자탕", "삼겹살",
+    "갈비", "불고기", "닭갈비", "닭발", "곱창", "막창", "족발", "보쌈", "치킨", "피자", "버거", "햄버거",
+    "파스타", "스테이크", "샌드위치", "토스트", "타코", "부리또", "카레", "스시", "초밥", "돈까스",
+    "덮밥", "도시락", "샐러드", "커피", "빙수", "케이크", "와플", "반점", "지존", "명가", "전문",
+    "할머니", "천국", "다방", "하우스", "클럽", "식당", "분식", "포차", "주점", "왕돈까스", "닭강정",
+)
+
+# 지점 표시: 이름 끝의 "...점" (봉천점, 서울대입구역점)은 "점"을 떼고 지명만 남김
+_BRANCH_SUFFIX = "점"
+_HANGUL_RUN = re.compile(r"[가-힣]+")
+_END = ""  # 트라이 노드에서 단어 끝 표시 키
+
+
+class HangulTrieTokenizer:
+    name = "trie"
+
+    def __init__(self, words=(), nouns_file=None):
+        self._root = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "texts": 0, "total_seconds": 0.0, "errors": 0, "init_seconds": None}
+        started = time.perf_counter()
+        for word in (*words, *_default_words(nouns_file)):
+            self.add(word)
+        self._stats["init_seconds"] = round(time.perf_counter() - started, 3)
+
+    def add(self, word):
+        if len(word) < 2 or not _HANGUL_RUN.fullmatch(word):
+            return
+        node = self._root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        if _END not in node:
+            node[_END] = True
+            self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def _longest(self, text, start):
+        node = self._root
+        end = None
+        for i in range(start, len(text)):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if _END in node:
+                end = i + 1
+        return end
+
+    def _run_nouns(self, run, last_run):
+        # 트라이에 있는 단어는 가장 긴 것부터, 사전에 없는 두 글자 이상 덩어리는 Okt처럼 명사로 취급
+        nouns = []
+        unknown_start = None
+        i = 0
+        while i < len(run):
+            end = self._longest(run, i)
+            if end is None:
+                if unknown_start is None:
+                    unknown_start = i
+                i += 1
+                continue
+            if unknown_start is not None:
+                nouns.append(run[unknown_start:i])
+                unknown_start = None
+            nouns.append(run[i:end])
+            i = end
+        if unknown_start is not None:
+            tail = run[unknown_start:]
+            if last_run and len(tail) > 2 and tail.endswith(_BRANCH_SUFFIX):
+                tail = tail[:-1]
+            nouns.append(tail)
+        return nouns
+
+    def nouns(self, text):
+        runs = _HANGUL_RUN.findall(text or "")
+        return [
+            noun
+            for index, run in enumerate(runs)
+            for noun in self._run_nouns(run, index == len(runs) - 1)
+        ]
+
+    def store_keywords(self, name):
+        started = time.perf_counter()
+        keywords = [w for w in self.nouns(name) if len(w) > 1]
+        self._record(started, 1)
+        return keywords
+
+    def store_keywords_batch(self, names):
+        started = time.perf_counter()
+        result = [[w for w in self.nouns(name) if len(w) > 1] for name in names]
+        self._record(started, len(names))
+        return result
+
+    async def astore_keywords_batch(self, names):
+        return self.store_keywords_batch(names)  # 순수 파이썬이고 빨라서 스레드로 넘기지 않음
+
+    def _record(self, started, texts):
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["texts"] += texts
+            self._stats["total_seconds"] += time.perf_counter() - started
+
+    def warm_up(self, rounds=1, timeout=None):
+        # 사전은 만들 때 이미 다 올라와 있어서 데울 게 없음
+        pass
+
+    @property
+    def is_ready(self):
+        return True
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats["backend"] = self.name
+        stats["ready"] = True
+        stats["words"] = self._size
+        stats["avg_ms"] = round(stats["total_seconds"] / stats["calls"] * 1000, 3) if stats["calls"] else None
+        stats["total_seconds"] = round(stats["total_seconds"], 3)
+        return stats
+
+
+def load_mined_nouns(nouns_file):
+    path = Path(nouns_file) if nouns_file else None
+    if path is None or not path.exists():
+        return []
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _default_words(nouns_file):
+    from .data import all_dishes
+
+    with open(_APP_DIR / "food_list.json", encoding="utf-8") as f:
+        food_list = json.load(f)
+    yield from (food["name"] for food in food_list)
+    yield from (dish["name"] for dish in all_dishes)
+    yield from YOGIYO_CATEGORIES
+    yield from BASE_NOUNS
+    yield from load_mined_nouns(nouns_file)
+
+
+def store_name_samples(source="snapshots", limit=None):
+    """사전 만들기 / 벤치마크에 쓸 가게 이름: DB 스냅샷 또는 요기요 replay 카세트"""
+    if source == "snapshots":
+        from .snapshot_store import snapshot_store_names
+
+        return snapshot_store_names(limit)
+
+    from .replay_transport import get_outbound_http_settings
+
+    path = Path(get_outbound_http_settings()["CASSETTE_DIR"]) / "www.yogiyo.co.kr.json"
+    names = {}
+    for route in json.loads(path.read_text(encoding="utf-8"))["routes"]:
+        for response in route["responses"]:
+            for r in (response.get("json") or {}).get("restaurants", []):
+                names[r.get("name") or ""] = None
+    return list(names)[:limit] if limit else list(names)
@@ -0,0 +1,100 @@
+# prefetch.py
+# Recommendation 기록(위경도 + created_at)으로 시간대별 인기 타일을 찾아서
+# 점심/저녁 피크 직전에 타일 캐시를 미리 채워두는 프리페처.
+import asyncio
+import logging
+from collections import Counter
+from datetime import timedelta
+from zoneinfo import ZoneInfo
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Recommendation
+from .restaurant_cache import prefetch_tile, tile_for
+from .yogiyo_client import pages_for_tile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH_SETTINGS = {
+    "BUDGET": 50,            # 한 번 돌 때 쓸 수 있는 요기요 요청(페이지) 수
+    "LEAD_MINUTES": 15,      # 몇 분 뒤의 시간대를 미리 채울지
+    "TOP_TILES": 20,         # 시간대별로 채울 인기 타일 수
+    "HISTORY_DAYS": 28,      # 인기 타일 계산에 쓰는 기록 기간
+    "INTERVAL": 60 * 5,      # 상주 모드에서 반복 주기(초)
+    "TIME_ZONE": "Asia/Seoul",  # 피크 시간대 기준 시간대
+}
+
+
+def get_prefetch_settings():
+    return {**DEFAULT_PREFETCH_SETTINGS, **getattr(settings, "PREFETCH", {})}
+
+
+def hot_tiles(hour, limit=None, days=None):
+    """hour시(현지 시간)에 추천 요청이 많았던 타일 [(tile, 요청 수), ...]"""
+    conf = get_prefetch_settings()
+    limit = limit or conf["TOP_TILES"]
+    days = days or conf["HISTORY_DAYS"]
+
+    # __hour 조회는 현재 시간대 기준이라 피크 시간대 기준으로 바꿔서 조회
+    with timezone.override(ZoneInfo(conf["TIME_ZONE"])):
+        rows = (
+            Recommendation.objects
+            .filter(
+                created_at__gte=timezone.now() - timedelta(days=days),
+                created_at__hour=hour,
+                latitude__isnull=False,
+                longitude__isnull=False,
+            )
+            .values_list("latitude", "longitude")
+        )
+        counts = Counter()
+        for lat, lng in rows.iterator():
+            try:
+                counts[tile_for(lat, lng)] += 1
+            except ValueError:
+                continue
+    return counts.most_common(limit)
+
+
+def run_prefetch(budget=None, lead_minutes=None, now=None):
+    """LEAD_MINUTES 뒤 시간대의 인기 타일을 예산 안에서 갱신. 요약 dict 반환"""
+    conf = get_prefetch_settings()
+    budget = conf["BUDGET"] if budget is None else budget
+    lead_minutes = conf["LEAD_MINUTES"] if lead_minutes is None else lead_minutes
+    now = now or timezone.now()
+
+    target_hour = (now + timedelta(minutes=lead_minutes)).astimezone(ZoneInfo(conf["TIME_ZONE"])).hour
+    tiles = hot_tiles(target_hour)
+
+    used = 0
+    refreshed = []
+    for tile, _count in tiles:
+        cost = pages_for_tile(tile)
+        if used + cost > budget:
+            break
+        if prefetch_tile(tile):
+            used += cost
+            refreshed.append(tile)
+
+    summary = {
+        "hour": target_hour,
+        "hot_tiles": len(tiles),
+        "refreshed": refreshed,
+        "requests_used": used,
+        "budget": budget,
+    }
+    logger.info("hot tile prefetch: %s", summary)
+    return summary
+
+
+async def prefetch_loop(budget=None, lead_minutes=None, interval=None):
+    """상주 asyncio task용: INTERVAL마다 run_prefetch 실행"""
+    interval = interval or get_prefetch_settings()["INTERVAL"]
+    while True:
+        try:
+            await sync_to_async(run_prefetch, thread_sensitive=False)(budget, lead_minutes)
+        except Exception:
+            logger.exception("hot tile prefetch 실패")
+        await asyncio.sleep(interval)
@@ -0,0 +1,215 @@
+# replay_transport.py
+# 요기요 / 카카오 / ipinfo / OpenAI 외부 호출을 녹화(record)하거나 녹화본을 재생(replay)하는 httpx 트랜스포트.
+# 모든 외부 호출은 http_client의 공용 클라이언트를 지나가므로 OUTBOUND_HTTP["MODE"]만 바꾸면
+# 네트워크 없이 test_result_view / recommend_result를 같은 조건으로 반복 벤치마크할 수 있다.
+#
+# 카세트 파일: CASSETTE_DIR/<host>.json
+# {
+#   "routes": [
+#     {"path": "/api/v1/restaurants", "match": "선택: 요청 텍스트에 들어있어야 하는 문자열",
+#      "responses": [{"status": 200, "headers": {...}, "json": {...}} 또는 {"text": "..."}]}
+#   ]
+# }
+# 요청 텍스트는 OpenAI 요청이면 마지막 메시지 내용(프롬프트), 아니면 본문 그대로 (_request_text).
+# record 모드는 프롬프트를 match로 저장해서, 같은 경로의 분류 / 추천 호출이 replay에서 섞이지 않는다.
+import asyncio
+import json
+import random
+import threading
+import time
+from pathlib import Path
+
+import httpx
+from django.conf import settings
+
+DEFAULT_OUTBOUND_HTTP_SETTINGS = {
+    "MODE": "live",  # live | record | replay
+    "CASSETTE_DIR": Path(__file__).resolve().parent / "cassettes",
+    # 호스트별 지연 분포: {"dist": "fixed", "ms": 100} / {"dist": "uniform", "min_ms": 50, "max_ms": 200}
+    #                    / {"dist": "lognormal", "median_ms": 120, "sigma": 0.5}
+    "LATENCY": {},
+    "ERROR_RATE": {},     # 호스트별 실패 비율 (0.0 ~ 1.0)
+    "ERROR_KIND": "status",  # status(503 응답) | timeout(ReadTimeout 예외)
+    "PAYLOAD_SCALE": 1,   # 응답 JSON의 "restaurants" 리스트를 몇 배로 늘릴지 (큰 페이로드 재현)
+    "SEED": None,         # 지연/에러 난수 시드 (재현용)
+}
+
+
+def get_outbound_http_settings():
+    return {**DEFAULT_OUTBOUND_HTTP_SETTINGS, **getattr(settings, "OUTBOUND_HTTP", {})}
+
+
+def _cassette_path(cassette_dir, host):
+    return Path(cassette_dir) / f"{host}.json"
+
+
+def _request_text(request):
+    body = request.content.decode("utf-8", errors="ignore")
+    try:
+        messages = json.loads(body).get("messages")
+    except (ValueError, AttributeError):
+        return body
+    if messages and isinstance(messages[-1].get("content"), str):
+        return messages[-1]["content"]
+    return body
+
+
+class _Cassettes:
+    def __init__(self, cassette_dir):
+        self.cassette_dir = cassette_dir
+        self._loaded = {}
+        self._cursor = {}
+        self._lock = threading.Lock()
+
+    def _routes(self, host):
+        if host not in self._loaded:
+            path = _cassette_path(self.cassette_dir, host)
+            self._loaded[host] = json.loads(path.read_text(encoding="utf-8"))["routes"] if path.exists() else []
+        return self._loaded[host]
+
+    def next_response(self, request):
+        text = _request_text(request)
+        with self._lock:
+            routes = [r for r in self._routes(request.url.host) if r["path"] == request.url.path]
+            # match가 있는 route를 먼저, 없으면 기본 route
+            route = next((r for r in routes if r.get("match") and r["match"] in text), None) or next(
+                (r for r in routes if not r.get("match")), None
+            )
+            if route is None or not route["responses"]:
+                return None
+            # 같은 route에 응답이 여러 개면 돌아가면서 재생
+            key = id(route)
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            return route["responses"][index % len(route["responses"])]
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """카세트에 녹화된 응답을 지연 / 에러율 / 페이로드 크기 설정에 맞춰 재생"""
+
+    def __init__(self, conf):
+        self.conf = conf
+        self.cassettes = _Cassettes(conf["CASSETTE_DIR"])
+        self.random = random.Random(conf["SEED"])
+        self._random_lock = threading.Lock()
+
+    def _latency(self, host):
+        spec = self.conf["LATENCY"].get(host) or self.conf["LATENCY"].get("*")
+        if not spec:
+            return 0.0
+        with self._random_lock:
+            if spec["dist"] == "fixed":
+                ms = spec["ms"]
+            elif spec["dist"] == "uniform":
+                ms = self.random.uniform(spec["min_ms"], spec["max_ms"])
+            elif spec["dist"] == "lognormal":
+                ms = self.random.lognormvariate(0, spec["sigma"]) * spec["median_ms"]
+            else:
+                raise ValueError(f"알 수 없는 지연 분포: {spec['dist']}")
+        return ms / 1000
+
+    def _should_fail(self, host):
+        rate = self.conf["ERROR_RATE"].get(host, self.conf["ERROR_RATE"].get("*", 0.0))
+        with self._random_lock:
+            return rate > 0 and self.random.random() < rate
+
+    def _scale(self, data):
+        scale = self.conf["PAYLOAD_SCALE"]
+        if scale <= 1 or not isinstance(data, dict) or not isinstance(data.get("restaurants"), list):
+            return data
+        base = data["restaurants"]
+        scaled = []
+        for copy in range(scale):
+            for r in base:
+                # 복사본은 id / 이름을 바꿔서 서로 다른 가게로 보이게 함
+                r = dict(r)
+                if copy:
+                    r["id"] = (r.get("id") or 0) + copy * 10_000_000
+                    r["name"] = f"{r.get('name', '')} {copy + 1}호점"
+                scaled.append(r)
+        return {**data, "restaurants": scaled}
+
+    def _build_response(self, request):
+        host = request.url.host
+        if self._should_fail(host):
+            if self.conf["ERROR_KIND"] == "timeout":
+                raise httpx.ReadTimeout("stand-in timeout", request=request)
+            return httpx.Response(503, request=request, json={"error": "stand-in error"})
+
+        recorded = self.cassettes.next_response(request)
+        if recorded is None:
+            return httpx.Response(404, request=request, json={"error": f"녹화된 응답 없음: {host}{request.url.path}"})
+        headers = recorded.get("headers", {})
+        if "json" in recorded:
+            return httpx.Response(recorded["status"], request=request, headers=headers, json=self._scale(recorded["json"]))
+        return httpx.Response(recorded["status"], request=request, headers=headers, text=recorded.get("text", ""))
+
+    def handle_request(self, request):
+        time.sleep(self._latency(request.url.host))
+        return self._build_response(request)
+
+    async def handle_async_request(self, request):
+        await asyncio.sleep(self._latency(request.url.host))
+        return self._build_response(request)
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """실제 트랜스포트로 요청을 보내고 응답을 카세트 파일에 덧붙임"""
+
+    _lock = threading.Lock()
+
+    def __init__(self, conf, transport):
+        self.cassette_dir = Path(conf["CASSETTE_DIR"])
+        self.transport = transport
+
+    def _record(self, request, response):
+        recorded = {"status": response.status_code, "headers": {"content-type": response.headers.get("content-type", "")}}
+        try:
+            recorded["json"] = json.loads(response.content)
+        except ValueError:
+            recorded["text"] = response.text
+
+        # 본문이 있는 요청(OpenAI 등)은 요청 텍스트를 match로, 본문 없는 GET은 기본 route에 녹화
+        match = _request_text(request) if request.content else None
+        path = _cassette_path(self.cassette_dir, request.url.host)
+        with self._lock:
+            self.cassette_dir.mkdir(parents=True, exist_ok=True)
+            cassette = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {"routes": []}
+            route = next(
+                (r for r in cassette["routes"] if r["path"] == request.url.path and r.get("match") == match), None
+            )
+            if route is None:
+                route = {"path": request.url.path, "responses": []}
+                if match:
+                    route["match"] = match
+                cassette["routes"].append(route)
+            route["responses"].append(recorded)
+            path.write_text(json.dumps(cassette, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def handle_request(self, request):
+        response = self.transport.handle_request(request)
+        response.read()
+        self._record(request, response)
+        return response
+
+    async def handle_async_request(self, request):
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        self._record(request, response)
+        return response
+
+    def close(self):
+        self.transport.close()
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def wrap_transport(transport):
+    """http_client가 만든 실제 트랜스포트를 OUTBOUND_HTTP["MODE"]에 맞게 바꿔 끼움"""
+    conf = get_outbound_http_settings()
+    if conf["MODE"] == "replay":
+        return ReplayTransport(conf)
+    if conf["MODE"] == "record":
+        return RecordingTransport(conf, transport)
+    return transport
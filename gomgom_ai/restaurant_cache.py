@@ -0,0 +1,271 @@
+# restaurant_cache.py
+# 요기요 가게 리스트를 geohash 타일 단위로 캐싱한다.
+# 같은 배달 구역의 사용자들은 업스트림 요청 한 번의 결과를 함께 쓴다.
+#
+# 캐시 항목은 soft / hard 두 개의 만료 시간을 가진다 (stale-while-revalidate).
+# - soft 만료 전: 그대로 반환
+# - soft ~ hard 사이: 캐시 값을 바로 반환하고 백그라운드 갱신을 키당 한 번만 예약
+# - hard 만료 후(Redis에서 사라짐): 요기요에서 새로 가져옴 (singleflight)
+# 요기요 서킷 브레이커가 열려 있으면 갱신/요청 없이 캐시에 있는 값만 준다.
+# 일부 페이지가 실패하거나 시간이 모자라 잘린 리스트, 가게 이름 키워드를 못 채운 리스트(partial)는
+# PARTIAL_TIMEOUT 동안만 두고 바로 stale로 봐서 다음 요청 때 다시 가져온다. 스냅샷에도 남기지 않는다.
+#
+# 가져온 리스트는 DB 스냅샷(snapshot_store)에도 남겨서
+# - 캐시 미스(재시작, Redis flush): 가까운 최신 스냅샷을 바로 주고 백그라운드 갱신
+# - 요기요 장애(브레이커 open, 요청 실패): 나이와 상관없이 스냅샷으로 대체
+#
+# 가게 이름 키워드는 리스트가 캐시에 들어갈 때 한 번만 채우므로(enrich_store_keywords)
+# 캐시 히트에서는 형태소 분석을 하지 않는다.
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone as dt_timezone
+from typing import NamedTuple, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from . import geotile, singleflight
+from .keyword_cache import aenrich_store_keywords, enrich_store_keywords
+from .restaurant_record import RESTAURANT_RECORD_VERSION
+from .snapshot_store import find_snapshot, get_snapshot_settings, save_snapshot
+from .yogiyo_client import fetch_yogiyo_restaurant_pages, get_yogiyo_restaurant_pages, pages_for_tile, yogiyo_breaker
+
+DEFAULT_RESTAURANT_CACHE_SETTINGS = {
+    "TILE_PRECISION": 6,         # geohash 자릿수 (6 ≈ 1.2km x 0.6km)
+    "SOFT_TIMEOUT": 60 * 5,      # 이 시간이 지나면 백그라운드 갱신
+    "HARD_TIMEOUT": 60 * 30,     # 이 시간이 지나면 캐시에서 삭제
+    "PARTIAL_TIMEOUT": 60,       # 잘린 리스트를 캐시에 두는 시간
+    "REFRESH_LOCK_TIMEOUT": 30,  # 워커 간 갱신 중복 방지 락(초)
+    "REFRESH_WORKERS": 2,
+}
+
+
+class TileListing(NamedTuple):
+    """타일 가게 리스트 + 그 리스트를 요기요에서 가져온 시각 (GPT 응답 캐시 등이 리스트 버전으로 씀)"""
+    tile: Optional[str]
+    restaurants: list
+    fetched_at: Optional[float] = None  # 가게가 없으면 None
+
+
+_refresh_executor = None
+_refreshing = set()          # 이 프로세스에서 갱신 중인 키
+
+
+def get_restaurant_cache_settings():
+    return {**DEFAULT_RESTAURANT_CACHE_SETTINGS, **getattr(settings, "RESTAURANT_CACHE", {})}
+
+
+def tile_for(lat, lng):
+    return geotile.encode(lat, lng, get_restaurant_cache_settings()["TILE_PRECISION"])
+
+
+def tile_cache_key(tile):
+    return f"restaurants:tile:{tile}:v{RESTAURANT_RECORD_VERSION}"
+
+
+def _refresh_lock_key(key):
+    return f"refresh:{key}"
+
+
+def _make_entry(restaurants, conf, fetched_at=None, partial=False):
+    fetched_at = fetched_at or time.time()
+    return {
+        "restaurants": restaurants,
+        "fetched_at": fetched_at,
+        "fresh_until": 0 if partial else fetched_at + conf["SOFT_TIMEOUT"],
+        "partial": partial,
+    }
+
+
+def _entry_timeout(entry, conf):
+    return conf["PARTIAL_TIMEOUT"] if entry.get("partial") else conf["HARD_TIMEOUT"]
+
+
+def _keeps_current(entry, current):
+    # 갱신 결과가 잘렸는데 캐시에 온전한(stale) 리스트가 있으면 그걸 계속 씀
+    return entry["partial"] and current is not None and not current.get("partial")
+
+
+def _snapshot_restaurants(restaurants):
+    # 키워드 필드가 생기기 전에 저장된 스냅샷은 여기서 채움 (키워드 캐시에 있어서 보통 분석 없음)
+    if any(not r.keywords for r in restaurants):
+        return enrich_store_keywords(restaurants)
+    return restaurants, True
+
+
+def _entry_from_snapshot(tile, snapshot, conf):
+    restaurants, fetched_at, snapshot_tile = snapshot
+    restaurants, enriched = _snapshot_restaurants(restaurants)
+    entry = _make_entry(restaurants, conf, fetched_at, partial=not enriched)
+    if snapshot_tile != tile:
+        entry["fresh_until"] = 0  # 옆 타일 스냅샷은 임시로만 쓰고 바로 갱신
+    return entry
+
+
+def _snapshot_fallback(tile):
+    # 요기요 장애 시: 나이와 상관없이 가장 가까운 스냅샷
+    snapshot = find_snapshot(tile)
+    if not snapshot:
+        return TileListing(tile, [])
+    return TileListing(tile, _snapshot_restaurants(snapshot[0])[0], snapshot[1])
+
+
+def _listing(tile, entry):
+    return TileListing(tile, entry["restaurants"], entry["fetched_at"]) if entry is not None else None
+
+
+def _fetched_datetime(entry):
+    # 스냅샷에도 캐시 항목과 같은 fetched_at을 남겨서 리스트 버전이 어디서 읽든 같게
+    return datetime.fromtimestamp(entry["fetched_at"], tz=dt_timezone.utc)
+
+
+def _is_stale(entry):
+    return time.time() >= entry["fresh_until"]
+
+
+def get_restaurants(lat, lng):
+    """(lat, lng)가 속한 타일의 가게 리스트. 캐시에 없으면 타일 중심 좌표로 요기요에서 가져온다."""
+    return get_tile_listing(lat, lng).restaurants
+
+
+async def aget_restaurants(lat, lng):
+    """get_restaurants의 비동기 버전 (restaurant_list_view 등 async 뷰용)"""
+    return (await aget_tile_listing(lat, lng)).restaurants
+
+
+def get_tile_listing(lat, lng):
+    """get_restaurants와 같지만 타일 / 가져온 시각까지 TileListing으로 반환"""
+    conf = get_restaurant_cache_settings()
+    try:
+        tile = tile_for(lat, lng)
+    except (TypeError, ValueError):  # 좌표가 없거나 숫자가 아님
+        return TileListing(None, [])
+    key = tile_cache_key(tile)
+
+    entry = cache.get(key)
+    if entry is not None:
+        if _is_stale(entry) and not yogiyo_breaker().is_open:
+            _schedule_refresh(tile, key, conf)
+        return _listing(tile, entry)
+    if yogiyo_breaker().is_open:
+        return _snapshot_fallback(tile)  # 요기요 장애 중 - 기다려봐야 실패하므로 바로 스냅샷
+
+    # 캐시 미스지만 최근 스냅샷이 있으면 그걸로 캐시를 채우고 바로 응답
+    snapshot = find_snapshot(tile, max_age=get_snapshot_settings()["MAX_AGE"])
+    if snapshot:
+        entry = _entry_from_snapshot(tile, snapshot, conf)
+        cache.set(key, entry, timeout=_entry_timeout(entry, conf))
+        if _is_stale(entry):
+            _schedule_refresh(tile, key, conf)
+        return _listing(tile, entry)
+
+    # 캐시 미스: 같은 타일의 동시 요청은 리더 하나만 요기요를 부르고 나머지는 결과를 기다림
+    return singleflight.do(key, lambda: _load_tile(tile, key, conf), poll=lambda: _listing(tile, cache.get(key)))
+
+
+async def aget_tile_listing(lat, lng):
+    conf = get_restaurant_cache_settings()
+    try:
+        tile = tile_for(lat, lng)
+    except (TypeError, ValueError):  # 좌표가 없거나 숫자가 아님
+        return TileListing(None, [])
+    key = tile_cache_key(tile)
+
+    entry = await cache.aget(key)
+    if entry is not None:
+        if _is_stale(entry) and not yogiyo_breaker().is_open:
+            await _aschedule_refresh(tile, key, conf)
+        return _listing(tile, entry)
+    if yogiyo_breaker().is_open:
+        return await sync_to_async(_snapshot_fallback)(tile)
+
+    snapshot = await sync_to_async(find_snapshot)(tile, max_age=get_snapshot_settings()["MAX_AGE"])
+    if snapshot:
+        entry = await sync_to_async(_entry_from_snapshot)(tile, snapshot, conf)
+        await cache.aset(key, entry, timeout=_entry_timeout(entry, conf))
+        if _is_stale(entry):
+            await _aschedule_refresh(tile, key, conf)
+        return _listing(tile, entry)
+
+    async def poll():
+        return _listing(tile, await cache.aget(key))
+
+    return await singleflight.ado(key, lambda: _aload_tile(tile, key, conf), poll=poll)
+
+
+def _load_tile(tile, key, conf):
+    restaurants, complete = get_yogiyo_restaurant_pages(*geotile.center(tile), pages=pages_for_tile(tile))
+    if not restaurants:  # 실패(빈 리스트)는 캐싱하지 않고 스냅샷으로 대체
+        return _snapshot_fallback(tile)
+    restaurants, enriched = enrich_store_keywords(restaurants)
+    entry = _make_entry(restaurants, conf, partial=not (complete and enriched))
+    current = cache.get(key)
+    if _keeps_current(entry, current):
+        return _listing(tile, current)
+    cache.set(key, entry, timeout=_entry_timeout(entry, conf))
+    if not entry["partial"]:
+        save_snapshot(tile, entry["restaurants"], _fetched_datetime(entry))
+    return _listing(tile, entry)
+
+
+async def _aload_tile(tile, key, conf):
+    restaurants, complete = await fetch_yogiyo_restaurant_pages(*geotile.center(tile), pages=pages_for_tile(tile))
+    if not restaurants:
+        return await sync_to_async(_snapshot_fallback)(tile)
+    restaurants, enriched = await aenrich_store_keywords(restaurants)
+    entry = _make_entry(restaurants, conf, partial=not (complete and enriched))
+    current = await cache.aget(key)
+    if _keeps_current(entry, current):
+        return _listing(tile, current)
+    await cache.aset(key, entry, timeout=_entry_timeout(entry, conf))
+    if not entry["partial"]:
+        await sync_to_async(save_snapshot)(tile, entry["restaurants"], _fetched_datetime(entry))
+    return _listing(tile, entry)
+
+
+def prefetch_tile(tile):
+    """프리페처용: 타일 캐시가 없거나 stale이면 지금 바로 갱신. 요기요를 불렀으면 True"""
+    conf = get_restaurant_cache_settings()
+    key = tile_cache_key(tile)
+    entry = cache.get(key)
+    if entry is not None and not _is_stale(entry):
+        return False
+    if key in _refreshing or not cache.add(_refresh_lock_key(key), 1, timeout=conf["REFRESH_LOCK_TIMEOUT"]):
+        return False  # 이미 다른 곳에서 갱신 중
+    _refreshing.add(key)
+    _refresh_tile(tile, key, conf)
+    return True
+
+
+def _schedule_refresh(tile, key, conf):
+    # 프로세스 안에서 한 번, 워커 간에는 Redis 락으로 한 번만 갱신
+    if key in _refreshing or not cache.add(_refresh_lock_key(key), 1, timeout=conf["REFRESH_LOCK_TIMEOUT"]):
+        return
+    _submit_refresh(tile, key, conf)
+
+
+async def _aschedule_refresh(tile, key, conf):
+    if key in _refreshing or not await cache.aadd(_refresh_lock_key(key), 1, timeout=conf["REFRESH_LOCK_TIMEOUT"]):
+        return
+    _submit_refresh(tile, key, conf)
+
+
+def _submit_refresh(tile, key, conf):
+    # 비동기 뷰에서도 요청 이벤트 루프가 아니라 프로세스 공용 스레드에서 갱신
+    # (루프에 task로 걸면 요청 / 루프가 끝날 때 같이 취소되고, 도는 동안 그 루프를 붙잡음)
+    global _refresh_executor
+    _refreshing.add(key)
+    if _refresh_executor is None:
+        _refresh_executor = ThreadPoolExecutor(max_workers=conf["REFRESH_WORKERS"], thread_name_prefix="tile-refresh")
+    _refresh_executor.submit(_refresh_tile, tile, key, conf)
+
+
+def _refresh_tile(tile, key, conf):
+    try:
+        _load_tile(tile, key, conf)
+    except Exception:
+        pass  # 갱신 실패 시 기존(stale) 값을 hard 만료까지 계속 사용
+    finally:
+        _refreshing.discard(key)
+        cache.delete(_refresh_lock_key(key))
@@ -0,0 +1,138 @@
+# restaurant_index.py
+# GPT가 고른 가게 이름 → 요기요 가게 레코드 매칭용 역색인.
+# 가게 리스트마다 한 번만 만들어서(index_for) 이름의 글자 2/3-gram과 가게 키워드(Restaurant.keywords)를
+# 가게 번호 목록(postings)으로 들고 있고, 질의 때는 겹치는 가게만 점수를 매긴다.
+# 여러 페이지를 가져오면 타일당 가게가 수백 개라 가게마다 이름 정리 + 키워드 비교를 하는 선형 탐색 대신 이걸 쓴다.
+#
+# 검색 방식 두 가지
+# - search / best: n-gram·키워드 postings로 겹치는 가게만 점수 (포함 관계 중심, 빠름)
+# - rank / best(mode="fuzzy"): 전체 후보 코사인 유사도(NumPy) → 상위 몇 개만 자모 편집 거리로 재정렬
+#   (표기 차이 / 오타가 있어도 매칭, fuzzy_match 참고)
+import heapq
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
+
+from .fuzzy_match import NgramMatrix, jamo_similarity
+from .name_normalizer import normalize_store_name
+
+NGRAM_SIZES = (2, 3)
+
+# 점수: 이름 n-gram Dice 계수(0~1) + 포함 관계 보너스 + 키워드 겹침 비율 * 가중치
+SUBSTRING_BONUS = 1.0
+KEYWORD_WEIGHT = 0.5
+MIN_NGRAM_SCORE = 0.5  # 포함 관계 / 키워드 겹침이 없을 때 매칭으로 인정할 최소 점수
+
+# fuzzy: (코사인 + 자모 유사도) / 2 + 포함 관계 보너스 + 키워드 겹침 비율 * 가중치
+FUZZY_RERANK_TOP = 5   # 자모 편집 거리로 다시 비교할 상위 후보 수
+FUZZY_MIN_SCORE = 0.6
+
+
+def ngrams(text):
+    if len(text) < min(NGRAM_SIZES):
+        return {text} if text else set()
+    return {text[i:i + n] for n in NGRAM_SIZES for i in range(len(text) - n + 1)}
+
+
+class RestaurantIndex:
+    def __init__(self, restaurants):
+        self.restaurants = list(restaurants)
+        self._names = [r.clean_name or normalize_store_name(r.name) for r in self.restaurants]
+        self._gram_counts = []
+        self._grams = defaultdict(list)     # n-gram → [가게 번호]
+        self._keywords = defaultdict(list)  # 키워드 → [가게 번호]
+        self._matrix = None                 # fuzzy용 n-gram 벡터 (처음 rank 때 만듦)
+        for i, (name, restaurant) in enumerate(zip(self._names, self.restaurants)):
+            grams = ngrams(name)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._grams[gram].append(i)
+            for keyword in set(restaurant.keywords):
+                self._keywords[keyword].append(i)
+
+    def __len__(self):
+        return len(self.restaurants)
+
+    def search(self, store_name, keywords=(), k=5):
+        """[(점수, 가게), ...] 점수 높은 순 최대 k개 (이름 n-gram / 키워드가 하나도 안 겹치는 가게는 제외)"""
+        target = normalize_store_name(store_name)
+        target_grams = ngrams(target)
+        keywords = set(keywords or ())
+
+        shared = defaultdict(int)
+        for gram in target_grams:
+            for i in self._grams.get(gram, ()):
+                shared[i] += 1
+        keyword_hits = defaultdict(int)
+        for keyword in keywords:
+            for i in self._keywords.get(keyword, ()):
+                keyword_hits[i] += 1
+
+        scored = []
+        for i in shared.keys() | keyword_hits.keys():
+            name = self._names[i]
+            score = 2 * shared.get(i, 0) / (len(target_grams) + self._gram_counts[i]) if target_grams else 0.0
+            if target and name and (target in name or name in target):
+                score += SUBSTRING_BONUS
+            if keyword_hits.get(i):
+                score += KEYWORD_WEIGHT * keyword_hits[i] / len(keywords)
+            scored.append((score, i))
+
+        # 점수가 같으면 리스트 앞쪽 가게 (요기요 정렬 순서) 우선
+        return [(score, self.restaurants[i]) for score, i in heapq.nlargest(k, scored, key=lambda s: (s[0], -s[1]))]
+
+    def rank(self, store_name, keywords=(), k=5, rerank_top=FUZZY_RERANK_TOP):
+        """fuzzy 점수 높은 순 [(점수, 가게), ...] 최대 k개"""
+        target = normalize_store_name(store_name)
+        if not self.restaurants:
+            return []
+        keywords = set(keywords or ())
+        if self._matrix is None:
+            self._matrix = NgramMatrix(self._names)
+
+        # 1차: 전체 후보를 코사인 + 키워드 겹침으로 한 번에 점수 매기고 상위 rerank_top개만 남김
+        cosine = self._matrix.cosine(target) if target else np.zeros(len(self.restaurants), dtype=np.float32)
+        keyword_score = np.zeros(len(self.restaurants), dtype=np.float32)
+        for keyword in keywords:
+            postings = self._keywords.get(keyword)
+            if postings:
+                keyword_score[postings] += KEYWORD_WEIGHT / len(keywords)
+        rough = cosine + keyword_score
+        top = min(rerank_top, len(rough))
+        candidates = [int(i) for i in np.argpartition(-rough, top - 1)[:top] if rough[i] > 0]
+
+        # 2차: 남은 후보만 자모 편집 거리 + 포함 관계로 다시 점수
+        scored = []
+        for i in candidates:
+            name = self._names[i]
+            score = (float(cosine[i]) + jamo_similarity(target, name)) / 2 if target else 0.0
+            if target and name and (target in name or name in target):
+                score += SUBSTRING_BONUS
+            scored.append((score + float(keyword_score[i]), i))
+        return [(score, self.restaurants[i]) for score, i in heapq.nlargest(k, scored, key=lambda s: (s[0], -s[1]))]
+
+    def best(self, store_name, keywords=(), mode="index", min_score=None, rerank_top=FUZZY_RERANK_TOP):
+        """매칭으로 인정할 만한 가장 비슷한 가게, 없으면 None (mode: "index" | "fuzzy")"""
+        if mode == "fuzzy":
+            hits = self.rank(store_name, keywords, k=1, rerank_top=rerank_top)
+            min_score = FUZZY_MIN_SCORE if min_score is None else min_score
+        else:
+            hits = self.search(store_name, keywords, k=1)
+            min_score = MIN_NGRAM_SCORE if min_score is None else min_score
+        if not hits:
+            return None
+        score, restaurant = hits[0]
+        if score >= min_score or set(keywords or ()) & set(restaurant.keywords):
+            return restaurant
+        return None
+
+
+@lru_cache(maxsize=64)
+def _cached_index(restaurants):
+    return RestaurantIndex(restaurants)
+
+
+def index_for(restaurants):
+    """가게 리스트의 색인 (같은 리스트면 프로세스 안에서 재사용)"""
+    return _cached_index(tuple(restaurants))
@@ -0,0 +1,44 @@
+# restaurant_record.py
+# 요기요 가게 응답(dict)에서 실제로 쓰는 필드만 남긴 가벼운 가게 레코드.
+# 요기요 원본 dict는 필드가 수십 개라 Redis 메모리 / 피클 크기가 커서
+# 받자마자(ingestion) 한 번만 변환하고 캐시 / 템플릿 / 매칭 / 프롬프트는 모두 이걸 쓴다.
+# keywords(가게 이름 명사)는 캐시에 넣기 전에 keyword_cache.enrich_store_keywords가 채운다.
+from typing import NamedTuple, Optional
+
+from .name_normalizer import normalize_store_name
+
+# 필드(또는 clean_name 규칙)를 바꾸면 올려서 예전 형식의 캐시 항목을 읽지 않도록 함
+RESTAURANT_RECORD_VERSION = 5
+
+
+class Restaurant(NamedTuple):
+    id: Optional[int]
+    name: str
+    categories: tuple = ()
+    review_avg: Optional[float] = None
+    review_count: Optional[int] = None
+    logo_url: str = ""
+    address: str = ""
+    delivery_fee: str = ""  # delivery_fee_to_display["basic"]
+    keywords: tuple = ()    # 가게 이름에서 뽑은 명사 ('짬뽕지존-봉천점' → ('짬뽕', '지존', '봉천'))
+    clean_name: str = ""    # 비교용 이름 (normalize_store_name, '짬뽕지존-봉천점' → '짬뽕지존')
+
+    @classmethod
+    def from_yogiyo(cls, raw):
+        fee = raw.get("delivery_fee_to_display") or {}
+        name = raw.get("name") or ""
+        return cls(
+            id=raw.get("id"),
+            name=name,
+            categories=tuple(raw.get("categories") or ()),
+            review_avg=raw.get("review_avg"),
+            review_count=raw.get("review_count"),
+            logo_url=raw.get("logo_url") or "",
+            address=raw.get("address") or "",
+            delivery_fee=fee.get("basic", "") if isinstance(fee, dict) else str(fee),
+            clean_name=normalize_store_name(name),
+        )
+
+    def keyword_line(self):
+        # GPT 프롬프트용 "가게명: 키워드1, 키워드2"
+        return f"{self.name}: {', '.join(self.keywords)}"
@@ -0,0 +1,163 @@
+# semantic_cache.py
+# 비슷한 입력("매운거", "매운 음식", "매운음식 먹고싶어")끼리 추천 결과를 같이 쓰는 캐시.
+# gpt_cache는 프롬프트가 글자 하나만 달라도 미스라서, 입력을 가벼운 로컬 벡터
+# (군더더기 표현을 뺀 뒤 글자 1~3-gram을 해시해서 DIMENSIONS 칸에 담은 것)로 바꾸고
+# 같은 타일 / 같은 가게 리스트 버전에서 코사인 유사도가 THRESHOLD 이상인 이전 입력의 결과를 재사용한다.
+# 외부 임베딩 서비스는 쓰지 않는다.
+#
+# Redis 구조
+#   {KEY_PREFIX}:{namespace}:{tile}:{fetched_at}            → [[정규화 입력, 결과 키], ...] (최근 MAX_ENTRIES개)
+#   {KEY_PREFIX}:{namespace}:{tile}:{fetched_at}:{결과 키}   → 저장한 결과(dict)
+# 벡터는 저장하지 않고 정규화 입력에서 다시 계산한다 (프로세스 안에서 입력별로 기억).
+import hashlib
+import re
+import threading
+import unicodedata
+import zlib
+from functools import lru_cache
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+from .restaurant_cache import get_restaurant_cache_settings
+
+DEFAULT_SEMANTIC_CACHE_SETTINGS = {
+    "ENABLED": True,
+    "DIMENSIONS": 512,    # 해시 벡터 크기
+    "THRESHOLD": 0.85,    # 이 코사인 유사도 이상이면 같은 요청으로 봄
+    "MAX_ENTRIES": 200,   # 타일(리스트 버전)마다 기억할 입력 수
+    "KEY_PREFIX": "semantic:v1",
+}
+
+# 뜻은 안 바꾸고 표현만 다른 군더더기 (공백을 뺀 입력의 끝에서 반복해서 제거)
+FILLER_PHRASES = (
+    "먹고싶어요", "먹고싶어", "먹고싶다", "먹고싶은데", "먹을래", "먹자", "추천해줘", "추천해주세요", "추천",
+    "해줘", "주세요", "음식", "메뉴", "종류", "같은거", "같은것", "거", "것", "좀", "요",
+)
+_FILLER = re.compile("(?:" + "|".join(sorted(map(re.escape, FILLER_PHRASES), key=len, reverse=True)) + ")+$")
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stores": 0, "last_similarity": None}
+_index_sizes = {}  # 최근 본 색인 키 → 입력 수 (관측용, 이 프로세스 기준)
+_MAX_TRACKED_INDEXES = 500
+
+
+def get_semantic_cache_settings():
+    return {**DEFAULT_SEMANTIC_CACHE_SETTINGS, **getattr(settings, "SEMANTIC_CACHE", {})}
+
+
+@lru_cache(maxsize=20000)
+def normalize_input(text):
+    text = "".join(unicodedata.normalize("NFC", text or "").lower().split())
+    return _FILLER.sub("", text) or text
+
+
+@lru_cache(maxsize=20000)
+def _vector(text, dimensions):
+    vector = np.zeros(dimensions, dtype=np.float32)
+    for n in (1, 2, 3):
+        for i in range(len(text) - n + 1):
+            # crc32: 프로세스가 달라도 같은 칸 (내장 hash()는 프로세스마다 달라짐)
+            vector[zlib.crc32(text[i:i + n].encode("utf-8")) % dimensions] += 1.0
+    norm = np.linalg.norm(vector)
+    if norm:
+        vector /= norm
+    vector.setflags(write=False)
+    return vector
+
+
+def input_vector(text, dimensions=None):
+    return _vector(normalize_input(text), dimensions or get_semantic_cache_settings()["DIMENSIONS"])
+
+
+def _index_key(conf, namespace, listing):
+    return f"{conf['KEY_PREFIX']}:{namespace}:{listing.tile}:{int(listing.fetched_at or 0)}"
+
+
+def _count(name, similarity=None):
+    with _stats_lock:
+        _stats[name] += 1
+        if similarity is not None:
+            _stats["last_similarity"] = round(similarity, 4)
+
+
+def _track_size(index_key, size):
+    with _stats_lock:
+        _index_sizes.pop(index_key, None)
+        _index_sizes[index_key] = size
+        while len(_index_sizes) > _MAX_TRACKED_INDEXES:
+            _index_sizes.pop(next(iter(_index_sizes)))
+
+
+def lookup_similar(namespace, text, listing):
+    """같은 타일 / 리스트 버전에서 text와 충분히 비슷한 이전 입력의 결과(dict), 없으면 None"""
+    conf = get_semantic_cache_settings()
+    if not conf["ENABLED"] or not text or listing.tile is None:
+        return None
+    index_key = _index_key(conf, namespace, listing)
+    try:
+        index = cache.get(index_key) or []
+    except Exception:
+        return None
+    _track_size(index_key, len(index))
+    if not index:
+        _count("misses")
+        return None
+
+    query = input_vector(text, conf["DIMENSIONS"])
+    matrix = np.stack([_vector(stored, conf["DIMENSIONS"]) for stored, _ in index])
+    similarities = matrix @ query
+    best = int(np.argmax(similarities))
+    if similarities[best] < conf["THRESHOLD"]:
+        _count("misses", float(similarities[best]))
+        return None
+    try:
+        result = cache.get(f"{index_key}:{index[best][1]}")
+    except Exception:
+        result = None
+    if result is None:
+        _count("misses", float(similarities[best]))
+        return None
+    _count("hits", float(similarities[best]))
+    return result
+
+
+def store_result(namespace, text, listing, result):
+    """text의 결과를 저장. 가게 리스트가 타일 캐시에서 만료될 때 같이 만료된다."""
+    conf = get_semantic_cache_settings()
+    if not conf["ENABLED"] or not text or listing.tile is None:
+        return
+    normalized = normalize_input(text)
+    index_key = _index_key(conf, namespace, listing)
+    result_key = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+    timeout = get_restaurant_cache_settings()["HARD_TIMEOUT"]
+    try:
+        cache.set(f"{index_key}:{result_key}", result, timeout=timeout)
+        # 워커 간 동시 저장 시 한쪽 항목이 빠질 수 있지만 캐시라서 괜찮음
+        index = [entry for entry in cache.get(index_key) or [] if entry[0] != normalized]
+        index.append([normalized, result_key])
+        index = index[-conf["MAX_ENTRIES"]:]
+        cache.set(index_key, index, timeout=timeout)
+    except Exception:
+        return
+    _track_size(index_key, len(index))
+    _count("stores")
+
+
+def semantic_cache_stats():
+    conf = get_semantic_cache_settings()
+    with _stats_lock:
+        stats = dict(_stats)
+        sizes = list(_index_sizes.values())
+    lookups = stats["hits"] + stats["misses"]
+    stats.update(
+        hit_rate=round(stats["hits"] / lookups, 4) if lookups else None,
+        threshold=conf["THRESHOLD"],
+        dimensions=conf["DIMENSIONS"],
+        max_entries=conf["MAX_ENTRIES"],
+        indexes_seen=len(sizes),
+        entries_seen=sum(sizes),
+        largest_index=max(sizes, default=0),
+    )
+    return stats
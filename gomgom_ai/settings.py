@@ -35,6 +35,76 @@ CACHES = {
     }
 }
 
+# 아래 앱 설정들의 기본값은 각 모듈의 DEFAULT_*_SETTINGS에 한 곳만 있음.
+# 여기서는 환경 변수나 이 프로젝트 경로로 바꿀 키만 적고, 나머지는 필요할 때 덮어쓰기만 한다.
+
+# 외부 API(요기요, 카카오, ipinfo, OpenAI) 공용 HTTP 클라이언트 (gomgom_ai/http_client.py)
+HTTP_CLIENT = {}
+
+# 외부 호출 녹화/재생 (gomgom_ai/replay_transport.py)
+# MODE: live(실제 호출) | record(실제 호출 + 카세트 저장) | replay(카세트 재생, 네트워크 없이 벤치마크)
+# 재생 지연 예: "LATENCY": {"www.yogiyo.co.kr": {"dist": "lognormal", "median_ms": 150, "sigma": 0.4},
+#                          "api.openai.com": {"dist": "uniform", "min_ms": 1000, "max_ms": 3000}}
+OUTBOUND_HTTP = {
+    "MODE": os.getenv("OUTBOUND_HTTP_MODE", "live"),
+}
+
+# 요기요 가게 리스트 캐시 (gomgom_ai/restaurant_cache.py)
+# 좌표를 geohash 타일로 묶어서 같은 배달 구역 사용자끼리 캐시를 공유
+RESTAURANT_CACHE = {}
+
+# 요기요 가게 리스트 페이지 요청 (gomgom_ai/yogiyo_client.py)
+# 가게가 많은 지역은 "TILE_PAGES": {"wydm": 5} 처럼 geohash 접두어별로 페이지 수를 늘림
+YOGIYO_FETCH = {}
+
+# 타일별 가게 리스트 DB 스냅샷 (gomgom_ai/snapshot_store.py)
+# 개발 환경에서 SQLite 파일로 분리하려면 DATABASES["snapshots"]를 추가하고 "DATABASE": "snapshots"로
+RESTAURANT_SNAPSHOT = {}
+
+# 추천 GPT 응답 캐시 (gomgom_ai/gpt_cache.py)
+# 같은 타일 / 같은 가게 리스트 버전에서 같은 입력이면 OpenAI를 다시 부르지 않음
+GPT_CACHE = {}
+
+# 비슷한 입력끼리 추천 결과 재사용 (gomgom_ai/semantic_cache.py), 통계는 /api/semantic-cache/
+SEMANTIC_CACHE = {}
+
+# 입력 유형(기분/상황/기능/음식) 로컬 분류 (gomgom_ai/intent_classifier.py)
+# 확신도가 문턱값 미만일 때만 GPT로 분류. 모델은 manage.py train_intent_classifier 로 만듦
+INTENT_CLASSIFIER = {
+    "MODEL_FILE": BASE_DIR / "gomgom_ai" / "intent_model.json",
+}
+
+# GPT가 고른 가게 이름 → 요기요 가게 매칭 (gomgom_ai/match_gpt_result_with_yogiyo.py)
+RESTAURANT_MATCH = {}
+
+# 형태소 분석 백엔드 (gomgom_ai/tokenizer.py)
+# okt: konlpy Okt (JVM) / trie: 음식 사전 트라이로 명사만 뽑는 순수 파이썬 추출기 (JVM 없음)
+# 두 백엔드 비교는 manage.py benchmark_tokenizer, 사전 보강은 manage.py mine_store_nouns
+TOKENIZER = {
+    "BACKEND": os.getenv("TOKENIZER_BACKEND", "okt"),
+    "NOUNS_FILE": BASE_DIR / "gomgom_ai" / "store_nouns.json",
+}
+
+# 형태소 분석 워커 프로세스 풀 (gomgom_ai/tokenizer_pool.py)
+# WORKERS > 0 이면 (okt 백엔드에서) Okt/JVM을 별도 프로세스에서 돌려서 요청 스레드와 이벤트 루프를 막지 않음
+TOKENIZER_POOL = {
+    "WORKERS": int(os.getenv("TOKENIZER_POOL_WORKERS", "0")),
+}
+
+# 가게 이름 키워드(형태소 분석 결과) 캐시 (gomgom_ai/keyword_cache.py)
+KEYWORD_CACHE = {}
+
+# 요청 하나가 외부 호출에 쓸 수 있는 전체 시간(초)은 REQUEST_DEADLINE (기본값은 gomgom_ai/deadline.py)
+
+# 외부 API 서킷 브레이커 (gomgom_ai/circuit_breaker.py), 상태는 /api/breakers/
+# 이름별로 덮어씀: {"yogiyo": {"FAILURE_THRESHOLD": 5, "RECOVERY_TIMEOUT": 30.0}}
+CIRCUIT_BREAKERS = {}
+
+# 캐시 미스 때 같은 타일 요청 합치기 (gomgom_ai/singleflight.py)
+SINGLEFLIGHT = {}
+
+# 인기 타일 프리페처 (gomgom_ai/prefetch.py, manage.py prefetch_hot_tiles)
+PREFETCH = {}
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 
@@ -66,6 +136,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    'gomgom_ai.deadline.DeadlineMiddleware',  # 요청별 외부 호출 시간 예산
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -114,6 +185,8 @@ DATABASES = {
     }
 }
 
+DATABASE_ROUTERS = ['gomgom_ai.db_routers.SnapshotRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -0,0 +1,136 @@
+# singleflight.py
+# 같은 키에 대한 동시 요청을 하나로 합친다 (thundering herd 방지).
+# - 프로세스 안: 첫 호출(리더)만 실제로 실행하고 나머지 스레드/코루틴은 그 결과를 기다림
+# - 워커 간: Redis 짧은 락(cache.add)을 잡은 워커만 업스트림을 부르고,
+#   나머지 워커는 리더가 캐시에 결과를 올릴 때까지 poll로 확인
+import asyncio
+import threading
+import time
+import uuid
+import weakref
+
+from django.conf import settings
+from django.core.cache import cache
+
+DEFAULT_SINGLEFLIGHT_SETTINGS = {
+    "LOCK_TIMEOUT": 10,      # Redis 락 만료(초) - 리더 워커가 죽어도 풀리도록
+    "WAIT_TIMEOUT": 5.0,     # 다른 워커의 결과를 기다리는 최대 시간(초)
+    "POLL_INTERVAL": 0.05,   # 다른 워커 결과 확인 주기(초)
+}
+
+
+def get_singleflight_settings():
+    return {**DEFAULT_SINGLEFLIGHT_SETTINGS, **getattr(settings, "SINGLEFLIGHT", {})}
+
+
+def _lock_key(key):
+    return f"singleflight:{key}"
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+    def result(self):
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+_calls = {}
+_calls_lock = threading.Lock()
+# 이벤트 루프마다 key -> 리더 asyncio.Task
+_async_calls = weakref.WeakKeyDictionary()
+
+
+def do(key, fn, poll=None):
+    """key가 같은 동시 호출 중 하나만 fn()을 실행하고 모두 같은 결과를 받는다.
+
+    poll을 주면 워커 간에도 합친다: 락을 못 잡은 워커는 poll()이 None이 아닌 값을
+    돌려줄 때까지(보통 리더가 채운 캐시) 기다린다.
+    """
+    with _calls_lock:
+        call = _calls.get(key)
+        leader = call is None
+        if leader:
+            call = _calls[key] = _Call()
+
+    if not leader:
+        call.event.wait()
+        return call.result()
+
+    try:
+        call.value = _do_with_lock(key, fn, poll)
+    except Exception as e:
+        call.error = e
+    finally:
+        with _calls_lock:
+            _calls.pop(key, None)
+        call.event.set()
+    return call.result()
+
+
+def _do_with_lock(key, fn, poll):
+    if poll is None:
+        return fn()
+
+    conf = get_singleflight_settings()
+    token = uuid.uuid4().hex
+    if cache.add(_lock_key(key), token, timeout=conf["LOCK_TIMEOUT"]):
+        try:
+            # 락을 잡는 사이 다른 워커가 이미 채웠을 수 있음
+            value = poll()
+            return value if value is not None else fn()
+        finally:
+            if cache.get(_lock_key(key)) == token:
+                cache.delete(_lock_key(key))
+
+    # 다른 워커가 리더 - 결과가 캐시에 올라오길 기다림
+    deadline = time.monotonic() + conf["WAIT_TIMEOUT"]
+    while time.monotonic() < deadline:
+        time.sleep(conf["POLL_INTERVAL"])
+        value = poll()
+        if value is not None:
+            return value
+        if cache.get(_lock_key(key)) is None:
+            break  # 리더가 결과 없이 끝남(실패) - 직접 가져옴
+    return fn()
+
+
+async def ado(key, coro_fn, poll=None):
+    """do()의 비동기 버전. coro_fn / poll은 코루틴 함수"""
+    loop = asyncio.get_running_loop()
+    calls = _async_calls.setdefault(loop, {})
+    task = calls.get(key)
+    if task is None:
+        # 리더 작업을 별도 task로 띄워서 처음 요청한 쪽이 취소돼도 나머지는 결과를 받도록 함
+        task = calls[key] = loop.create_task(_ado_with_lock(key, coro_fn, poll))
+        task.add_done_callback(lambda _: calls.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _ado_with_lock(key, coro_fn, poll):
+    if poll is None:
+        return await coro_fn()
+
+    conf = get_singleflight_settings()
+    token = uuid.uuid4().hex
+    if await cache.aadd(_lock_key(key), token, timeout=conf["LOCK_TIMEOUT"]):
+        try:
+            value = await poll()
+            return value if value is not None else await coro_fn()
+        finally:
+            if await cache.aget(_lock_key(key)) == token:
+                await cache.adelete(_lock_key(key))
+
+    deadline = time.monotonic() + conf["WAIT_TIMEOUT"]
+    while time.monotonic() < deadline:
+        await asyncio.sleep(conf["POLL_INTERVAL"])
+        value = await poll()
+        if value is not None:
+            return value
+        if await cache.aget(_lock_key(key)) is None:
+            break
+    return await coro_fn()
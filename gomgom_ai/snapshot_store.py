@@ -0,0 +1,113 @@
+# snapshot_store.py
+# 요기요에서 가져온 타일별 가게 리스트를 DB(RestaurantSnapshot)에 남겨두고,
+# Redis 캐시가 비었거나(재시작, flush) 요기요가 죽었을 때 가까운 스냅샷으로 대신 응답한다.
+# 운영은 Postgres(default), 개발은 DATABASES["snapshots"]에 SQLite 파일을 두고
+# RESTAURANT_SNAPSHOT["DATABASE"] = "snapshots" 로 바꾸면 된다 (db_routers.SnapshotRouter).
+import logging
+import math
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from . import geotile
+from .models import RestaurantSnapshot
+from .name_normalizer import normalize_store_name
+from .restaurant_record import Restaurant
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESTAURANT_SNAPSHOT_SETTINGS = {
+    "DATABASE": "default",
+    "MAX_AGE": 60 * 60 * 24,  # 캐시가 비었을 때 이보다 오래된 스냅샷은 안 씀 (요기요 장애 땐 나이 무관)
+    "NEIGHBOR_RADIUS": 1,     # 같은 타일이 없을 때 주변 몇 타일까지 찾을지
+}
+
+
+def get_snapshot_settings():
+    return {**DEFAULT_RESTAURANT_SNAPSHOT_SETTINGS, **getattr(settings, "RESTAURANT_SNAPSHOT", {})}
+
+
+def _snapshots():
+    return RestaurantSnapshot.objects.using(get_snapshot_settings()["DATABASE"])
+
+
+def _to_json(restaurants):
+    return [list(r) for r in restaurants]
+
+
+def _from_json(rows):
+    restaurants = []
+    for row in rows:
+        r = Restaurant(*row[:len(Restaurant._fields)])
+        restaurants.append(r._replace(
+            categories=tuple(r.categories),
+            keywords=tuple(r.keywords),
+            # 저장된 값은 예전 규칙일 수 있어서 다시 계산 (이름별로 기억되므로 저렴함)
+            clean_name=normalize_store_name(r.name),
+        ))
+    return restaurants
+
+
+def save_snapshot(tile, restaurants, fetched_at=None):
+    """타일 스냅샷 저장(덮어쓰기). 실패해도 요청 흐름은 막지 않음"""
+    lat, lng = geotile.center(tile)
+    fetched_at = fetched_at or timezone.now()
+    try:
+        _snapshots().update_or_create(
+            tile=tile,
+            defaults={
+                "latitude": lat,
+                "longitude": lng,
+                "restaurants": _to_json(restaurants),
+                "restaurant_count": len(restaurants),
+                "fetched_at": fetched_at,
+            },
+        )
+    except Exception:
+        logger.exception("가게 스냅샷 저장 실패: %s", tile)
+
+
+def find_snapshot(tile, max_age=None):
+    """tile 또는 주변 타일의 가장 최근 스냅샷 → (Restaurant 리스트, fetched_at timestamp, 스냅샷 타일) / 없으면 None
+
+    같은 타일이 있으면 그걸 우선, 없으면 주변(NEIGHBOR_RADIUS 타일 이내) 중 가장 최신.
+    """
+    conf = get_snapshot_settings()
+    min_lat, min_lng, max_lat, max_lng = geotile.bounds(tile)
+    dlat = (max_lat - min_lat) * conf["NEIGHBOR_RADIUS"]
+    dlng = (max_lng - min_lng) * conf["NEIGHBOR_RADIUS"]
+
+    snapshots = _snapshots().filter(
+        latitude__gte=min_lat - dlat, latitude__lte=max_lat + dlat,
+        longitude__gte=min_lng - dlng, longitude__lte=max_lng + dlng,
+    )
+    if max_age is not None:
+        snapshots = snapshots.filter(fetched_at__gte=timezone.now() - timedelta(seconds=max_age))
+
+    try:
+        candidates = list(snapshots.order_by("-fetched_at")[:9])
+    except Exception:
+        logger.exception("가게 스냅샷 조회 실패: %s", tile)
+        return None
+    if not candidates:
+        return None
+
+    center_lat, center_lng = geotile.center(tile)
+    best = next((s for s in candidates if s.tile == tile), None) or min(
+        candidates,
+        # 최신순이 같으면 가까운 타일
+        key=lambda s: (-s.fetched_at.timestamp(), math.hypot(s.latitude - center_lat, s.longitude - center_lng)),
+    )
+    return _from_json(best.restaurants), best.fetched_at.timestamp(), best.tile
+
+
+def snapshot_store_names(limit=None):
+    """스냅샷에 저장된 가게 이름들 (중복 제거, 사전 만들기 / 분석기 벤치마크용)"""
+    names = {}
+    for rows in _snapshots().values_list("restaurants", flat=True).iterator():
+        for row in rows:
+            names[row[1]] = None
+            if limit and len(names) >= limit:
+                return list(names)
+    return list(names)
@@ -0,0 +1,64 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from gomgom_ai import deadline
+from gomgom_ai.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("t", failure_threshold=3, recovery_timeout=60)
+        for _ in range(2):
+            breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual(breaker.snapshot()["total_rejected"], 1)
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker("t", failure_threshold=2, recovery_timeout=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.snapshot()["state"], CLOSED)
+
+    def test_half_open_allows_single_trial(self):
+        breaker = CircuitBreaker("t", failure_threshold=1, recovery_timeout=10)
+        with mock.patch("gomgom_ai.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with mock.patch("gomgom_ai.circuit_breaker.time.monotonic", return_value=111.0):
+            self.assertFalse(breaker.is_open)
+            self.assertTrue(breaker.allow_request())
+            self.assertEqual(breaker.snapshot()["state"], HALF_OPEN)
+            self.assertFalse(breaker.allow_request())  # 시험 호출은 하나만
+
+    def test_half_open_trial_result(self):
+        breaker = CircuitBreaker("t", failure_threshold=1, recovery_timeout=10)
+        with mock.patch("gomgom_ai.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with mock.patch("gomgom_ai.circuit_breaker.time.monotonic", return_value=111.0):
+            breaker.allow_request()
+            breaker.record_failure()
+            self.assertEqual(breaker.snapshot()["state"], OPEN)
+        with mock.patch("gomgom_ai.circuit_breaker.time.monotonic", return_value=122.0):
+            breaker.allow_request()
+            breaker.record_success()
+            self.assertEqual(breaker.snapshot()["state"], CLOSED)
+            self.assertTrue(breaker.allow_request())
+
+
+class DeadlineTests(SimpleTestCase):
+    def test_timeout_without_deadline(self):
+        self.assertIsNone(deadline.remaining())
+        self.assertEqual(deadline.timeout_for(4.0), 4.0)
+
+    def test_timeout_capped_by_remaining_time(self):
+        token = deadline.start(0.5)
+        try:
+            self.assertLessEqual(deadline.timeout_for(4.0), 0.5)
+            self.assertEqual(deadline.timeout_for(0.1), 0.1)
+        finally:
+            deadline.reset(token)
+        self.assertIsNone(deadline.remaining())
@@ -0,0 +1,13 @@
+from django.test import SimpleTestCase
+
+from gomgom_ai.fuzzy_match import edit_distance, jamo_similarity
+
+
+class FuzzyMatchTests(SimpleTestCase):
+    def test_edit_distance(self):
+        self.assertEqual(edit_distance("kitten", "sitting"), 3)
+        self.assertEqual(edit_distance("", "abc"), 3)
+
+    def test_jamo_similarity_tolerates_typos(self):
+        self.assertGreater(jamo_similarity("떡복이", "떡볶이"), 0.85)
+        self.assertLess(jamo_similarity("떡볶이", "짜장면"), 0.5)
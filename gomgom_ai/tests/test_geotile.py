@@ -0,0 +1,19 @@
+from django.test import SimpleTestCase
+
+from gomgom_ai import geotile
+
+
+class GeotileTests(SimpleTestCase):
+    def test_encode_known_hash(self):
+        self.assertEqual(geotile.encode(42.6, -5.6, precision=5), "ezs42")
+
+    def test_center_inside_bounds(self):
+        tile = geotile.encode("37.484934", "126.981321")
+        min_lat, min_lng, max_lat, max_lng = geotile.bounds(tile)
+        lat, lng = geotile.center(tile)
+        self.assertTrue(min_lat <= 37.484934 <= max_lat and min_lng <= 126.981321 <= max_lng)
+        self.assertEqual(geotile.encode(lat, lng), tile)
+
+    def test_rejects_invalid_coordinates(self):
+        with self.assertRaises(ValueError):
+            geotile.encode(91, 0)
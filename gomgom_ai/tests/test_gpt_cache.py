@@ -0,0 +1,15 @@
+from django.test import SimpleTestCase
+
+from gomgom_ai.gpt_cache import select_candidates
+from gomgom_ai.restaurant_cache import TileListing
+from gomgom_ai.restaurant_record import Restaurant
+
+
+class SelectCandidatesTests(SimpleTestCase):
+    def test_candidates_are_deterministic(self):
+        restaurants = [Restaurant.from_yogiyo({"id": i, "name": f"가게{i}"}) for i in range(30)]
+        listing = TileListing("wydm9q", restaurants, 1000.0)
+        first = select_candidates(listing, "매운 음식", input_type="음식")
+        self.assertEqual(first, select_candidates(listing, " 매운  음식", input_type="음식"))
+        self.assertEqual(len(first), 10)
+        self.assertEqual(first, sorted(first, key=lambda r: r.clean_name))
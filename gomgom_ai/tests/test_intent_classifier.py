@@ -0,0 +1,83 @@
+import json
+
+from django.test import SimpleTestCase, TestCase
+
+from gomgom_ai.intent_classifier import (
+    DEFAULT_LABEL,
+    SOURCE_GPT,
+    SOURCE_LOCAL,
+    SOURCE_REUSED,
+    NaiveBayesModel,
+    calibrate_threshold,
+    labelled_examples,
+    predict,
+)
+from gomgom_ai.models import Recommendation
+
+
+class IntentClassifierTests(SimpleTestCase):
+    THRESHOLD = 0.7
+
+    def test_single_rule_cue_is_not_confident(self):
+        for text in ("떡볶이", "친구랑 먹을 거", "우울해"):
+            with self.subTest(text=text):
+                self.assertLess(predict(text, model=False)[1], self.THRESHOLD)
+
+    def test_unrelated_words_are_not_cues(self):
+        for text in ("속이 안 좋아", "배가 아파서 죽 먹고 싶어", "좋아하는 사람이랑"):
+            with self.subTest(text=text):
+                self.assertEqual(predict(text, model=False), (DEFAULT_LABEL, 0.0))
+
+    def test_several_agreeing_cues_are_confident(self):
+        label, confidence = predict("우울하고 짜증나", model=False)
+        self.assertEqual(label, "기분")
+        self.assertGreaterEqual(confidence, self.THRESHOLD)
+
+    def test_conflicting_cues_are_not_confident(self):
+        self.assertLess(predict("우울해서 친구랑 혼밥", model=False)[1], self.THRESHOLD)
+
+    def test_model_round_trip(self):
+        model = NaiveBayesModel.train([("우울해", "기분"), ("짜증나", "기분"), ("해장", "기능"), ("치킨", "음식")])
+        restored = NaiveBayesModel.from_json(json.loads(json.dumps(model.to_json())))
+        self.assertEqual(predict("우울해", model=restored, rule_weight=0)[0], "기분")
+        self.assertEqual(restored.log_scores("짜증"), model.log_scores("짜증"))
+        self.assertIsNone(restored.threshold)
+
+    def test_threshold_round_trip(self):
+        model = NaiveBayesModel.train([("우울해", "기분"), ("치킨", "음식")])
+        model.threshold = 0.83
+        self.assertEqual(NaiveBayesModel.from_json(json.loads(json.dumps(model.to_json()))).threshold, 0.83)
+
+
+class CalibrateThresholdTests(SimpleTestCase):
+    MODEL = NaiveBayesModel.train([("우울해", "기분"), ("짜증나", "기분"), ("해장", "기능"), ("치킨", "음식")])
+
+    def test_picks_lowest_threshold_meeting_precision(self):
+        # 확신하는 예측 20개는 다 맞고, 나머지는 반만 맞음
+        confident = [("우울하고 짜증나", "기분")] * 20
+        unsure = [("아무거나", "음식"), ("아무거나", "상황")] * 10
+        threshold = calibrate_threshold(self.MODEL, confident + unsure, 0.9, rule_weight=2.0)
+        self.assertEqual(threshold, predict("우울하고 짜증나", model=self.MODEL, rule_weight=2.0)[1])
+        self.assertGreater(threshold, predict("아무거나", model=self.MODEL, rule_weight=2.0)[1])
+
+    def test_none_without_enough_support(self):
+        self.assertIsNone(calibrate_threshold(self.MODEL, [("우울하고 짜증나", "기분")] * 5, 0.9, rule_weight=2.0))
+
+    def test_none_when_precision_unreachable(self):
+        examples = [("우울하고 짜증나", "음식")] * 30
+        self.assertIsNone(calibrate_threshold(self.MODEL, examples, 0.9, rule_weight=2.0))
+
+
+class LabelledExamplesTests(TestCase):
+    def make(self, text, types):
+        Recommendation.objects.create(
+            input_text=text, selected_types=types, recommended_store="", description="", category="", keywords=[]
+        )
+
+    def test_uses_gpt_and_legacy_labels_only(self):
+        self.make("우울해", {"input_category": "기분", "input_category_source": SOURCE_GPT})
+        self.make("해장", {"input_category": "기능"})  # source가 생기기 전 기록
+        self.make("치킨", {"input_category": "음식", "input_category_source": SOURCE_LOCAL})
+        self.make("피자", {"input_category": "음식", "input_category_source": SOURCE_REUSED})
+        self.make("아무거나", {"types": []})
+        self.assertCountEqual(labelled_examples(), [("우울해", "기분"), ("해장", "기능")])
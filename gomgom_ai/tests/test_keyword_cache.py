@@ -0,0 +1,139 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from gomgom_ai import keyword_cache
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class FakeRedis:
+    """hmget / hset만 흉내 내는 Redis 연결"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hmget(self, name, keys):
+        stored = self.hashes.get(name, {})
+        return [stored.get(key) for key in keys]
+
+    def hset(self, name, mapping):
+        self.hashes.setdefault(name, {}).update(mapping)
+
+
+class LRUTests(SimpleTestCase):
+    def test_evicts_least_recently_used(self):
+        lru = keyword_cache._LRU(2)
+        lru.set("a", ["가"])
+        lru.set("b", ["나"])
+        lru.get("a")  # a를 최근으로
+        lru.set("c", ["다"])
+        self.assertEqual(lru.get("a"), ["가"])
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.get("c"), ["다"])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, KEYWORD_CACHE={"REDIS_HASH": "test_keywords"})
+class KeywordCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.object(keyword_cache, "_local", keyword_cache._LRU(100))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _extract(self):
+        return mock.Mock(side_effect=lambda names: [[f"{n}-키워드"] for n in names])
+
+    def test_analyses_only_missing_names_once(self):
+        extract = self._extract()
+        with mock.patch.object(keyword_cache, "_redis", return_value=None):
+            first = keyword_cache.get_many_store_keywords(["엽기떡볶이", "교촌치킨", "엽기떡볶이"], extract, "trie")
+            second = keyword_cache.get_many_store_keywords(["교촌치킨", "BBQ"], extract, "trie")
+        self.assertEqual(first["엽기떡볶이"], ["엽기떡볶이-키워드"])
+        self.assertEqual(second["BBQ"], ["BBQ-키워드"])
+        self.assertEqual([c.args[0] for c in extract.call_args_list], [["엽기떡볶이", "교촌치킨"], ["BBQ"]])
+
+    def test_empty_results_are_not_remembered(self):
+        extract = mock.Mock(side_effect=lambda names: [[] for _ in names])
+        redis = FakeRedis()
+        with mock.patch.object(keyword_cache, "_redis", return_value=redis):
+            keyword_cache.get_many_store_keywords(["BBQ"], extract, "trie")
+            keyword_cache.get_many_store_keywords(["BBQ"], extract, "trie")
+        self.assertEqual(extract.call_count, 2)
+        self.assertEqual(redis.hashes, {})
+
+    def test_tokenizer_failure_reports_not_enriched(self):
+        from gomgom_ai.restaurant_record import Restaurant
+        from gomgom_ai.tokenizer import TokenizerUnavailable
+
+        restaurants = [Restaurant.from_yogiyo({"id": 1, "name": "엽기떡볶이 봉천점"})]
+        tokenizer = mock.Mock(name="trie", store_keywords_batch=mock.Mock(side_effect=TokenizerUnavailable("busy")))
+        with mock.patch.object(keyword_cache, "get_tokenizer", return_value=tokenizer), \
+                mock.patch.object(keyword_cache, "_redis", return_value=None):
+            enriched, ok = keyword_cache.enrich_store_keywords(restaurants)
+        self.assertFalse(ok)
+        self.assertEqual(enriched, restaurants)
+
+    def test_name_is_normalised(self):
+        extract = self._extract()
+        with mock.patch.object(keyword_cache, "_redis", return_value=None):
+            keyword_cache.get_many_store_keywords(["엽기  떡볶이 "], extract, "trie")
+            result = keyword_cache.get_many_store_keywords(["엽기 떡볶이"], extract, "trie")
+        self.assertEqual(result, {"엽기 떡볶이": ["엽기 떡볶이-키워드"]})
+        extract.assert_called_once()
+
+    def test_redis_hash_write_through_and_read_back(self):
+        redis = FakeRedis()
+        extract = self._extract()
+        with mock.patch.object(keyword_cache, "_redis", return_value=redis):
+            keyword_cache.get_many_store_keywords(["엽기떡볶이"], extract, "okt")
+            self.assertIn("엽기떡볶이", redis.hashes["test_keywords:okt"])
+            # 다른 워커(빈 LRU)도 Redis 해시에서 읽고 다시 분석하지 않음
+            with mock.patch.object(keyword_cache, "_local", keyword_cache._LRU(100)):
+                result = keyword_cache.get_many_store_keywords(["엽기떡볶이"], extract, "okt")
+        self.assertEqual(result, {"엽기떡볶이": ["엽기떡볶이-키워드"]})
+        extract.assert_called_once()
+
+    def test_locmem_fallback_is_shared(self):
+        extract = self._extract()
+        with mock.patch.object(keyword_cache, "_redis", return_value=None):
+            keyword_cache.get_many_store_keywords(["교촌치킨"], extract, "okt")
+            with mock.patch.object(keyword_cache, "_local", keyword_cache._LRU(100)):
+                result = keyword_cache.get_many_store_keywords(["교촌치킨"], extract, "okt")
+        self.assertEqual(result, {"교촌치킨": ["교촌치킨-키워드"]})
+        extract.assert_called_once()
+
+    def test_namespaces_are_isolated(self):
+        redis = FakeRedis()
+        okt = mock.Mock(side_effect=lambda names: [["okt"] for _ in names])
+        trie = mock.Mock(side_effect=lambda names: [["trie"] for _ in names])
+        with mock.patch.object(keyword_cache, "_redis", return_value=redis):
+            self.assertEqual(keyword_cache.get_many_store_keywords(["가게"], okt, "okt"), {"가게": ["okt"]})
+            self.assertEqual(keyword_cache.get_many_store_keywords(["가게"], trie, "trie"), {"가게": ["trie"]})
+        self.assertEqual(set(redis.hashes), {"test_keywords:okt", "test_keywords:trie"})
+
+    def test_redis_failure_still_analyses(self):
+        class BrokenRedis:
+            def hmget(self, name, keys):
+                raise ConnectionError("down")
+
+            def hset(self, name, mapping):
+                raise ConnectionError("down")
+
+        extract = self._extract()
+        with mock.patch.object(keyword_cache, "_redis", return_value=BrokenRedis()):
+            result = keyword_cache.get_many_store_keywords(["가게"], extract, "okt")
+        self.assertEqual(result, {"가게": ["가게-키워드"]})
+
+    async def test_async_lookup_uses_same_cache(self):
+        extract = self._extract()
+
+        async def aextract(names):
+            return extract(names)
+
+        with mock.patch.object(keyword_cache, "_redis", return_value=None):
+            keyword_cache.get_many_store_keywords(["가게"], extract, "okt")
+            result = await keyword_cache.aget_many_store_keywords(["가게", "새가게"], aextract, "okt")
+        self.assertEqual(result, {"가게": ["가게-키워드"], "새가게": ["새가게-키워드"]})
+        self.assertEqual([c.args[0] for c in extract.call_args_list], [["가게"], ["새가게"]])
@@ -0,0 +1,28 @@
+from django.test import SimpleTestCase
+
+from gomgom_ai.keyword_matcher import SEP, KeywordMatcher, compile_matcher
+
+
+class KeywordMatcherTests(SimpleTestCase):
+    def test_finds_overlapping_patterns(self):
+        matcher = KeywordMatcher(["he", "she", "his", "hers"])
+        self.assertEqual(matcher.find("ushers"), {"he", "she", "hers"})
+        self.assertTrue(matcher.matches("this"))
+        self.assertFalse(matcher.matches("xyz"))
+
+    def test_patterns_are_lowercased(self):
+        self.assertEqual(KeywordMatcher(["BBQ"]).find("bbq치킨"), {"bbq"})
+
+    def test_whole_words(self):
+        matcher = KeywordMatcher(["떡볶이", "치킨"])
+        text = SEP.join(("엽기떡볶이", "치킨"))
+        self.assertEqual(matcher.find(text), {"떡볶이", "치킨"})
+        self.assertEqual(matcher.find(text, whole_words=True), {"치킨"})
+
+    def test_empty_matcher(self):
+        matcher = KeywordMatcher(["", None])
+        self.assertFalse(matcher)
+        self.assertFalse(matcher.matches("아무거나"))
+
+    def test_compiled_once(self):
+        self.assertIs(compile_matcher(["a", "b"]), compile_matcher(("a", "b")))
@@ -0,0 +1,37 @@
+from django.test import SimpleTestCase
+
+from gomgom_ai.name_normalizer import normalize_store_name
+
+
+class NormalizeStoreNameTests(SimpleTestCase):
+    def test_strips_branch_suffix(self):
+        for name in ("엽기 떡볶이 (봉천점)", "엽기떡볶이-봉천점", "엽기떡볶이 [서울대입구역점]", "엽기떡볶이 본점", "엽기떡볶이"):
+            with self.subTest(name=name):
+                self.assertEqual(normalize_store_name(name), "엽기떡볶이")
+
+    def test_keeps_names_ending_in_jeom(self):
+        cases = {
+            "홍콩 반점": "홍콩반점",
+            "만리장성 반점": "만리장성반점",
+            "행복 분식점": "행복분식점",
+            "돈까스 전문점": "돈까스전문점",
+            "만리장성 반점 (봉천점)": "만리장성반점",
+        }
+        for name, expected in cases.items():
+            with self.subTest(name=name):
+                self.assertEqual(normalize_store_name(name), expected)
+
+    def test_strips_city_branches(self):
+        # 주점 / 상점 / 만점이 목록에 있어도 "전주점" 같은 지명 + 점은 지점
+        for branch in ("전주점", "제주점", "청주점", "광주점", "상주점"):
+            with self.subTest(branch=branch):
+                self.assertEqual(normalize_store_name(f"교촌치킨 {branch}"), "교촌치킨")
+                self.assertEqual(normalize_store_name(f"교촌치킨({branch})"), "교촌치킨")
+
+    def test_keeps_compound_name_endings(self):
+        self.assertEqual(normalize_store_name("중화요리 대박반점"), "중화요리대박반점")
+        self.assertEqual(normalize_store_name("신당동 떡볶이전문점"), "신당동떡볶이전문점")
+
+    def test_punctuation_and_case(self):
+        self.assertEqual(normalize_store_name("BBQ 치킨!"), "bbq치킨")
+        self.assertEqual(normalize_store_name(""), "")
@@ -0,0 +1,41 @@
+import json
+import time
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from gomgom_ai.restaurant_cache import TileListing
+from gomgom_ai.restaurant_record import Restaurant
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, ALLOWED_HOSTS=["localhost"])
+class RecommendResultPipelineTests(SimpleTestCase):
+    def test_semantic_hit_does_not_wait_for_gpt_classification(self):
+        from gomgom_ai import views
+
+        restaurant = Restaurant.from_yogiyo({"id": 1, "name": "엽기떡볶이 봉천점", "categories": ["분식"]})
+        reused = {
+            "input_type": "음식",
+            "content": json.dumps({"store": "엽기떡볶이 봉천점", "description": "", "category": "분식", "keywords": []}),
+        }
+
+        def slow_gpt(text):
+            time.sleep(1.0)
+            return "음식"
+
+        with mock.patch.object(views, "classify_locally", return_value=("음식", True)), \
+                mock.patch.object(views, "classify_user_input_with_gpt", side_effect=slow_gpt), \
+                mock.patch.object(views, "get_tile_listing", return_value=TileListing("wydm9q", [restaurant], 1.0)), \
+                mock.patch.object(views, "lookup_similar", return_value=reused), \
+                mock.patch.object(views, "Recommendation") as recommendation:
+            request = RequestFactory(HTTP_HOST="localhost").get("/recommend_result/", {"text": "떡볶이"})
+            started = time.perf_counter()
+            response = views.recommend_result(request)
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLess(elapsed, 0.5)
+        selected_types = recommendation.objects.create.call_args.kwargs["selected_types"]
+        self.assertEqual(selected_types["input_category_source"], "reused")
@@ -0,0 +1,34 @@
+import tempfile
+
+import httpx
+from django.test import SimpleTestCase
+
+from gomgom_ai.replay_transport import DEFAULT_OUTBOUND_HTTP_SETTINGS, RecordingTransport, ReplayTransport
+
+
+class RecordReplayTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.conf = {**DEFAULT_OUTBOUND_HTTP_SETTINGS, "CASSETTE_DIR": tmp.name}
+
+    def chat(self, client, prompt):
+        return client.post(
+            "https://api.openai.com/v1/chat/completions",
+            json={"model": "gpt-3.5-turbo", "messages": [{"role": "user", "content": prompt}]},
+        ).json()
+
+    def test_recorded_prompts_replay_to_their_own_response(self):
+        def upstream(request):
+            prompt = request.content.decode()
+            return httpx.Response(200, json={"answer": "분류" if "어떤 종류" in prompt else "추천"})
+
+        with httpx.Client(transport=RecordingTransport(self.conf, httpx.MockTransport(upstream))) as client:
+            self.chat(client, "이 문장은 어떤 종류에 해당하나요?\n우울해")
+            self.chat(client, "가게 목록 중에서 하나 골라주세요")
+            client.get("https://www.yogiyo.co.kr/api/v1/restaurants")
+
+        with httpx.Client(transport=ReplayTransport(self.conf)) as client:
+            self.assertEqual(self.chat(client, "가게 목록 중에서 하나 골라주세요"), {"answer": "추천"})
+            self.assertEqual(self.chat(client, "이 문장은 어떤 종류에 해당하나요?\n우울해"), {"answer": "분류"})
+            self.assertEqual(client.get("https://www.yogiyo.co.kr/api/v1/restaurants").status_code, 200)
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from gomgom_ai import restaurant_cache
+from gomgom_ai.restaurant_cache import aget_tile_listing, tile_cache_key, tile_for
+from gomgom_ai.restaurant_record import Restaurant
+from gomgom_ai.yogiyo_client import YogiyoPages
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+LAT, LNG = 37.484934, 126.981321
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StaleRefreshTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_async_refresh_outlives_request_loop(self):
+        tile = tile_for(LAT, LNG)
+        stale = {"restaurants": [], "fetched_at": time.time() - 600, "fresh_until": 0}
+        cache.set(tile_cache_key(tile), stale)
+        loaded = threading.Event()
+
+        def slow_load(tile, key, conf):
+            time.sleep(0.2)
+            loaded.set()
+
+        with mock.patch.object(restaurant_cache, "_load_tile", side_effect=slow_load):
+            # asyncio.run은 끝날 때 남은 task를 취소하므로, 루프에 걸린 갱신이면 여기서 사라짐
+            listing = asyncio.run(aget_tile_listing(LAT, LNG))
+            self.assertEqual(listing.fetched_at, stale["fetched_at"])
+            self.assertTrue(loaded.wait(2))
+        key = tile_cache_key(tile)
+        waited = time.monotonic() + 2
+        while key in restaurant_cache._refreshing and time.monotonic() < waited:  # finally 블록까지 끝나길 기다림
+            time.sleep(0.01)
+        self.assertNotIn(key, restaurant_cache._refreshing)
+        self.assertIsNone(cache.get(restaurant_cache._refresh_lock_key(key)))
+
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PartialListingTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.tile = tile_for(LAT, LNG)
+        self.key = tile_cache_key(self.tile)
+        self.conf = restaurant_cache.get_restaurant_cache_settings()
+        self.restaurants = [Restaurant.from_yogiyo({"id": 1, "name": "엽기떡볶이 봉천점"})]
+
+    def load(self, pages, enriched=True):
+        with mock.patch.object(restaurant_cache, "get_yogiyo_restaurant_pages", return_value=pages), \
+                mock.patch.object(restaurant_cache, "enrich_store_keywords", side_effect=lambda rs: (rs, enriched)), \
+                mock.patch.object(restaurant_cache, "save_snapshot") as save_snapshot, \
+                mock.patch.object(restaurant_cache.cache, "set", wraps=cache.set) as cache_set:
+            listing = restaurant_cache._load_tile(self.tile, self.key, self.conf)
+        return listing, save_snapshot, cache_set
+
+    def test_partial_listing_is_short_lived_and_not_snapshotted(self):
+        listing, save_snapshot, cache_set = self.load(YogiyoPages(self.restaurants, complete=False))
+        self.assertEqual(listing.restaurants, self.restaurants)
+        self.assertEqual(cache_set.call_args.kwargs["timeout"], self.conf["PARTIAL_TIMEOUT"])
+        self.assertTrue(restaurant_cache._is_stale(cache.get(self.key)))
+        save_snapshot.assert_not_called()
+
+    def test_complete_listing_is_cached_and_snapshotted(self):
+        _, save_snapshot, cache_set = self.load(YogiyoPages(self.restaurants, complete=True))
+        self.assertEqual(cache_set.call_args.kwargs["timeout"], self.conf["HARD_TIMEOUT"])
+        self.assertFalse(restaurant_cache._is_stale(cache.get(self.key)))
+        save_snapshot.assert_called_once()
+
+    def test_listing_without_keywords_is_short_lived(self):
+        _, save_snapshot, cache_set = self.load(YogiyoPages(self.restaurants, complete=True), enriched=False)
+        self.assertEqual(cache_set.call_args.kwargs["timeout"], self.conf["PARTIAL_TIMEOUT"])
+        self.assertTrue(cache.get(self.key)["partial"])
+        save_snapshot.assert_not_called()
+
+    def test_partial_refresh_keeps_full_stale_listing(self):
+        full = restaurant_cache._make_entry(self.restaurants * 2, self.conf)
+        cache.set(self.key, full)
+        listing, _, _ = self.load(YogiyoPages(self.restaurants, complete=False))
+        self.assertEqual(len(listing.restaurants), 2)
+        self.assertEqual(cache.get(self.key)["restaurants"], full["restaurants"])
@@ -0,0 +1,8 @@
+from django.test import SimpleTestCase
+
+from gomgom_ai.semantic_cache import normalize_input
+
+
+class NormalizeInputTests(SimpleTestCase):
+    def test_semantic_input_drops_filler(self):
+        self.assertEqual(normalize_input("매운 음식 먹고싶어"), normalize_input("매운거"))
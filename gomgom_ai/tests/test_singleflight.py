@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from gomgom_ai import singleflight
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def run_threads(count, target):
+    results = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    return threads, results
+
+
+@override_settings(CACHES=LOCMEM_CACHES, SINGLEFLIGHT={"POLL_INTERVAL": 0.01, "WAIT_TIMEOUT": 1.0})
+class SingleflightTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _blocking(self, result):
+        # 리더가 fn 안에 있는 동안 나머지 호출이 들어오도록 release 전까지 막아둠
+        calls = []
+        started, release = threading.Event(), threading.Event()
+
+        def fn():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return result()
+
+        return fn, calls, started, release
+
+    def test_concurrent_calls_collapse(self):
+        fn, calls, started, release = self._blocking(lambda: 42)
+        leader, leader_result = run_threads(1, lambda: singleflight.do("k", fn))
+        started.wait(2)
+        followers, results = run_threads(5, lambda: singleflight.do("k", fn))
+        time.sleep(0.1)
+        release.set()
+        for t in leader + followers:
+            t.join(2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(leader_result + results, [42] * 6)
+
+    def test_exception_reaches_every_waiter(self):
+        def boom():
+            raise ValueError("upstream")
+
+        fn, calls, started, release = self._blocking(boom)
+        leader, leader_result = run_threads(1, lambda: singleflight.do("k", fn))
+        started.wait(2)
+        followers, results = run_threads(3, lambda: singleflight.do("k", fn))
+        time.sleep(0.1)
+        release.set()
+        for t in leader + followers:
+            t.join(2)
+        self.assertEqual(len(calls), 1)
+        for error in leader_result + results:
+            self.assertIsInstance(error, ValueError)
+
+    def test_key_is_released_after_call(self):
+        self.assertEqual(singleflight.do("k", lambda: 1), 1)
+        self.assertEqual(singleflight.do("k", lambda: 2), 2)
+
+    def test_waits_for_other_worker_holding_lock(self):
+        cache.add(singleflight._lock_key("k"), "other-worker")
+        polled = []
+
+        def poll():
+            polled.append(1)
+            return "from-cache" if len(polled) >= 3 else None
+
+        fn = mock.Mock(return_value="fetched")
+        self.assertEqual(singleflight.do("k", fn, poll=poll), "from-cache")
+        fn.assert_not_called()
+
+    def test_leader_releases_lock(self):
+        fn = mock.Mock(return_value="fetched")
+        self.assertEqual(singleflight.do("k", fn, poll=lambda: None), "fetched")
+        fn.assert_called_once()
+        self.assertIsNone(cache.get(singleflight._lock_key("k")))
+
+    async def test_async_calls_collapse(self):
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        results = await asyncio.gather(*(singleflight.ado("k", fn) for _ in range(5)))
+        self.assertEqual(results, ["ok"] * 5)
+        self.assertEqual(len(calls), 1)
+
+    async def test_async_exception_propagates(self):
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream")
+
+        results = await asyncio.gather(*(singleflight.ado("k", fn) for _ in range(3)), return_exceptions=True)
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
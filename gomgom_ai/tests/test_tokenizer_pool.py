@@ -0,0 +1,37 @@
+import asyncio
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from gomgom_ai.tokenizer import TokenizerService, TokenizerUnavailable
+
+
+class TokenizerPoolFailureTests(SimpleTestCase):
+    class _FullPool:
+        ready_workers = 0
+
+        def pos_batch(self, texts):
+            raise TimeoutError("full")
+
+        async def apos_batch(self, texts):
+            raise TimeoutError("full")
+
+        def stats(self):
+            return {}
+
+    def test_pool_failure_is_an_error_by_default(self):
+        service = TokenizerService()
+        service.use_pool(self._FullPool())
+        with self.assertRaises(TokenizerUnavailable):
+            service.pos_batch(["엽기떡볶이"])
+        with self.assertRaises(TokenizerUnavailable):
+            asyncio.run(service.apos_batch(["엽기떡볶이"]))
+        self.assertEqual(service.stats()["pool_errors"], 2)
+
+    def test_local_fallback_is_opt_in(self):
+        service = TokenizerService()
+        service.use_pool(self._FullPool(), local_fallback=True)
+        with mock.patch.object(service, "_pos_batch_local", return_value=[[("엽기", "Noun")]]) as local, \
+                self.assertLogs("gomgom_ai.tokenizer", "WARNING"):
+            self.assertEqual(service.pos_batch(["엽기"]), [[("엽기", "Noun")]])
+        local.assert_called_once()
@@ -0,0 +1,47 @@
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from gomgom_ai import deadline, yogiyo_client
+
+
+def page_of(page, count):
+    return {"restaurants": [{"id": page * 100 + i, "name": f"가게{page}-{i}"} for i in range(count)]}
+
+
+class RestaurantPagesTests(SimpleTestCase):
+    def test_page_timeout_counts_time_queued(self):
+        seen = []
+
+        def fake_page(lat, lng, page=0, timeout=None):
+            seen.append(yogiyo_client._call_timeout())
+            return []
+
+        executor = yogiyo_client._get_page_executor(1)
+        executor.submit(time.sleep, 0.3)  # 공유 풀을 잠깐 막아둠
+        token = deadline.start(1.0)
+        try:
+            with mock.patch.object(yogiyo_client, "_get_page", fake_page), \
+                    override_settings(YOGIYO_FETCH={"MAX_CONCURRENCY": 1}):
+                yogiyo_client.get_yogiyo_restaurant_pages(37.48, 126.98, pages=1)
+        finally:
+            deadline.reset(token)
+        self.assertEqual(len(seen), 1)
+        self.assertLess(seen[0], 0.8)
+
+    @override_settings(YOGIYO_FETCH={"ITEMS_PER_PAGE": 2, "MAX_CONCURRENCY": 2})
+    def test_failed_page_marks_listing_incomplete(self):
+        pages = {0: page_of(0, 2), 1: None, 2: page_of(2, 2)}
+        with mock.patch.object(yogiyo_client, "_get_page", lambda lat, lng, page=0: pages[page]):
+            listing = yogiyo_client.get_yogiyo_restaurant_pages(37.48, 126.98, pages=3)
+        self.assertFalse(listing.complete)
+        self.assertEqual([r.id for r in listing.restaurants], [0, 1])
+
+    @override_settings(YOGIYO_FETCH={"ITEMS_PER_PAGE": 2, "MAX_CONCURRENCY": 1})
+    def test_short_last_page_is_complete(self):
+        pages = {0: page_of(0, 2), 1: page_of(1, 1)}
+        with mock.patch.object(yogiyo_client, "_get_page", lambda lat, lng, page=0: pages[page]):
+            listing = yogiyo_client.get_yogiyo_restaurant_pages(37.48, 126.98, pages=3)
+        self.assertTrue(listing.complete)
+        self.assertEqual(len(listing.restaurants), 3)
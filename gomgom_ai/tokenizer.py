@@ -0,0 +1,292 @@
+# tokenizer.py
+# 프로세스 전체가 같이 쓰는 형태소 분석기(Okt) 서비스.
+# views.py와 match_gpt_result_with_yogiyo.py가 각자 Okt()를 만들던 것을 여기 하나로 모음.
+# Okt는 JPype로 JVM을 부르기 때문에 요청 스레드 / 스레드풀에서 쓰기 전에 JVM에 붙여야(attach) 한다.
+# TOKENIZER_POOL["WORKERS"] > 0 이면 분석은 tokenizer_pool의 워커 프로세스에서 하고
+# 이 프로세스에서는 JVM을 띄우지 않는다. 풀이 꽉 찼거나 응답이 없으면 TokenizerUnavailable을 내고
+# (TOKENIZER_POOL["LOCAL_FALLBACK"]=True일 때만 이 프로세스에서 직접 분석).
+# 워커 프로세스에서도 import하므로 이 모듈은 Django 설정에 의존하지 않는다.
+#
+# 백엔드는 TOKENIZER["BACKEND"]로 고름: "okt"(TokenizerService) | "trie"(noun_trie.HangulTrieTokenizer, JVM 없음)
+# 두 백엔드 모두 get_tokenizer()가 돌려주고 다음을 제공한다:
+#   name, nouns(text), store_keywords(name), store_keywords_batch(names),
+#   astore_keywords_batch(names), warm_up(), is_ready, stats()
+#
+# 분석기(JVM)는 처음 쓸 때 또는 start_warm_up()이 불릴 때만 만든다.
+# 웹 워커는 asgi.py / wsgi.py가 TOKENIZER_WARM_UP=1을 켜서 TasteConfig.ready()에서 백그라운드로 데우고,
+# manage.py 명령(migrate 등)은 이 값이 없으므로 JVM을 띄우지 않는다.
+# gunicorn --preload처럼 fork 전에 앱을 올리는 경우엔 fork 뒤(post_fork 훅)에서 start_warm_up()을 부를 것.
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 여러 가게 이름을 한 번에 분석할 때 이름 사이에 끼우는 구분자.
+# Okt는 영문 덩어리를 Alpha 토큰 하나로 돌려주므로 결과에서 이 토큰으로 다시 나눌 수 있다.
+BATCH_SENTINEL = "QXBATCHSEPQX"
+BATCH_MAX_NAMES = 200  # JVM 호출 한 번에 넣을 최대 이름 수
+
+DEFAULT_TOKENIZER_SETTINGS = {
+    "BACKEND": "okt",
+    "NOUNS_FILE": None,  # mine_store_nouns 결과 파일 (trie 백엔드 사전에 추가)
+    "WARM_UP_ROUNDS": 20,  # 워밍업 때 샘플 이름을 몇 번 분석할지 (JIT 워밍업)
+    "WARM_UP_TIMEOUT": 60.0,  # 풀 워커가 준비될 때까지 기다릴 시간(초)
+}
+
+
+
+class TokenizerUnavailable(RuntimeError):
+    """분석 워커 풀이 가득 찼거나 TIMEOUT 안에 응답하지 않음"""
+
+
+WARM_UP_TEXTS = ["짬뽕지존-봉천점", "엽기떡볶이 봉천점", "교촌치킨 서울대입구점", "매운 음식 먹고 싶어"]
+
+
+class TokenizerService:
+    name = "okt"
+
+    def __init__(self):
+        self._okt = None
+        self._pool = None
+        self._local_fallback = False
+        self._init_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._attached = threading.local()
+        self._stats = {
+            "calls": 0,         # 분석기 호출 수 (JVM 왕복 수)
+            "texts": 0,         # 분석한 문자열 수
+            "total_seconds": 0.0,
+            "errors": 0,
+            "threads_attached": 0,
+            "init_seconds": None,
+            "pool_errors": 0,   # 풀이 가득 참 / 응답 없음
+        }
+
+    def _analyser(self):
+        if self._okt is None:
+            with self._init_lock:
+                if self._okt is None:
+                    from konlpy.tag import Okt  # JVM은 처음 쓸 때 띄움
+
+                    started = time.perf_counter()
+                    self._okt = Okt()
+                    self._stats["init_seconds"] = round(time.perf_counter() - started, 3)
+        self._attach_thread()
+        return self._okt
+
+    def _attach_thread(self):
+        # JVM을 띄운 스레드가 아닌 곳(ThreadPoolExecutor 등)에서 부를 때 스레드를 JVM에 붙임
+        if getattr(self._attached, "done", False):
+            return
+        import jpype
+
+        if jpype.isJVMStarted() and not jpype.java.lang.Thread.isAttached():
+            jpype.java.lang.Thread.attachAsDaemon()  # 데몬으로 붙여야 종료 시 JVM이 안 기다림
+            with self._stats_lock:
+                self._stats["threads_attached"] += 1
+        self._attached.done = True
+
+    def _record(self, started, texts, failed=False):
+        with self._stats_lock:
+            self._stats["calls"] += 1
+            self._stats["texts"] += texts
+            self._stats["total_seconds"] += time.perf_counter() - started
+            if failed:
+                self._stats["errors"] += 1
+
+    def use_pool(self, pool, local_fallback=False):
+        self._pool = pool
+        self._local_fallback = local_fallback
+
+    def _pool_failed(self, error):
+        # 기본은 에러로 알림: 여기서 JVM을 띄우면 분석을 프로세스 밖으로 뺀 의미가 없어짐
+        with self._stats_lock:
+            self._stats["pool_errors"] += 1
+        if not self._local_fallback:
+            raise TokenizerUnavailable(f"tokenizer pool 응답 없음: {error!r}") from error
+        logger.warning("tokenizer pool 응답 없음 - 프로세스 안에서 분석", exc_info=error)
+
+    def pos(self, text):
+        """[(단어, 품사), ...]"""
+        if self._pool is not None:
+            return self.pos_batch([text])[0]
+        return self._pos_local(text)
+
+    def _pos_local(self, text):
+        okt = self._analyser()
+        started = time.perf_counter()
+        try:
+            result = okt.pos(text)
+        except Exception:
+            self._record(started, 1, failed=True)
+            raise
+        self._record(started, 1)
+        return result
+
+    def nouns(self, text):
+        return [w for w, pos in self.pos(text) if pos == "Noun"]
+
+    def store_keywords(self, name):
+        # '짬뽕지존-봉천점' → ['짬뽕', '지존', '봉천'] (두 글자 이상 명사만)
+        return [w for w, pos in self.pos(name) if pos == "Noun" and len(w) > 1]
+
+    def pos_batch(self, texts):
+        """여러 문자열을 구분자로 이어 붙여 JVM 호출 한 번(BATCH_MAX_NAMES개씩)으로 분석.
+        구분자가 예상대로 안 나뉘면 그 묶음만 하나씩 다시 분석한다."""
+        if self._pool is not None and texts:
+            try:
+                return self._pool.pos_batch(texts)
+            except Exception as e:
+                self._pool_failed(e)
+        return self._pos_batch_local(texts)
+
+    def _pos_batch_local(self, texts):
+        results = []
+        for start in range(0, len(texts), BATCH_MAX_NAMES):
+            chunk = texts[start:start + BATCH_MAX_NAMES]
+            results.extend(self._pos_chunk(chunk))
+        return results
+
+    def _pos_chunk(self, texts):
+        if len(texts) == 1:
+            return [self._pos_local(texts[0])]
+
+        okt = self._analyser()
+        joined = f" {BATCH_SENTINEL} ".join(t.replace(BATCH_SENTINEL, " ") for t in texts)
+        started = time.perf_counter()
+        try:
+            tokens = okt.pos(joined)
+        except Exception:
+            self._record(started, len(texts), failed=True)
+            raise
+        self._record(started, len(texts))
+
+        groups = [[]]
+        for word, tag in tokens:
+            if word == BATCH_SENTINEL:
+                groups.append([])
+            else:
+                groups[-1].append((word, tag))
+        if len(groups) != len(texts):
+            return [self._pos_local(t) for t in texts]
+        return groups
+
+    def store_keywords_batch(self, names):
+        """[가게 이름, ...] → [[키워드, ...], ...] (store_keywords의 묶음 버전)"""
+        return [
+            [w for w, pos in tokens if pos == "Noun" and len(w) > 1]
+            for tokens in self.pos_batch(names)
+        ]
+
+    async def apos_batch(self, texts):
+        """이벤트 루프를 막지 않는 pos_batch (풀이 있으면 풀, 없으면 스레드에서 분석)"""
+        if self._pool is not None and texts:
+            try:
+                return await self._pool.apos_batch(texts)
+            except Exception as e:
+                self._pool_failed(e)
+        return await asyncio.to_thread(self._pos_batch_local, texts)
+
+    async def astore_keywords_batch(self, names):
+        return [
+            [w for w, pos in tokens if pos == "Noun" and len(w) > 1]
+            for tokens in await self.apos_batch(names)
+        ]
+
+    def warm_up(self, rounds=20, timeout=60.0):
+        """JVM을 띄우고 샘플 이름을 반복 분석해서 JIT까지 데워둠 (풀이면 워커가 준비될 때까지 기다림)"""
+        if self._pool is not None:
+            self._pool.wait_ready(timeout)
+            self.pos_batch(WARM_UP_TEXTS)
+            return
+        for _ in range(rounds):
+            self._pos_chunk(WARM_UP_TEXTS)
+
+    @property
+    def is_ready(self):
+        return self._okt is not None or (self._pool is not None and self._pool.ready_workers > 0)
+
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["backend"] = self.name
+        stats["ready"] = self.is_ready
+        stats["avg_ms"] = round(stats["total_seconds"] / stats["calls"] * 1000, 3) if stats["calls"] else None
+        stats["total_seconds"] = round(stats["total_seconds"], 3)
+        stats["pool"] = self._pool.stats() if self._pool is not None else None
+        return stats
+
+
+_tokenizer = None
+_configure_lock = threading.Lock()
+_warm_up = {"state": "cold", "seconds": None, "error": None}  # cold → warming → ready | failed
+
+
+def get_tokenizer():
+    global _tokenizer
+    if _tokenizer is None:
+        with _configure_lock:
+            if _tokenizer is None:
+                _tokenizer = _build_tokenizer()
+    return _tokenizer
+
+
+def _build_tokenizer():
+    # 웹 프로세스에서만 호출됨: TOKENIZER 설정으로 백엔드를 고르고, okt면 TOKENIZER_POOL 워커 풀을 붙임
+    import atexit
+
+    from django.conf import settings
+    from django.core.exceptions import ImproperlyConfigured
+
+    conf = {**DEFAULT_TOKENIZER_SETTINGS, **getattr(settings, "TOKENIZER", {})}
+    if conf["BACKEND"] == "trie":
+        from .noun_trie import HangulTrieTokenizer
+
+        return HangulTrieTokenizer(nouns_file=conf["NOUNS_FILE"])
+    if conf["BACKEND"] != "okt":
+        raise ImproperlyConfigured(f"알 수 없는 TOKENIZER BACKEND: {conf['BACKEND']}")
+
+    from .tokenizer_pool import DEFAULT_TOKENIZER_POOL_SETTINGS, start_pool
+
+    service = TokenizerService()
+    pool_conf = {**DEFAULT_TOKENIZER_POOL_SETTINGS, **getattr(settings, "TOKENIZER_POOL", {})}
+    pool = start_pool(pool_conf)
+    if pool is not None:
+        service.use_pool(pool, local_fallback=pool_conf["LOCAL_FALLBACK"])
+        atexit.register(pool.close)
+    return service
+
+
+def _run_warm_up():
+    from django.conf import settings
+
+    conf = {**DEFAULT_TOKENIZER_SETTINGS, **getattr(settings, "TOKENIZER", {})}
+    started = time.perf_counter()
+    try:
+        get_tokenizer().warm_up(conf["WARM_UP_ROUNDS"], conf["WARM_UP_TIMEOUT"])
+    except Exception as e:
+        logger.exception("tokenizer 워밍업 실패")
+        _warm_up.update(state="failed", error=repr(e))
+        return
+    _warm_up.update(state="ready", seconds=round(time.perf_counter() - started, 3))
+
+
+def start_warm_up(background=True):
+    """분석기 워밍업을 한 번만 시작. background=False면 끝날 때까지 기다림"""
+    with _configure_lock:
+        if _warm_up["state"] in ("warming", "ready"):
+            return
+        _warm_up.update(state="warming", error=None)
+    if background:
+        threading.Thread(target=_run_warm_up, daemon=True, name="tokenizer-warm-up").start()
+    else:
+        _run_warm_up()
+
+
+def warm_up_status():
+    """readiness 응답용: 워밍업 상태 + 분석기가 실제로 준비됐는지"""
+    status = dict(_warm_up)
+    status["ready"] = status["state"] == "ready" and _tokenizer is not None and _tokenizer.is_ready
+    return status
@@ -0,0 +1,167 @@
+# tokenizer_pool.py
+# 형태소 분석을 별도 프로세스(각자 JVM 하나씩)에서 돌리는 워커 풀.
+# 웹 프로세스에서 JPype로 Okt를 부르면 요청 스레드가 GIL을 잡은 채로 JVM을 기다리고,
+# async 뷰라면 이벤트 루프까지 멈춘다. 풀을 켜면(TOKENIZER_POOL["WORKERS"] > 0)
+# TokenizerService가 분석 요청을 큐로 넘기고 결과만 받아온다.
+#
+# - 요청 큐는 크기가 정해져 있고, 동시에 기다리는 요청 수도 MAX_IN_FLIGHT로 제한 (backpressure)
+# - 자리가 안 나거나 결과가 TIMEOUT 안에 안 오면 TimeoutError (rejected / timeouts로 집계).
+#   이때 웹 프로세스 안에서 JVM을 띄워 직접 분석하는 건 LOCAL_FALLBACK=True일 때만
+# - 워커 프로세스는 spawn으로 띄우고 시작하자마자 Okt를 만들어 JVM을 데워둔다
+# - 웹 워커(gunicorn/daphne 프로세스)마다 풀이 하나씩 생기므로 WORKERS는 코어 수 / 웹 워커 수 정도로
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKENIZER_POOL_SETTINGS = {
+    "WORKERS": 0,          # 0이면 풀을 쓰지 않고 프로세스 안에서 분석
+    "QUEUE_SIZE": 256,     # 요청 큐 크기
+    "MAX_IN_FLIGHT": 64,   # 결과를 기다리는 요청 수 상한 (넘으면 submit이 기다림)
+    "TIMEOUT": 5.0,        # 결과 대기 시간(초)
+    "LOCAL_FALLBACK": False,  # 풀이 응답 못 하면 이 프로세스에서 Okt(JVM)로 분석할지 (False면 에러)
+}
+
+
+def _worker_main(request_queue, result_queue):
+    # 워커 프로세스: Django 없이 TokenizerService만 씀
+    from .tokenizer import TokenizerService
+
+    service = TokenizerService()
+    try:
+        service.pos("워밍업")  # JVM 부팅 + JIT 워밍업을 요청 받기 전에 끝냄
+    except Exception:
+        logger.exception("tokenizer worker 워밍업 실패")
+    result_queue.put(("ready", None, None))
+
+    while True:
+        job = request_queue.get()
+        if job is None:
+            break
+        job_id, texts = job
+        try:
+            result_queue.put((job_id, service.pos_batch(texts), None))
+        except Exception as e:
+            result_queue.put((job_id, None, repr(e)))
+
+
+class TokenizerPool:
+    def __init__(self, workers, queue_size, max_in_flight, timeout):
+        ctx = multiprocessing.get_context("spawn")
+        self.timeout = timeout
+        self._requests = ctx.Queue(maxsize=queue_size)
+        self._results = ctx.Queue()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._futures = {}
+        self._futures_lock = threading.Lock()
+        self._ids = itertools.count()
+        self.ready_workers = 0
+        self.rejected = 0   # 자리가 안 나서 못 넣은 요청 수
+        self.timeouts = 0   # 넣었지만 TIMEOUT 안에 결과가 안 온 요청 수
+        self._processes = [
+            ctx.Process(target=_worker_main, args=(self._requests, self._results), daemon=True, name=f"tokenizer-{i}")
+            for i in range(workers)
+        ]
+        for p in self._processes:
+            p.start()
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True, name="tokenizer-results")
+        self._dispatcher.start()
+
+    def _dispatch(self):
+        while True:
+            job_id, value, error = self._results.get()
+            if job_id == "ready":
+                self.ready_workers += 1
+                continue
+            if job_id is None:
+                break
+            with self._futures_lock:
+                future = self._futures.pop(job_id, None)
+            self._in_flight.release()
+            if future is None or future.done():
+                continue  # 이미 타임아웃 / 취소됨
+            if error is not None:
+                future.set_exception(RuntimeError(f"tokenizer worker 오류: {error}"))
+            else:
+                future.set_result(value)
+
+    def submit(self, texts):
+        """texts 분석을 워커에 넘기고 concurrent.futures.Future 반환 (꽉 차 있으면 자리 날 때까지 대기)"""
+        if not self._in_flight.acquire(timeout=self.timeout):
+            self.rejected += 1
+            raise TimeoutError("tokenizer pool이 가득 참")
+        future = Future()
+        job_id = next(self._ids)
+        with self._futures_lock:
+            self._futures[job_id] = future
+        try:
+            self._requests.put((job_id, list(texts)), timeout=self.timeout)
+        except Exception:
+            self.rejected += 1
+            with self._futures_lock:
+                self._futures.pop(job_id, None)
+            self._in_flight.release()
+            raise
+        return future
+
+    def pos_batch(self, texts):
+        future = self.submit(texts)
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            self.timeouts += 1
+            future.cancel()
+            raise
+
+    async def apos_batch(self, texts):
+        """이벤트 루프를 막지 않는 버전: 큐에 넣는 대기(backpressure)도 스레드에서"""
+        loop = asyncio.get_running_loop()
+        future = await loop.run_in_executor(None, self.submit, texts)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+
+    def wait_ready(self, timeout):
+        """모든 워커가 Okt 워밍업을 마칠 때까지(최대 timeout초) 기다림"""
+        deadline = time.monotonic() + timeout
+        while self.ready_workers < len(self._processes) and time.monotonic() < deadline:
+            time.sleep(0.1)
+        return self.ready_workers >= len(self._processes)
+
+    def stats(self):
+        with self._futures_lock:
+            in_flight = len(self._futures)
+        return {
+            "workers": len(self._processes),
+            "alive_workers": sum(p.is_alive() for p in self._processes),
+            "ready_workers": self.ready_workers,
+            "in_flight": in_flight,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
+
+    def close(self):
+        for _ in self._processes:
+            try:
+                self._requests.put(None, timeout=1)
+            except Exception:
+                break
+        for p in self._processes:
+            p.join(timeout=2)
+            if p.is_alive():
+                p.terminate()
+        self._results.put((None, None, None))
+
+
+def start_pool(conf):
+    conf = {**DEFAULT_TOKENIZER_POOL_SETTINGS, **conf}
+    if conf["WORKERS"] <= 0:
+        return None
+    return TokenizerPool(conf["WORKERS"], conf["QUEUE_SIZE"], conf["MAX_IN_FLIGHT"], conf["TIMEOUT"])
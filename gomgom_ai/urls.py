@@ -20,5 +20,9 @@ urlpatterns = [
     path('restaurant_list/', views.restaurant_list_view, name='restaurant_list'),
     path('async-test/', views.async_test_view),
     path('api/ip-location/', views.get_ip_location),
+    path('api/breakers/', views.breaker_status_view),
+    path('api/tokenizer/', views.tokenizer_stats_view),
+    path('api/ready/', views.readiness_view),
+    path('api/semantic-cache/', views.semantic_cache_stats_view),
 ]
 urlpatterns += static(settings.STATIC_URL, document_root=settings.STATICFILES_DIRS[0])
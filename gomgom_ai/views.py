@@ -1,37 +1,38 @@
 import asyncio
-import httpx
+import contextvars
 import json
 import os
 import random
 import re
-import requests
 from concurrent.futures import ThreadPoolExecutor
 from django.core.cache import cache
 from django.http import JsonResponse
 from django.shortcuts import render
 from django.views.decorators.cache import cache_page
 from django.views.decorators.csrf import csrf_exempt
-from konlpy.tag import Okt
-from openai import OpenAI
 from pathlib import Path
 from django.utils.safestring import mark_safe
 from django.views.decorators.http import require_GET
-from asgiref.sync import sync_to_async
 from django.conf import settings
 import jwt
-from .classify_user_input import classify_user_input
+from .circuit_breaker import breaker_states
+from .classify_user_input import classify_locally, classify_user_input_with_gpt
 from .create_yogiyo_prompt_with_options import create_yogiyo_prompt_with_options
+from .http_client import get_async_client, get_openai_client, get_sync_client
+from .keyword_cache import get_store_keywords
+from .keyword_matcher import SEP, compile_matcher, related_restaurants
+from .gpt_cache import cached_completion, normalize_user_text, select_candidates
+from .restaurant_cache import aget_restaurants, get_tile_listing
+from .intent_classifier import SOURCE_GPT, SOURCE_LOCAL, SOURCE_REUSED
+from .semantic_cache import lookup_similar, semantic_cache_stats, store_result
+from .restaurant_record import Restaurant
+from .tokenizer import get_tokenizer, start_warm_up, warm_up_status
 from .match_gpt_result_with_yogiyo import match_gpt_result_with_yogiyo
+from .name_normalizer import normalize_store_name
 from .models import Recommendation  # models.py에서 Recommendation 가져오기
 
-ip_info = requests.get("https://ipinfo.io").json()
-print(ip_info)
-
-okt = Okt()
-print(okt.nouns("짬뽕지존-봉천점"))
-
-cache.set('hello', 'world', timeout=10)
-print(cache.get('hello'))  # → 'world' 나오면 OK
+# 가게 리스트가 비어 있을 때 fallback 자리에 쓰는 빈 가게
+NO_RESTAURANT = Restaurant(id=None, name="추천 없음", review_avg="5점", address="주소 없음")
 
 # JWT 비밀 키는 justsaying(Spring) 서버에서 사용하는 거랑 똑같이 맞춰야 해!
 SECRET_KEY = ''
@@ -39,7 +40,7 @@ SECRET_KEY = ''
 
 def get_ip_location(request):
     try:
-        response = requests.get('https://ipinfo.io/json')
+        response = get_sync_client().get('https://ipinfo.io/json')
         data = response.json()
         return JsonResponse({
             'ip': data.get('ip'),
@@ -76,50 +77,35 @@ def login_page(request):
 
 # name문자열을 형태소 분석해서 (단어,품사)로 나눔, pos == 'Noun' 명사인 단어만 고름
 # len(w) > 1 너무 짧은 단어 (예 : '의','가')는 빼고 두글자 이상만
-def extract_keywords_from_store_name(name):
+def _tokenize_store_name(name):
     # '짬뽕지존-봉천점' → ['짬뽕', '지존', '봉천']
-    keywords = [w for w, pos in okt.pos(name) if pos == 'Noun' and len(w) > 1]
-    return keywords
+    return get_tokenizer().store_keywords(name)
 
 
-def is_related(text, result):
-    if not text:
-        return True  # ← 이렇게 추가해줘!
-    text = text.lower()
-    return (
-            text in result.get("store", "").lower() or
-            text in result.get("category", "").lower() or
-            any(text in kw.lower() for kw in result.get("keywords", []))
-    )
+def extract_keywords_from_store_name(name):
+    # 가게 이름은 거의 안 바뀌므로 LRU / Redis 해시에 기억해둔 결과를 씀
+    return get_store_keywords(name, _tokenize_store_name, get_tokenizer().name)
 
 
-# 요기요 API 데이터 요청
+def store_keyword_lines(restaurants):
+    # GPT 프롬프트용 "가게명: 키워드1, 키워드2" 줄
+    # 키워드는 가게 리스트가 캐시에 들어갈 때 이미 채워져 있으므로 여기서는 분석하지 않음
+    return [r.keyword_line() for r in restaurants]
 
-def get_yogiyo_restaurants(lat, lng):
-    url = f"https://www.yogiyo.co.kr/api/v1/restaurants"
-    params = {
-        "lat": lat,
-        "lng": lng,
-        "page": 0,
-        "serving_type": "delivery",
-    }
 
-    headers = {
-        "User-Agent": "Mozilla/5.0",  # 중요! 요기요는 UA 없으면 차단됨
-        "Accept": "application/json",
-    }
+def is_related(text, result):
+    if not text:
+        return True  # ← 이렇게 추가해줘!
+    # 가게 이름 / 카테고리 / 키워드를 이어 붙여 한 번만 훑음
+    haystack = SEP.join((result.get("store", ""), result.get("category", ""), *result.get("keywords", [])))
+    return compile_matcher((text,)).matches(haystack.lower())
 
-    try:
-        response = requests.get(url, params=params, headers=headers)
-        data = response.json()
-        # print("요기요 응답 상태코드:", response.status_code)
-        #print("요기요 응답 내용:", response.text[:500])
-        # 너무 길면 앞부분만 출력
-        # print("요기요 API data:", data)
-        return data
-    except Exception as e:
-        # print("요기요 API 오류:", e)
-        return []
+
+def pick_fallback(text, restaurants):
+    # GPT 실패 시 대신 보여줄 가게: 입력 단어가 이름 / 키워드 / 카테고리에 들어간 가게가 있으면 그중에서
+    words = [w for w in (text or "").split() if len(w) > 1]
+    related = related_restaurants(compile_matcher(words), restaurants) if words else []
+    return random.choice(related or restaurants)
 
 
 # 음식 리스트 로드
@@ -210,6 +196,31 @@ async def async_test_view(request):
     return JsonResponse({'message': 'Async works!'})
 
 
+def breaker_status_view(request):
+    # 모니터링용: 이 워커의 서킷 브레이커 상태 (요기요 등)
+    return JsonResponse(breaker_states())
+
+
+def tokenizer_stats_view(request):
+    # 모니터링용: 이 워커의 형태소 분석기 사용량
+    return JsonResponse(get_tokenizer().stats())
+
+
+def semantic_cache_stats_view(request):
+    # 모니터링용: 이 워커의 유사 입력 캐시 적중률 / 임계값 / 색인 크기
+    return JsonResponse(semantic_cache_stats())
+
+
+def readiness_view(request):
+    # 로드밸런서 / k8s readiness probe: 형태소 분석기 워밍업이 끝나야 200
+    # 워밍업이 아직 시작 안 됐으면(runserver 등) 여기서 백그라운드로 시작
+    status = warm_up_status()
+    if status["state"] == "cold":
+        start_warm_up()
+        status = warm_up_status()
+    return JsonResponse(status, status=200 if status["ready"] else 503)
+
+
 def cache_test_view(request):
     cache.set('hello', 'world', timeout=60)
     value = cache.get('hello')
@@ -217,20 +228,18 @@ def cache_test_view(request):
 
 
 def is_similar_store_name(store1, store2):
-    def clean(s):
-        return re.sub(r"[^가-힣a-zA-Z0-9]", "", s).replace(" ", "").lower()
-
-    return clean(store1) in clean(store2) or clean(store2) in clean(store1)
+    a, b = normalize_store_name(store1), normalize_store_name(store2)
+    return a in b or b in a
 
 
 def is_related_by_keywords(gpt_keywords, store_name):
     store_keywords = extract_keywords_from_store_name(store_name)
-    return any(k in store_keywords for k in gpt_keywords)
+    return compile_matcher(gpt_keywords).matches(SEP.join(store_keywords).lower(), whole_words=True)
 
 
 def keyword_overlap(gpt_keywords, store_name):
     keywords_in_name = extract_keywords_from_store_name(store_name)
-    return any(k in keywords_in_name for k in gpt_keywords)
+    return compile_matcher(gpt_keywords).matches(SEP.join(keywords_in_name).lower(), whole_words=True)
 
 
 def get_address_from_coords(lat, lng):
@@ -244,7 +253,7 @@ def get_address_from_coords(lat, lng):
     }
     # print(f"주소 변환 요청 보내는 중... x={lng}, y={lat}")
 
-    response = requests.get(url, headers=headers, params=params)
+    response = get_sync_client().get(url, headers=headers, params=params)
     # print("카카오 API 응답코드:", response.status_code)
     # print("카카오 API 응답내용:", response.text)
     if response.status_code == 200:
@@ -258,59 +267,19 @@ def get_address_from_coords(lat, lng):
             return "주소 정보를 가져올 수 없습니다."
 
 async def get_data():
-    async with httpx.AsyncClient() as client:
-        response = await client.get("https://www.yogiyo.co.kr/api/v1/restaurants")
-        return response.json()
+    response = await get_async_client().get("https://www.yogiyo.co.kr/api/v1/restaurants")
+    return response.json()
 
 
-client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
-
-
-async def fetch_yogiyo_data(lat, lng):
-    url = "http://www.yogiyo.co.kr/api/v1/restaurants"
-    headers = {"User-Agent": "Mozilla/5.0", "Accept": "application/json"}
-    params = {
-        "lat": lat,
-        "lng": lng,
-        "page": 0,
-        "serving_type": "delivery",
-    }
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        try:
-            response = await client.get(url, params=params, headers=headers)
-            # print("🛰 상태코드:", response.status_code)
-            # print("📦 응답 내용 일부:", response.text[:300])  # 응답 내용 앞부분만 확인
-            data = response.json()  # 문제 생길 수 있음
-            return data
-        except Exception as e:
-            # print("❗요기요 API 오류:", e)
-            return {"restaurants": []}
-
 @require_GET
 @csrf_exempt
 async def restaurant_list_view(request):
     lat = request.GET.get("lat")
     lng = request.GET.get("lng")
 
-    cache_key = f"restaurants:{lat}:{lng}"
-    cached_data = cache.get(cache_key)
     # 주소 받아오기!
     # address = get_address_from_coords(lat, lng) if lat and lng else None
 
-    if cached_data:
-        # print("✅ Redis 캐시에서 가져옴")
-        return render(request, "gomgom_ai/restaurant_list.html", {
-            "restaurants": cached_data,
-            "lat": lat,
-            "lng": lng
-        })
-
-    # print("🌀 캐시에 없어서 새로 요청 중...")
-    data = await fetch_yogiyo_data(lat, lng)
-    restaurants = data.get("restaurants", []) if isinstance(data, dict) else data
-
-    cache.set(cache_key, restaurants, timeout=60 * 5)  # 5분 캐시
-
     if not lat or not lng:
         return render(request, "gomgom_ai/restaurant_list.html", {
             "restaurants": [],
@@ -318,6 +287,9 @@ async def restaurant_list_view(request):
             "lng": None,
         })
 
+    # 같은 geohash 타일의 사용자들과 캐시를 공유 (캐시에 없을 때만 요기요 요청)
+    restaurants = await aget_restaurants(lat, lng)
+
     return render(request, "gomgom_ai/restaurant_list.html", {
         "restaurants": restaurants,
         "lat": lat,
@@ -350,7 +322,7 @@ def ask_gpt_to_choose(score,food_list, food_data_dict=None):
     """
 
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[{"role": "user", "content": prompt}]
         )
@@ -403,34 +375,34 @@ def test_result_view(request):
 
     # === 병렬 실행용 함수들 정의 ===
     def fetch_yogiyo():
-        return get_yogiyo_restaurants(lat, lng)
+        return get_tile_listing(lat, lng)
 
     def ask_gpt(prompt):
-        return client.chat.completions.create(
+        return get_openai_client().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[{"role": "user", "content": prompt}]
-        )
+        ).choices[0].message.content
 
     with ThreadPoolExecutor() as executor:
-        future_yogiyo = executor.submit(fetch_yogiyo)
-        restaurants_data = future_yogiyo.result()
-
-        raw_restaurants = restaurants_data.get("restaurants", []) if isinstance(restaurants_data, dict) else restaurants_data
-
-        store_keywords_list = [
-            f"{r.get('name')}: {', '.join(extract_keywords_from_store_name(r.get('name', '')))}"
-            for r in raw_restaurants
-        ]
-        random.shuffle(store_keywords_list)
-        store_keywords_list = store_keywords_list[:10]  # GPT 입력은 짧게
-
-        prompt = create_yogiyo_prompt_with_options(text, store_keywords_list, score=score)
-
-        future_gpt = executor.submit(ask_gpt, prompt)
+        # copy_context: 요청 deadline(contextvar)을 작업 스레드로 넘김
+        future_yogiyo = executor.submit(contextvars.copy_context().run, fetch_yogiyo)
+        listing = future_yogiyo.result()
+        raw_restaurants = listing.restaurants
+
+        # 같은 타일에서 비슷한 입력(같은 기분 태그)의 추천이 있으면 GPT 없이 재사용 (semantic_cache)
+        semantic_namespace = "test_result:" + ",".join(f"{t}{n}" for t, n in sorted(score.items()))
+        reused = lookup_similar(semantic_namespace, text, listing)
+        if reused is None:
+            # 같은 입력 + 같은 가게 리스트면 같은 후보 / 같은 프롬프트 → GPT 응답 캐시 (gpt_cache)
+            candidates = select_candidates(listing, text, score=score)
+            prompt = create_yogiyo_prompt_with_options(normalize_user_text(text), store_keyword_lines(candidates), score=score)
+            future_gpt = executor.submit(cached_completion, prompt, listing, lambda: ask_gpt(prompt))
 
         try:
-            gpt_response = future_gpt.result()
-            result = json.loads(gpt_response.choices[0].message.content)
+            gpt_content = reused["content"] if reused else future_gpt.result()
+            result = json.loads(gpt_content)
+            if reused is None:
+                store_result(semantic_namespace, text, listing, {"content": gpt_content})
 
             if "keywords" not in result:
                 result["keywords"] = extract_keywords_from_store_name(result.get("store", ""))
@@ -440,10 +412,10 @@ def test_result_view(request):
             best_match = match_gpt_result_with_yogiyo(result, raw_restaurants)
 
             matched_restaurants = [{
-                "name": best_match.get("name"),
-                "review_avg": best_match.get("review_avg", "5점"),
-                "address": "카테고리: " + ", ".join(best_match.get("categories", [])),
-                "logo": best_match.get("logo_url", ""),
+                "name": best_match.name,
+                "review_avg": best_match.review_avg,
+                "address": "카테고리: " + ", ".join(best_match.categories),
+                "logo": best_match.logo_url,
             }] if best_match else []
 
             # 추천 성공 기록 저장
@@ -458,25 +430,25 @@ def test_result_view(request):
                 longitude=float(lng) if lng else None,
                 user_ip=request.META.get('REMOTE_ADDR'),
                 is_success=True,
-                gpt_raw_response=gpt_response.choices[0].message.content if gpt_response else None,
-                matched_restaurant_id=best_match.get('id') if best_match else None
+                gpt_raw_response=gpt_content,
+                matched_restaurant_id=best_match.id if best_match else None
             )
 
         except Exception as e:
-            fallback = random.choice(raw_restaurants) if raw_restaurants else {}
+            fallback = pick_fallback(text, raw_restaurants) if raw_restaurants else NO_RESTAURANT
             result = {
-                "store": fallback.get('name', "추천 없음"),
+                "store": fallback.name,
                 "description": f"'{text or '무작위'}'와 어울리는 인기 메뉴를 추천해요!",
-                "category": ", ".join(fallback.get('categories', [])),
-                "keywords": extract_keywords_from_store_name(fallback.get('name', ""))
+                "category": ", ".join(fallback.categories),
+                "keywords": list(fallback.keywords)
             }
             matched_restaurants = [{
-                "name": fallback.get('name', "추천 없음"),
-                "review_avg": fallback.get('review_avg', "5점"),
-                "address": fallback.get('address', "주소 없음"),
-                "id": fallback.get('id', "없음"),
-                "categories": ", ".join(fallback.get('categories', [])),
-                "logo": fallback.get('logo_url', "")
+                "name": fallback.name,
+                "review_avg": fallback.review_avg,
+                "address": fallback.address,
+                "id": fallback.id,
+                "categories": ", ".join(fallback.categories),
+                "logo": fallback.logo_url
             }]
 
             # 추천 실패 기록 저장
@@ -492,7 +464,7 @@ def test_result_view(request):
                 user_ip=request.META.get('REMOTE_ADDR'),
                 is_success=False,
                 gpt_raw_response=None,
-                matched_restaurant_id=fallback.get('id') if fallback else None
+                matched_restaurant_id=fallback.id
             )
 
     return render(request, 'gomgom_ai/test_result.html', {
@@ -512,41 +484,60 @@ def recommend_result(request):
     text = request.GET.get("text")
     lat = request.GET.get("lat", "37.484934")
     lng = request.GET.get("lng", "126.981321")
-    user_input_category = classify_user_input(text)
 
     if not lat or not lng:
         lat = "37.484934"
         lng = "126.981321"
 
     def fetch_yogiyo():
-        return get_yogiyo_restaurants(lat, lng)
+        return get_tile_listing(lat, lng)
 
     def ask_gpt(prompt):
-        return client.chat.completions.create(
+        return get_openai_client().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[{"role": "user", "content": prompt}]
-        )
-
-    with ThreadPoolExecutor() as executor:
-        future_yogiyo = executor.submit(fetch_yogiyo)
-        restaurants_data = future_yogiyo.result()
-
-        raw_restaurants = restaurants_data.get("restaurants", []) if isinstance(restaurants_data, dict) else restaurants_data
-
-        store_keywords_list = [
-            f"{r.get('name')}: {', '.join(extract_keywords_from_store_name(r.get('name', '')))}"
-            for r in raw_restaurants
-        ]
-        random.shuffle(store_keywords_list)
-        store_keywords_list = store_keywords_list[:10]
-
-        prompt = create_yogiyo_prompt_with_options(text, store_keywords_list, score=None, input_type=user_input_category)
+        ).choices[0].message.content
 
-        future_gpt = executor.submit(ask_gpt, prompt)
+    # with 블록을 쓰지 않음: 나가면서 안 쓰게 된 작업(semantic_cache 히트 때의 GPT 분류)까지 기다리게 되므로
+    executor = ThreadPoolExecutor()
+    try:
+        def submit(fn, *args):
+            # copy_context: 요청 deadline(contextvar)을 작업 스레드로 넘김 (작업마다 따로 복사해야 동시에 실행 가능)
+            return executor.submit(contextvars.copy_context().run, fn, *args)
+
+        # 의존 관계대로 실행:
+        #   로컬 입력 분류 → 몇십 µs라 여기서 바로
+        #   가게 리스트(키워드 채우기 포함), (로컬 분류가 애매할 때만) GPT 분류 → 서로 상관없으니 같이 시작
+        #   semantic_cache 조회 → 가게 리스트만 기다림 (히트면 GPT 분류는 기다리지 않고 버림)
+        #   후보 선택 / 프롬프트 → 분류 + 가게 리스트 둘 다 기다림 → GPT
+        user_input_category, needs_gpt = classify_locally(text)
+        category_source = SOURCE_LOCAL
+        future_yogiyo = submit(fetch_yogiyo)
+        future_category = submit(classify_user_input_with_gpt, text) if needs_gpt else None
+        listing = future_yogiyo.result()
+        raw_restaurants = listing.restaurants
+
+        # 같은 타일에서 비슷한 입력의 추천이 있으면 GPT 추천을 건너뜀 (semantic_cache)
+        reused = lookup_similar("recommend_result", text, listing)
+        if reused is None:
+            if future_category is not None:
+                try:
+                    user_input_category, category_source = future_category.result(), SOURCE_GPT
+                except Exception:
+                    pass  # GPT 분류가 실패하면 로컬 분류 결과로 진행
+            candidates = select_candidates(listing, text, input_type=user_input_category)
+            prompt = create_yogiyo_prompt_with_options(
+                normalize_user_text(text), store_keyword_lines(candidates), score=None, input_type=user_input_category
+            )
+            future_gpt = submit(cached_completion, prompt, listing, lambda: ask_gpt(prompt))
+        else:
+            user_input_category, category_source = reused["input_type"], SOURCE_REUSED
 
         try:
-            gpt_response = future_gpt.result()
-            result = json.loads(gpt_response.choices[0].message.content)
+            gpt_content = reused["content"] if reused else future_gpt.result()
+            result = json.loads(gpt_content)
+            if reused is None:
+                store_result("recommend_result", text, listing, {"input_type": user_input_category, "content": gpt_content})
 
             if "keywords" not in result:
                 result["keywords"] = extract_keywords_from_store_name(result.get("store", ""))
@@ -554,24 +545,24 @@ def recommend_result(request):
             is_valid_result = is_related(text, result)
 
             best_match = match_gpt_result_with_yogiyo(result, raw_restaurants)
-            result["logo_url"] = best_match.get("logo_url", "")
+            result["logo_url"] = best_match.logo_url
 
             matched_restaurants = []
             if best_match:
                 matched_restaurants = [{
-                    "name": best_match.get("name"),
-                    "review_avg": best_match.get("review_avg", "5점"),
-                    "address": best_match.get("address", "주소 정보 없음"),
-                    "id": best_match.get("id", "ID 없음"),
-                    "categories": ", ".join(best_match.get("categories", [])),
-                    "logo": best_match.get("logo_url", ""),
-                    "logo_url": best_match.get("logo_url", "")
+                    "name": best_match.name,
+                    "review_avg": best_match.review_avg,
+                    "address": best_match.address or "주소 정보 없음",
+                    "id": best_match.id,
+                    "categories": ", ".join(best_match.categories),
+                    "logo": best_match.logo_url,
+                    "logo_url": best_match.logo_url
                 }]
 
             # 추천 성공 저장
             Recommendation.objects.create(
                 input_text=text,
-                selected_types={"input_category": user_input_category},
+                selected_types={"input_category": user_input_category, "input_category_source": category_source},
                 recommended_store=result.get('store', ''),
                 description=result.get('description', ''),
                 category=result.get('category', ''),
@@ -580,31 +571,31 @@ def recommend_result(request):
                 longitude=float(lng) if lng else None,
                 user_ip=request.META.get('REMOTE_ADDR'),
                 is_success=True,
-                gpt_raw_response=gpt_response.choices[0].message.content if gpt_response else None,
-                matched_restaurant_id=best_match.get('id') if best_match else None
+                gpt_raw_response=gpt_content,
+                matched_restaurant_id=best_match.id if best_match else None
             )
 
         except Exception as e:
-            fallback = random.choice(raw_restaurants) if raw_restaurants else {}
+            fallback = pick_fallback(text, raw_restaurants) if raw_restaurants else NO_RESTAURANT
             result = {
-                "store": fallback.get('name', "추천 없음"),
+                "store": fallback.name,
                 "description": f"'{text or '무작위'}'와 어울리는 인기 메뉴를 추천해요!",
-                "category": ", ".join(fallback.get('categories', [])),
-                "keywords": extract_keywords_from_store_name(fallback.get('name', ""))
+                "category": ", ".join(fallback.categories),
+                "keywords": list(fallback.keywords)
             }
             matched_restaurants = [{
-                "name": fallback.get('name', "추천 없음"),
-                "review_avg": fallback.get('review_avg', "5점"),
-                "address": fallback.get('address', "주소 없음"),
-                "id": fallback.get('id', "없음"),
-                "categories": ", ".join(fallback.get('categories', [])),
-                "logo": fallback.get('logo_url', "")
+                "name": fallback.name,
+                "review_avg": fallback.review_avg,
+                "address": fallback.address,
+                "id": fallback.id,
+                "categories": ", ".join(fallback.categories),
+                "logo": fallback.logo_url
             }]
 
             # 추천 실패 저장
             Recommendation.objects.create(
                 input_text=text,
-                selected_types={"input_category": user_input_category},
+                selected_types={"input_category": user_input_category, "input_category_source": category_source},
                 recommended_store=result.get('store', ''),
                 description=result.get('description', ''),
                 category=result.get('category', ''),
@@ -614,8 +605,11 @@ def recommend_result(request):
                 user_ip=request.META.get('REMOTE_ADDR'),
                 is_success=False,
                 gpt_raw_response=None,
-                matched_restaurant_id=fallback.get('id') if fallback else None
+                matched_restaurant_id=fallback.id
             )
+    finally:
+        # 아직 안 끝난 작업은 기다리지 않음 (시작 전이면 취소, 실행 중이면 끝난 뒤 스레드가 정리됨)
+        executor.shutdown(wait=False, cancel_futures=True)
 
     return render(request, 'gomgom_ai/recommend_result.html', {
         "result": result,
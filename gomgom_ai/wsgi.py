@@ -12,5 +12,6 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'gomgom_ai.settings')
+os.environ.setdefault('TOKENIZER_WARM_UP', '1')  # 웹 워커는 시작하면서 형태소 분석기를 데움 (apps.TasteConfig.ready)
 
 application = get_wsgi_application()
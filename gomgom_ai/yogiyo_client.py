@@ -0,0 +1,220 @@
+# yogiyo_client.py
+# 요기요 비공식 API 호출 (동기 / 비동기)
+# 호출마다 요청의 남은 시간(deadline)으로 타임아웃을 잡고,
+# 연속 실패하면 서킷 브레이커가 열려서 한동안 요기요를 부르지 않는다.
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import httpx
+from django.conf import settings
+
+from . import deadline
+from .circuit_breaker import get_breaker
+from .http_client import get_async_client, get_sync_client
+from .restaurant_record import Restaurant
+
+YOGIYO_RESTAURANTS_URL = "https://www.yogiyo.co.kr/api/v1/restaurants"
+YOGIYO_HEADERS = {
+    "User-Agent": "Mozilla/5.0",  # 중요! 요기요는 UA 없으면 차단됨
+    "Accept": "application/json",
+}
+
+DEFAULT_YOGIYO_FETCH_SETTINGS = {
+    "PAGES": 3,              # 타일당 기본 페이지 수 (page 0 ~ PAGES-1)
+    "ITEMS_PER_PAGE": 60,    # 이보다 적게 오면 마지막 페이지로 보고 중단
+    "MAX_CONCURRENCY": 4,    # 동시에 보내는 페이지 요청 수 상한
+    "TILE_PAGES": {},        # geohash 접두어별 페이지 수 (예: {"wydm": 5})
+    "TIMEOUT": 4.0,          # 페이지 요청 하나의 최대 타임아웃(초), 남은 deadline이 더 짧으면 그걸 씀
+}
+
+YOGIYO_BREAKER = "yogiyo"
+MIN_CALL_TIMEOUT = 0.05  # 남은 시간이 이보다 짧으면 호출하지 않음
+
+
+
+class YogiyoPages(NamedTuple):
+    """여러 페이지를 합친 가게 리스트. 실패하거나 시간이 없어서 못 가져온 페이지가 있으면 complete=False"""
+    restaurants: list
+    complete: bool
+
+
+_page_executors = {}  # 동시 요청 상한 → 페이지 요청용 스레드 풀 (설정이 바뀌면 그 크기의 풀을 새로 씀)
+_page_executors_lock = threading.Lock()
+
+
+def get_yogiyo_fetch_settings():
+    return {**DEFAULT_YOGIYO_FETCH_SETTINGS, **getattr(settings, "YOGIYO_FETCH", {})}
+
+
+def pages_for_tile(tile):
+    """타일에 맞는 페이지 수. TILE_PAGES에서 가장 긴 접두어가 우선"""
+    conf = get_yogiyo_fetch_settings()
+    pages = conf["PAGES"]
+    matched = ""
+    for prefix, count in conf["TILE_PAGES"].items():
+        if tile and tile.startswith(prefix) and len(prefix) > len(matched):
+            matched, pages = prefix, count
+    return max(1, pages)
+
+
+def restaurants_from_response(data):
+    # 요기요 응답은 {"restaurants": [...]} 형태지만 실패 시 리스트가 올 때도 있음
+    return data.get("restaurants", []) if isinstance(data, dict) else (data or [])
+
+
+def merge_restaurant_pages(pages):
+    """요기요 응답 페이지들을 Restaurant 레코드 리스트로 합침 (원본 dict는 여기서 버림)"""
+    # 페이지 경계에서 같은 가게가 중복으로 올 수 있어서 id 기준으로 합침 (순서 유지)
+    merged = []
+    seen = set()
+    for restaurants in pages:
+        for r in restaurants:
+            rid = r.get("id")
+            if rid is not None:
+                if rid in seen:
+                    continue
+                seen.add(rid)
+            merged.append(Restaurant.from_yogiyo(r))
+    return merged
+
+
+def _page_params(lat, lng, page):
+    return {
+        "lat": lat,
+        "lng": lng,
+        "page": page,
+        "items": get_yogiyo_fetch_settings()["ITEMS_PER_PAGE"],
+        "serving_type": "delivery",
+    }
+
+
+def yogiyo_breaker():
+    return get_breaker(YOGIYO_BREAKER)
+
+
+def _call_timeout():
+    return deadline.timeout_for(get_yogiyo_fetch_settings()["TIMEOUT"])
+
+
+def _is_failure(response):
+    # 5xx, 차단(403), 요청 제한(429)은 업스트림 장애로 봄
+    return response.status_code >= 500 or response.status_code in (403, 429)
+
+
+def _page_waves(pages, concurrency):
+    # [0..pages)를 동시 요청 상한 크기의 묶음으로 나눔
+    for start in range(0, pages, concurrency):
+        yield list(range(start, min(start + concurrency, pages)))
+
+
+# 요기요 API 데이터 요청
+
+def get_yogiyo_restaurants(lat, lng, page=0, timeout=None):
+    data = _get_page(lat, lng, page, timeout)
+    return [] if data is None else data
+
+
+def _get_page(lat, lng, page=0, timeout=None):
+    # 실패하면 None (빈 페이지 []와 구분해서 리스트가 잘렸는지 알 수 있게)
+    timeout = _call_timeout() if timeout is None else timeout
+    breaker = yogiyo_breaker()
+    if timeout < MIN_CALL_TIMEOUT or not breaker.allow_request():
+        return None  # 시간이 없거나 브레이커가 열려 있음 - 바로 포기
+
+    try:
+        response = get_sync_client().get(
+            YOGIYO_RESTAURANTS_URL, params=_page_params(lat, lng, page), headers=YOGIYO_HEADERS, timeout=timeout
+        )
+        if _is_failure(response):
+            raise httpx.HTTPStatusError("요기요 응답 오류", request=response.request, response=response)
+        data = response.json()
+        # print("요기요 응답 상태코드:", response.status_code)
+        # print("요기요 응답 내용:", response.text[:500])
+    except Exception as e:
+        # print("요기요 API 오류:", e)
+        breaker.record_failure()
+        return None
+    breaker.record_success()
+    return data
+
+
+async def fetch_yogiyo_data(lat, lng, page=0):
+    data = await _fetch_page(lat, lng, page)
+    return {"restaurants": []} if data is None else data
+
+
+async def _fetch_page(lat, lng, page=0):
+    timeout = _call_timeout()
+    breaker = yogiyo_breaker()
+    if timeout < MIN_CALL_TIMEOUT or not breaker.allow_request():
+        return None
+
+    try:
+        response = await get_async_client().get(
+            YOGIYO_RESTAURANTS_URL, params=_page_params(lat, lng, page), headers=YOGIYO_HEADERS, timeout=timeout
+        )
+        # print("🛰 상태코드:", response.status_code)
+        # print("📦 응답 내용 일부:", response.text[:300])  # 응답 내용 앞부분만 확인
+        if _is_failure(response):
+            raise httpx.HTTPStatusError("요기요 응답 오류", request=response.request, response=response)
+        data = response.json()  # 문제 생길 수 있음
+    except Exception as e:
+        # print("❗요기요 API 오류:", e)
+        breaker.record_failure()
+        return None
+    breaker.record_success()
+    return data
+
+
+def _get_page_executor(concurrency):
+    executor = _page_executors.get(concurrency)
+    if executor is None:
+        with _page_executors_lock:
+            executor = _page_executors.get(concurrency)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"yogiyo-page-{concurrency}")
+                _page_executors[concurrency] = executor
+    return executor
+
+
+def _collect_wave(wave_data, results, conf):
+    """한 묶음의 페이지 응답을 results에 더함. (계속 받을지, 빠진 페이지 없이 다 받았는지)"""
+    failed = any(data is None for data in wave_data)
+    wave_results = [restaurants_from_response(data) for data in wave_data if data is not None]
+    results.extend(wave_results)
+    if failed:
+        return False, False  # 실패한 페이지 뒤는 받아도 리스트가 비니까 그만
+    # 덜 찬 페이지가 나오면 그 뒤 페이지는 없음
+    return all(len(r) >= conf["ITEMS_PER_PAGE"] for r in wave_results), True
+
+
+def get_yogiyo_restaurant_pages(lat, lng, pages=1):
+    """page 0..pages-1을 동시 요청 상한 내에서 병렬로 가져와 id 기준으로 합친 YogiyoPages"""
+    conf = get_yogiyo_fetch_settings()
+    executor = _get_page_executor(conf["MAX_CONCURRENCY"])
+    results = []
+    complete = True
+    for wave in _page_waves(pages, conf["MAX_CONCURRENCY"]):
+        # copy_context: deadline(contextvar)을 넘겨서 타임아웃은 페이지 스레드가 실제로 시작할 때 계산
+        # (공유 풀에서 줄 서 있던 시간도 요청의 남은 시간에서 빠짐)
+        futures = [executor.submit(contextvars.copy_context().run, _get_page, lat, lng, page) for page in wave]
+        more, complete = _collect_wave([f.result() for f in futures], results, conf)
+        if not more:
+            break
+    return YogiyoPages(merge_restaurant_pages(results), complete)
+
+
+async def fetch_yogiyo_restaurant_pages(lat, lng, pages=1):
+    """get_yogiyo_restaurant_pages의 비동기 버전"""
+    conf = get_yogiyo_fetch_settings()
+    results = []
+    complete = True
+    for wave in _page_waves(pages, conf["MAX_CONCURRENCY"]):
+        wave_data = await asyncio.gather(*(_fetch_page(lat, lng, page) for page in wave))
+        more, complete = _collect_wave(wave_data, results, conf)
+        if not more:
+            break
+    return YogiyoPages(merge_restaurant_pages(results), complete)